@@ -1,421 +1,537 @@
-from flask import Flask, render_template, request, redirect, url_for, session
-from werkzeug.security import generate_password_hash, check_password_hash
+import os
+import time
+
+_import_started = time.perf_counter()
+
+from flask import Flask, Blueprint, current_app, render_template, stream_template, request, redirect, url_for, session, send_file, abort, jsonify
+from flask import Response, stream_with_context
+from jinja2 import FileSystemBytecodeCache
 from functools import wraps
 
-from config import SQLALCHEMY_DATABASE_URI, SQLALCHEMY_TRACK_MODIFICATIONS, SECRET_KEY
 from models import db, MedicinalPlant, User, Favorite
 from disease_aliases import normalize_disease
+from extensions import init_extensions, startup_report, startup_log
+from extensions import season_catalog, related_plants, suggestions, facets, search_engine, chat_answers, speech_service
+from extensions import password_hasher
+from extensions import asset_manifest, fragment_cache, page_stamp
+from favorites import add_favorites, remove_favorites, favorited_ids
+from export import FORMATS, PLANT_FIELDS, SEASON_FIELDS, export_response, iter_plants, iter_search, lookup_plants
+from pagination import KeysetPage, page_size, parse_after
+from assets import serve_asset
+from http_cache import conditional_page
+from instrumentation import init_instrumentation, PASSWORD_HASH_REJECTED, PASSWORD_HASH_SECONDS, SEARCH_SECONDS
+from passwords import HasherBusy
+
+import json
+
+IMPORT_SECONDS = time.perf_counter() - _import_started
+
+bp = Blueprint("main", __name__)
+
+
+# ---------- APP FACTORY ----------
+def create_app(config=None):
+    # Defaults come from config.py, FLASK_* environment variables override
+    # them (FLASK_PAGE_SIZE=50, FLASK_SPEECH_ENGINE='"null"'), and `config`
+    # overrides both. Nothing heavy is built here; see extensions.py.
+    started = time.perf_counter()
+
+    app = Flask(__name__)
+    app.config.from_object("config")
+    app.config.from_prefixed_env()
+    if config:
+        app.config.from_mapping(config)
+
+    # compiled templates are shared on disk, so a fresh worker loads
+    # bytecode instead of parsing every template again
+    bytecode_dir = app.config["TEMPLATE_BYTECODE_CACHE_DIR"]
+    if bytecode_dir:
+        os.makedirs(bytecode_dir, exist_ok=True)
+        app.jinja_options = {**app.jinja_options, "bytecode_cache": FileSystemBytecodeCache(bytecode_dir)}
+
+    db.init_app(app)
+    init_extensions(app)
+    app.jinja_env.globals["asset_url"] = asset_url
+    app.jinja_env.globals["fragment"] = fragment
+    app.register_blueprint(bp)
+    init_instrumentation(app, lambda: speech_service.peek(app), lambda: password_hasher.peek(app))
+
+    timings = [("imports", IMPORT_SECONDS), ("create_app", time.perf_counter() - started)]
+
+    @app.cli.command("startup-report", help="Build every subsystem and print its import and init cost.")
+    def print_startup_report():
+        print(startup_report(app, timings, warm=True))
+
+    @app.cli.command("init-db", help="Create the tables and the search indexes.")
+    def init_db():
+        db.create_all()
+        search_engine.get(app).install(db.engine)
+
+    startup_log.info("app created\n%s", startup_report(app, timings))
+    return app
+
+
+# ---------- STATIC ASSETS & HTTP CACHING ----------
+def asset_url(path):
+    return asset_manifest.get().url(path)
+
+
+def fragment(template, key, version, **context):
+    # {{ fragment("fragments/plant_card.html", plant.id, card_version, plant=plant) }}
+    return fragment_cache.get().render(template, key, version, **context)
 
-import pandas as pd
-import os
 
-import pyttsx3
-import threading
-import queue
+def page_version():
+    template_version, template_modified = page_stamp.get()
+    return f"{template_version}:{asset_manifest.get().version}", template_modified
 
 
-app = Flask(__name__)
-app.secret_key = SECRET_KEY
+def catalog_version():
+    catalog = season_catalog.get().refresh()
+    version, modified = page_version()
+    return f"{version}:{catalog.version}", max(modified, catalog.modified)
 
-app.config["SQLALCHEMY_DATABASE_URI"] = SQLALCHEMY_DATABASE_URI
-app.config["SQLALCHEMY_TRACK_MODIFICATIONS"] = SQLALCHEMY_TRACK_MODIFICATIONS
 
-db.init_app(app)
+@bp.route("/assets/<path:filename>")
+def asset(filename):
+    return serve_asset(asset_manifest.get().dist_dir, filename)
+
 
 # ---------- LOGIN REQUIRED DECORATOR ----------
 def login_required(f):
     @wraps(f)
     def decorated_function(*args, **kwargs):
-        if "user" not in session:
-            return redirect(url_for("login"))
+        if "user_id" not in session:
+            return redirect(url_for(".login"))
         return f(*args, **kwargs)
     return decorated_function
 
 
+# ---------- RESULT PAGES ----------
+def render_results(template, **context):
+    # streamed pages flush rows to the client while the query is still read
+    if current_app.config["STREAM_RESULTS"]:
+        return stream_template(template, **context)
+    return render_template(template, **context)
+
+
+def requested_page_size():
+    return page_size(
+        request.args.get("limit"), current_app.config["PAGE_SIZE"], current_app.config["MAX_PAGE_SIZE"]
+    )
+
+
 # ---------- HOME ----------
-@app.route("/")
+@bp.route("/")
+@conditional_page(page_version)
 def home():
     return render_template("home.html")
 
 
 # ---------- SEARCH ----------
-@app.route("/search", methods=["GET", "POST"])
+@bp.route("/search", methods=["GET", "POST"])
 @login_required
 def search():
     results = []
-    disease = ""
+    next_after = None
+    disease = request.values.get("disease", "")
 
-    if request.method == "POST":
-        disease = request.form["disease"]
+    card_version = fragment_cache.get().plants_version()
+
+    if disease:
         normalized = normalize_disease(disease)
 
-        results = MedicinalPlant.query.filter(
-            MedicinalPlant.disease.ilike(f"%{normalized}%")
-        ).all()
+        engine = search_engine.get()
+        with SEARCH_SECONDS.time(backend=engine.name):
+            results, next_after = engine.search(
+                normalized, requested_page_size(), after=request.args.get("after")
+            )
+
+    saved = favorited_ids(session["user_id"], [plant.id for plant in results])
+
+    return render_results(
+        "index.html", results=results, disease=disease, saved=saved, next_after=next_after,
+        card_version=card_version,
+    )
+
 
-    return render_template("index.html", results=results, disease=disease)
+# ---------- TYPEAHEAD ----------
+@bp.route("/suggest")
+def suggest():
+    kind = request.args.get("kind")
+    if kind not in (None, "plant", "disease"):
+        return jsonify(error="kind must be plant or disease"), 400
+
+    query = request.args.get("q", "")
+    limit = request.args.get("limit", type=int)
+    found = suggestions.get().refresh().suggest(query, kind=kind, limit=limit)
+
+    response = jsonify(query=query, suggestions=found)
+    response.cache_control.public = True
+    response.cache_control.max_age = 60
+    return response
 
 
 # ---------- PLANT DETAIL ----------
-@app.route("/plant/<int:id>")
+@bp.route("/plant/<int:id>")
 @login_required
 def plant_detail(id):
+    card_version = fragment_cache.get().plants_version()
     plant = MedicinalPlant.query.get_or_404(id)
-    return render_template("plant_detail.html", plant=plant)
+    saved = favorited_ids(session["user_id"], [plant.id])
+    related = related_plants.get().refresh().related(plant.plant_name)
+    return render_template(
+        "plant_detail.html", plant=plant, saved=saved, related=related, card_version=card_version
+    )
 
 
 # ---------- REGISTER ----------
-@app.route("/register", methods=["GET", "POST"])
+@bp.errorhandler(HasherBusy)
+def hasher_busy(error):
+    PASSWORD_HASH_REJECTED.inc(operation=request.endpoint.rsplit(".", 1)[-1])
+    return "Too many sign-ins right now, please try again shortly.", 503, {"Retry-After": str(error.retry_after)}
+
+
+@bp.route("/register", methods=["GET", "POST"])
 def register():
     if request.method == "POST":
+        with PASSWORD_HASH_SECONDS.time(operation="generate"):
+            password = password_hasher.get().hash(request.form["password"])
+
         user = User(
             username=request.form["username"],
-            password=generate_password_hash(request.form["password"])
+            password=password
         )
         db.session.add(user)
         db.session.commit()
-        return redirect(url_for("login"))
+        return redirect(url_for(".login"))
 
     return render_template("register.html")
 
 
 # ---------- LOGIN ----------
-@app.route("/login", methods=["GET", "POST"])
+@bp.route("/login", methods=["GET", "POST"])
 def login():
     if request.method == "POST":
-        user = User.query.filter_by(username=request.form["username"]).first()
-
-        if user and check_password_hash(user.password, request.form["password"]):
+        user = db.session.execute(
+            db.select(User.id, User.username, User.password).filter_by(username=request.form["username"])
+        ).first()
+        # hand the connection back before the slow part, so logins queued on
+        # the hasher cannot drain the pool that /search and /chat need
+        db.session.close()
+        hasher = password_hasher.get()
+
+        with PASSWORD_HASH_SECONDS.time(operation="check"):
+            valid = user and hasher.check(user.password, request.form["password"])
+
+        if valid and hasher.needs_rehash(user.password):
+            # the hash settings changed since this password was stored
+            try:
+                with PASSWORD_HASH_SECONDS.time(operation="rehash"):
+                    password = hasher.hash(request.form["password"])
+                db.session.execute(db.update(User).where(User.id == user.id).values(password=password))
+                db.session.commit()
+            except HasherBusy:
+                pass  # keep the old hash; the next login tries again
+
+        if valid:
             session["user"] = user.username
-            return redirect(url_for("search"))
+            session["user_id"] = user.id
+            return redirect(url_for(".search"))
 
     return render_template("login.html")
 
 
 # ---------- LOGOUT ----------
-@app.route("/logout")
+@bp.route("/logout")
 def logout():
     session.pop("user", None)
-    return redirect(url_for("login"))
+    session.pop("user_id", None)
+    return redirect(url_for(".login"))
 
 
 # ---------- FAVORITES ----------
-@app.route("/favorite/<int:plant_id>")
+@bp.route("/favorite/<int:plant_id>")
 @login_required
 def favorite(plant_id):
-    user = User.query.filter_by(username=session["user"]).first()
-
-    existing = Favorite.query.filter_by(
-        user_id=user.id, plant_id=plant_id
-    ).first()
-
-    if not existing:
-        fav = Favorite(user_id=user.id, plant_id=plant_id)
-        db.session.add(fav)
-        db.session.commit()
-
-    return redirect(url_for("search"))
+    add_favorites(session["user_id"], [plant_id])
+    return redirect(url_for(".search"))
 
 
-@app.route("/favorites")
+@bp.route("/favorites/batch", methods=["POST"])
+@login_required
+def favorites_batch():
+    payload = request.get_json(silent=True) or {}
+    if not isinstance(payload, dict) or not all(
+        isinstance(payload.get(key, []), list) for key in ("add", "remove")
+    ):
+        return jsonify(error="add and remove must be lists of plant ids"), 400
+    try:
+        added = add_favorites(session["user_id"], payload.get("add", []))
+        removed = remove_favorites(session["user_id"], payload.get("remove", []))
+    except (TypeError, ValueError):
+        return jsonify(error="add and remove must be lists of plant ids"), 400
+
+    return jsonify(added=added, removed=removed)
+
+
+@bp.route("/favorites")
 @login_required
 def favorites():
-    user = User.query.filter_by(username=session["user"]).first()
-
-    plants = db.session.query(MedicinalPlant).join(
+    card_version = fragment_cache.get().plants_version()
+    stmt = db.select(MedicinalPlant).join(
         Favorite, MedicinalPlant.id == Favorite.plant_id
-    ).filter(Favorite.user_id == user.id).all()
+    ).where(Favorite.user_id == session["user_id"])
 
-    return render_template("favorites.html", plants=plants)
+    plants = KeysetPage(
+        db.session, stmt, MedicinalPlant.id,
+        after=parse_after(request.args.get("after")),
+        size=requested_page_size(),
+    )
+
+    return render_results("favorites.html", plants=plants, card_version=card_version)
 
 
 # ---------- SEASONS ----------
-@app.route("/seasons", methods=["GET", "POST"])
+@bp.route("/seasons", methods=["GET", "POST"])
+@conditional_page(catalog_version)
 def seasons():
-    csv_path = os.path.join("data", "medicinalseason.csv")
-    df = pd.read_csv(csv_path)
+    catalog = season_catalog.get().refresh()
 
-    seasons = sorted(df["season"].dropna().unique())
-    plants = []
+    result = None
+    card_version = None
     selected_season = None
+    disease = ""
 
     if request.method == "POST":
         selected_season = request.form.get("season")
-        plants = df[df["season"] == selected_season].to_dict(orient="records")
+        disease = request.form.get("disease", "").strip()
+        index = facets.get()
+        # taken before refresh() so a card is never cached under a newer
+        # version than the index it was rendered from
+        card_version = index.version
+        index = index.refresh()
+        # "More remedies" posts the filters back with the page's next_after
+        after = parse_after(request.form.get("after"))
+        if after is not None and not -1 <= after < len(index.rows):
+            abort(400)
+        result = index.query(
+            {"season": [selected_season], "disease": [disease]},
+            limit=requested_page_size(),
+            after=after,
+        )
 
     return render_template(
         "seasons.html",
-        seasons=seasons,
-        plants=plants,
-        selected_season=selected_season
+        seasons=catalog.seasons,
+        result=result,
+        plants=result["results"] if result else [],
+        selected_season=selected_season,
+        disease=disease,
+        card_version=card_version,
     )
 
 
+# ---------- FACETED FILTERING ----------
+@bp.route("/facets")
+def facet_query():
+    # /facets?season=Winter&disease=cough[&disease=fever][&plant=...]
+    # values of one facet are OR-ed, different facets AND-ed
+    index = facets.get().refresh()
+    after = parse_after(request.args.get("after"))
+    # `after` becomes a shift count in the bitset; keep it to a row position
+    if after is not None and not -1 <= after < len(index.rows):
+        return jsonify(error="after must be a row position from next_after"), 400
+
+    result = index.query(
+        {facet: request.args.getlist(facet) for facet in ("season", "disease", "plant")},
+        limit=requested_page_size(),
+        after=after,
+    )
+    result["facets"] = {
+        facet: [{"value": label, "count": count} for _, label, count in values]
+        for facet, values in result["facets"].items()
+    }
+    return jsonify(result)
+
+
+# ---------- BATCH LOOKUP & EXPORT ----------
+@bp.route("/api/plants/lookup", methods=["GET", "POST"])
+@login_required
+def plants_lookup():
+    # POST {"ids": [1, 2], "names": ["Neem"]} or GET ?id=1&id=2&name=Neem
+    if request.method == "POST":
+        payload = request.get_json(silent=True) or {}
+        if not isinstance(payload, dict):
+            return jsonify(error='body must be {"ids": [...], "names": [...]}'), 400
+        ids, names = payload.get("ids", []), payload.get("names", [])
+    else:
+        ids, names = request.args.getlist("id"), request.args.getlist("name")
+
+    if not isinstance(ids, list) or not isinstance(names, list) or not all(isinstance(n, str) for n in names):
+        return jsonify(error="ids and names must be lists"), 400
+    if len(ids) + len(names) > current_app.config["LOOKUP_MAX_KEYS"]:
+        return jsonify(error=f"at most {current_app.config['LOOKUP_MAX_KEYS']} ids and names per request"), 400
+
+    try:
+        plants, missing_ids, missing_names = lookup_plants(ids, names)
+    except (TypeError, ValueError):
+        return jsonify(error="ids must be plant ids"), 400
+    return jsonify(plants=plants, missing_ids=missing_ids, missing_names=missing_names)
+
+
+@bp.route("/export/plants.<fmt>")
+@login_required
+def export_plants(fmt):
+    # the whole catalog, or every /search hit for ?disease=
+    if fmt not in FORMATS:
+        abort(404)
+    batch = current_app.config["EXPORT_BATCH_SIZE"]
+    disease = request.args.get("disease", "").strip()
+    if disease:
+        records = iter_search(search_engine.get(), normalize_disease(disease), batch)
+    else:
+        records = iter_plants(db.select(MedicinalPlant).order_by(MedicinalPlant.id), batch)
+    return export_response(fmt, PLANT_FIELDS, records, "plants", batch)
+
+
+@bp.route("/export/seasons.<fmt>")
+def export_seasons(fmt):
+    # same filters as /facets; no filter exports every season row
+    if fmt not in FORMATS:
+        abort(404)
+    records = facets.get().refresh().iter_rows(
+        {facet: request.args.getlist(facet) for facet in ("season", "disease", "plant")}
+    )
+    return export_response(fmt, SEASON_FIELDS, records, "seasons", current_app.config["EXPORT_BATCH_SIZE"])
+
+
+@bp.route("/export/favorites.<fmt>")
+@login_required
+def export_favorites(fmt):
+    if fmt not in FORMATS:
+        abort(404)
+    stmt = db.select(MedicinalPlant).join(
+        Favorite, MedicinalPlant.id == Favorite.plant_id
+    ).where(Favorite.user_id == session["user_id"]).order_by(MedicinalPlant.id)
+    batch = current_app.config["EXPORT_BATCH_SIZE"]
+    return export_response(fmt, PLANT_FIELDS, iter_plants(stmt, batch), "favorites", batch)
+
+
 # ---------- ABOUT (SEARCH + COMPARE) ----------
-@app.route("/about", methods=["GET", "POST"])
+@bp.route("/about", methods=["GET", "POST"])
+@conditional_page(catalog_version)
 def about():
-    csv_path = os.path.join("data", "medicinalseason.csv")
-    df = pd.read_csv(csv_path)
+    catalog = season_catalog.get().refresh()
 
     plant = None
-    plant1 = None
-    plant2 = None
+    compared = []
+    common = []
     query = ""
 
-    plant_names = sorted(df["plant_name"].dropna().unique())
-
     # EXISTING SINGLE SEARCH (UNCHANGED)
     if request.method == "POST" and "plant_name" in request.form:
         query = request.form.get("plant_name", "").strip().lower()
-        result = df[df["plant_name"].str.lower() == query]
-        if not result.empty:
-            plant = result.iloc[0].to_dict()
+        plant = catalog.lookup(query)
 
-    # NEW COMPARE FEATURE (SEPARATE & SAFE)
+    # N-WAY COMPARE: any number of "plants" fields (plant1/plant2 still work)
     if request.method == "POST" and "compare" in request.form:
-        p1 = request.form.get("plant1")
-        p2 = request.form.get("plant2")
-
-        if p1 and p2:
-            plant1 = df[df["plant_name"] == p1].iloc[0].to_dict()
-            plant2 = df[df["plant_name"] == p2].iloc[0].to_dict()
+        names = request.form.getlist("plants") + [request.form.get("plant1"), request.form.get("plant2")]
+        names = list(dict.fromkeys(name for name in names if name))[:current_app.config["COMPARE_MAX_PLANTS"]]
+
+        if len(names) >= 2:
+            index = related_plants.get().refresh()
+            compared = [
+                {"record": record, "diseases": index.profile(name)}
+                for name, record in zip(names, catalog.compare(*names))
+                if record is not None
+            ]
+            common = index.common_diseases(*names)
 
     return render_template(
         "about.html",
         plant=plant,
-        plant1=plant1,
-        plant2=plant2,
-        plant_names=plant_names,
+        compared=compared,
+        common=common,
+        compare_slots=range(current_app.config["COMPARE_MAX_PLANTS"]),
         query=query
     )
 
 
-PLANT_DB = {
-    "Jamun": ("Syzygium cumini", "Anti-diabetic fruit", "Regulates blood sugar, improves digestion.", "Seed powder or fresh fruit."),
-    "Bitter Gourd": ("Momordica charantia", "Blood purifier", "Controls diabetes, purifies blood, boosts immunity.", "Juice or cooked vegetable."),
-    "Peppermint": ("Mentha piperita", "Cooling herb", "Relieves indigestion, headaches, and respiratory issues.", "Tea or essential oil."),
-    "Clove": ("Syzygium aromaticum", "Analgesic spice", "Toothache relief, digestive aid, antimicrobial.", "Chewed raw or clove oil."),
-    "Garlic": ("Allium sativum", "Heart tonic", "Lowers cholesterol, boosts immunity, blood thinner.", "Raw cloves or in food."),
-    "Vasaka": ("Adhatoda vasica", "Respiratory expert", "Treats cough, asthma, and bronchitis.", "Leaf juice or decoction."),
-    "Babul": ("Acacia nilotica", "Oral health guardian", "Strengthens gums, treats skin diseases.", "Bark decoction or datun (twig)."),
-    "Coriander": ("Coriandrum sativum", "Cooling spice", "Relieves excess heat (Pitta), digestive aid.", "Seeds water or fresh leaves."),
-    "Kalmegh": ("Andrographis paniculata", "King of Bitters", "Liver detox, fever reduction, immunity.", "Powder or decoction."),
-    "Punarnava": ("Boerhavia diffusa", "Kidney rejuvenator", "Treats kidney disorders, UTI, and swelling.", "Root powder or decoction."),
-    "Shatavari": ("Asparagus racemosus", "Women's tonic", "Hormonal balance, reproductive health, vitality.", "Root powder with milk."),
-    "Guggulu": ("Commiphora wightii", "Fat burner", "Lowers cholesterol, treats arthritis, weight management.", "Purified resin tablet."),
-    "Haritaki": ("Terminalia chebula", "Master detoxifier", "Cleanses colon, improves vision and longevity.", "Powder with warm water."),
-    "Baheda": ("Terminalia bellirica", "Respiratory tonic", "Good for throat, hair health, and eyes.", "Fruit powder."),
-    "Mulethi": ("Glycyrrhiza glabra", "Soothing herb", "Cures acidity, sore throat, and ulcers.", "Root stick or powder."),
-    "Pippali": ("Piper longum", "Metabolism booster", "Improves lung function, burns toxins (Ama).", "Powder with honey."),
-    "Bhringraj": ("Eclipta alba", "Ruler of Hair", "Promotes hair growth, liver health.", "Oil for hair, juice for liver."),
-    "Safed Musli": ("Chlorophytum borivilianum", "Strength tonic", "Boosts vitality, stamina, and immunity.", "Root powder with milk."),
-    "Gokhru": ("Tribulus terrestris", "Urinary tonic", "Treats kidney stones, UTI, and prostate issues.", "Fruit decoction."),
-    "Shankhpushpi": ("Convolvulus pluricaulis", "Brain tonic", "Enhances memory, reduces mental stress/anxiety.", "Syrup or powder."),
-    "Manjistha": ("Rubia cordifolia", "Blood purifier", "Clear skin, lymphatic support, blood detox.", "Powder or tablet."),
-    "Sarpgandha": ("Rauvolfia serpentina", "BP regulator", "Treats hypertension and insomnia.", "Root powder (under supervision)."),
-    "Moringa": ("Moringa oleifera", "Superfood", "Rich in vitamins, strengthens bones, joints.", "Leaf powder or drumsticks."),
-    "Papaya": ("Carica papaya", "Platelet booster", "Leaf juice increases platelets in dengue.", "Leaf juice or ripe fruit."),
-    "Anar": ("Punica granatum", "Hemoglobin booster", "Improves heart health, blood count.", "Fruit or juice."),
-    "Methi": ("Trigonella foenum-graecum", "Insulin mimetic", "Controls blood sugar, good for hair.", "Soaked seeds water."),
-    "Saunf": ("Foeniculum vulgare", "Digestive coolant", "Prevents bloating, freshens breath.", "Chewed after meals."),
-    "Dalchini": ("Cinnamomum verum", "Metabolism spice", "Improves insulin sensitivity, digestion.", "Bark powder or tea."),
-    "Heeng": ("Ferula assa-foetida", "Anti-flatulent", "Instant relief from gas and bloating.", "Pinch in warm water/food."),
-    "Tejpatta": ("Cinnamomum tamala", "Aromatic leaf", "Improves digestion, regulates sugar.", "In cooking."),
-    "Karipatta": ("Murraya koenigii", "Hair tonic", "Prevents greying, aids digestion.", "Chewed raw or in food."),
-    "Sadabahar": ("Catharanthus roseus", "Anti-cancer", "Used in diabetes and specific cancer therapies.", "Flower/Leaf extracts."),
-    "Vidarikand": ("Pueraria tuberosa", "Nutritive tonic", "Builds body mass, strength, and immunity.", "Tuber powder."),
-    "Kaunch Beej": ("Mucuna pruriens", "Nerve tonic", "Treats Parkinson's, boosts testosterone.", "Seed powder."),
-    "Arjuna": ("Terminalia arjuna", "Heart Guardian", "Strengthens heart muscles, controls BP.", "Bark decoction with milk."),
-    "Ashok": ("Saraca asoca", "Friend of Women", "Treats uterine disorders and menstrual issues.", "Bark decoction."),
-    "Bael": ("Aegle marmelos", "Gut healer", "Cures IBS, diarrhea, and dysentery.", "Fruit pulp or sherbet."),
-    "Chitrak": ("Plumbago zeylanica", "Digestive fire", "Treats weak digestion and piles.", "Root powder (purified)."),
-    "Senna": ("Cassia angustifolia", "Laxative", "Relieves acute constipation.", "Leaf powder or tea."),
-    "Patharchatta": ("Kalanchoe pinnata", "Stone breaker", "Dissolves kidney stones.", "Chew fresh leaves."),
-    "Parijat": ("Nyctanthes arbor-tristis", "Sciatica cure", "Treats joint pain, sciatica, and fever.", "Leaf decoction."),
-    "Aprajita": ("Clitoria ternatea", "Mind flower", "Boosts memory, stress relief.", "Blue tea from flowers."),
-    "Nagarmotha": ("Cyperus rotundus", "Digestive herb", "Treats fever, digestion, and skin issues.", "Tuber powder."),
-    "Kachnar": ("Bauhinia variegata", "Cyst breaker", "Treats thyroid, cysts, and swollen glands.", "Bark decoction."),
-    "Makoi": ("Solanum nigrum", "Liver tonic", "Treats liver and spleen enlargement.", "Fresh juice or fruit."),
-    "Kantakari": ("Solanum virginianum", "Throat healer", "Treats cough, asthma, and throat pain.", "Whole plant decoction."),
-    "Malkangni": ("Celastrus paniculatus", "Intellect tree", "Improves memory and cognitive function.", "Oil or seed powder."),
-    "Atibala": ("Abutilon indicum", "Strength giver", "General tonic for physical strength.", "Root/Seed powder."),
-    "Varun": ("Crataeva nurvala", "Kidney support", "Treats urinary stones and UTI.", "Bark decoction."),
-    "Jatiphala": ("Myristica fragrans", "Sleep aid", "Induces sleep, treats diarrhea.", "Nutmeg powder in milk."),
-    "Kankola": ("Piper cubeba", "Throat soothe", "Clears throat, treats cough.", "Chewed or powder."),
-    "Latakaranja": ("Caesalpinia bonduc", "Fever fighter", "Anti-malarial, treats fever.", "Seed kernel powder."),
-    "Mahanimba": ("Melia azedarach", "Skin healer", "Treats skin diseases, piles.", "Leaf/Bark paste."),
-    "Amaltas": ("Cassia fistula", "Gentle laxative", "Treats constipation and skin issues.", "Fruit pulp."),
-    "Bhumyamalaki": ("Phyllanthus niruri", "Liver protector", "Cures jaundice, hepatitis B.", "Whole plant juice."),
-    "Pashanbheda": ("Bergenia ciliata", "Stone breaker", "Dissolves kidney stones.", "Rhizome decoction."),
-    "Kutaja": ("Holarrhena antidysenterica", "Dysentery cure", "Treats severe diarrhea/IBS.", "Bark powder."),
-    "Rakta Chandan": ("Pterocarpus santalinus", "Cooling wood", "Treats acne, pigmentation, cooling.", "Wood paste on face."),
-    "Priyangu": ("Callicarpa macrophylla", "Coolant", "Treats burning sensation, bleeding.", "Fruit/Flower powder."),
-    "Aguru": ("Aquilaria agallocha", "Aromatic", "Treats bad breath, skin issues.", "Oil or powder."),
-    "Shallaki": ("Boswellia serrata", "Joint relief", "Treats osteoarthritis, pain.", "Resin/Gum."),
-    "Shami": ("Prosopis cineraria", "Anti-inflammatory", "Treats skin disorders, asthma.", "Bark/Leaf."),
-    "Nirgundi": ("Vitex negundo", "Pain reliever", "Treats joint pain, arthritis.", "Leaf poultice/oil."),
-    "Dhataki": ("Woodfordia fruticosa", "Fermentation agent", "Used in Arishtas, treats bleeding.", "Flowers."),
-    "Gunja": ("Abrus precatorius", "Hair growth", "Promotes hair growth (toxic if swallowed).", "Seed paste externally."),
-    "Ishwari": ("Aristolochia indica", "Antidote", "Snake bite support (traditional), fever.", "Root."),
-    "Daruharidra": ("Berberis aristata", "Eye tonic", "Treats eye infections, diabetes.", "Stem decoction."),
-    "Kampillaka": ("Mallotus philippensis", "Worm killer", "Treats intestinal worms, skin.", "Glandular hair powder."),
-    "Khadira": ("Acacia catechu", "Skin purifier", "Treats eczema, blood disorders.", "Heartwood decoction."),
-    "Udumbar": ("Ficus racemosa", "Cooling fruit", "Treats heat, bleeding disorders.", "Bark/Fruit."),
-    "Ajwain": ("Trachyspermum ammi", "Colic relief", "Treats gas, stomach ache.", "Chewed or water."),
-    "Kutki": ("Picrorhiza kurroa", "Liver detox", "Potent liver tonic, treats fever.", "Root powder (bitter)."),
-    "Chirata": ("Swertia chirata", "Blood purifier", "Treats skin diseases, fever.", "Whole plant decoction."),
-    "Karanja": ("Pongamia pinnata", "Skin healer", "Treats eczema, psoriasis.", "Oil or bark."),
-    "Jatamansi": ("Nardostachys jatamansi", "Calming herb", "Treats insomnia, stress, hair growth.", "Root powder."),
-    "Parpata": ("Fumaria indica", "Fever cure", "Treats high fever, blood impurities.", "Whole plant."),
-    "Talisapatra": ("Abies webbiana", "Respiratory", "Treats cough, asthma.", "Leaf powder."),
-    "Vanshlochan": ("Bambusa arundinacea", "Calcium source", "Strengthens bones, lung tonic.", "Siliceous secretion."),
-    "Vidanga": ("Embelia ribes", "Worm killer", "Best for intestinal worms.", "Fruit powder."),
-    "Karkatshringi": ("Pistacia integerrima", "Pediatric cough", "Treats cough in children.", "Gall powder."),
-    "Somlata": ("Ephedra gerardiana", "Bronchodilator", "Treats asthma, cardiac stimulant.", "Stem."),
-    "Japa": ("Hibiscus rosa-sinensis", "Hair tonic", "Prevents hair fall, heart tonic.", "Flower/Leaf."),
-    "Sariva": ("Hemidesmus indicus", "Cooling root", "Blood purifier, cooling.", "Root drink."),
-    "Ativisha": ("Aconitum heterophyllum", "Pediatric tonic", "Treats fever/diarrhea in kids.", "Root."),
-    "Shyonaka": ("Oroxylum indicum", "Pain relief", "Component of Dashamoola.", "Bark."),
-    "Gambhari": ("Gmelina arborea", "Nerve tonic", "Treats weakness, vata disorders.", "Fruit/Bark."),
-    "Patala": ("Stereospermum suaveolens", "Diuretic", "Treats edema, breathing issues.", "Root/Bark."),
-    "Agnimantha": ("Premna integrifolia", "Anti-inflammatory", "Treats swelling, weight loss.", "Root/Leaf."),
-    "Prishniparni": ("Uraria picta", "Fracture healing", "Treats fractures, diarrhea.", "Whole plant."),
-    "Nagakeshara": ("Mesua ferrea", "Bleeding arrest", "Treats bleeding piles.", "Stamen."),
-    "Lodhra": ("Symplocos racemosa", "Women's health", "Treats leucorrhea, skin.", "Bark."),
-    "Bakuchi": ("Psoralea corylifolia", "Vitiligo cure", "Treats white spots (leucoderma).", "Seed oil/powder."),
-    "Chakramarda": ("Cassia tora", "Ringworm cure", "Treats fungal infections.", "Seed paste."),
-    "Bharangi": ("Clerodendrum serratum", "Respiratory", "Treats asthma, allergies.", "Root."),
-    "Danti": ("Baliospermum montanum", "Purgative", "Treats severe constipation.", "Root."),
-    "Eranda": ("Ricinus communis", "Rheumatism", "Treats joint pain, constipation.", "Root/Oil."),
-    "Brihati": ("Solanum indicum", "Respiratory", "Treats asthma, cough.", "Root."),
-    "Jyotishmati": ("Celastrus paniculatus", "Memory oil", "Improves intellect.", "Seed oil."),
-    "Nimba": ("Azadirachta indica", "Antiseptic", "See 'Neem' entry.", "Leaves/Bark."),
-    "Neem": ("Azadirachta indica","Antiseptic tree","Purifies blood, treats skin diseases, boosts immunity, antibacterial and antifungal.","Leaves paste, neem oil, or decoction."),
-    "Tulsi": ("Ocimum sanctum", "Herb", "Boosts immunity, relieves stress, supports respiratory health.", "Leaves can be chewed or made into tea."),
-    "Rose": ("Rosa indica", "Flower", "Improves skin health, reduces stress, has antioxidant properties.", "Petals can be used in tea, syrup, or skincare."),
-    "Lemon": ("Citrus limon", "Fruit", "Rich in Vitamin C, aids digestion, detoxifies body.", "Juice can be consumed or used in water."),
-    "Mint": ("Mentha spicata", "Herb", "Relieves indigestion, improves oral health, refreshes breath.", "Leaves can be chewed, made into tea, or used as garnish."),
-    "Aloe Vera": ("Aloe barbadensis miller", "Succulent/Herb", "Soothes burns, improves skin health, aids digestion.", "Gel can be applied topically or consumed in juice form."),
-    "Giloy": (
-        "Tinospora cordifolia",
-        "Immunity booster and detoxifier",
-        "Boosts immunity, reduces inflammation, treats fever, diabetes, and respiratory issues.",
-        "Juice, powder, decoction, or stem pieces."
-    ),
-    "Amla": (
-        "Phyllanthus emblica",
-        "Rich source of Vitamin C and antioxidant",
-        "Improves immunity, strengthens hair, prevents aging, aids digestion and heart health.",
-        "Fresh fruit, juice, powder, or dried pieces."
-    ),
-    "Cumin": (
-        "Cuminum cyminum",
-        "Digestive and antioxidant spice",
-        "Improves digestion, reduces bloating, boosts immunity, and manages diabetes.",
-        "Seeds used whole or powdered in food or decoction."
-    ),
-    "Turmeric": (
-        "Curcuma longa",
-        "Anti-inflammatory and antioxidant",
-        "Reduces inflammation, improves liver function, supports skin and joint health.",
-        "Powder, fresh root, capsules, or decoction with milk/water."
-    ),
-    "Brahmi": (
-        "Bacopa monnieri",
-        "Brain tonic and memory enhancer",
-        "Improves memory, reduces stress, boosts concentration, and supports nervous system.",
-        "Leaves used in juice, powder, or capsules."
-    ),
-    "Parijatak": (
-        "Nyctanthes arbor-tristis",
-        "Fever reducer and anti-inflammatory",
-        "Reduces fever, relieves cough, improves digestion, and acts as a mild laxative.",
-        "Leaves and flowers used in decoction or powder form."
-    ),
-    "Ashok": (
-        "Saraca asoca",
-        "Women’s reproductive health",
-        "Regulates menstrual cycle, reduces menstrual pain, strengthens uterus, and improves fertility.",
-        "Bark or powdered form used in decoction or tablets."
-    ),
-    "Methika": (
-        "Trigonella foenum-graecum",
-        "Metabolism and lactation booster",
-        "Improves digestion, reduces cholesterol, controls blood sugar, and enhances milk production in lactating mothers.",
-        "Seeds used in powder, decoction, or sprouted form."
-    ),
-    "Jyotishmati": (
-        "Celastrus paniculatus",
-        "Memory and nervous system tonic",
-        "Enhances memory, reduces stress, supports brain and nerve health, and improves concentration.",
-        "Seeds used in oil or powdered form."
-    )
-
-
-}
-
-# Queue for speech messages
-speech_queue = queue.Queue()
-
-# Initialize TTS engine
-engine = pyttsx3.init()
-voices = engine.getProperty('voices')
-engine.setProperty('voice', voices[0].id)  # you can change 0 or 1 for different voices
-
-# Background thread that reads messages from the queue and speaks them
-def speak_worker():
-    while True:
-        text = speech_queue.get()  # waits until there is a message
-        engine.say(text)
-        engine.runAndWait()
-        speech_queue.task_done()
-
-# Start the thread
-threading.Thread(target=speak_worker, daemon=True).start()
+# ---------- SPEECH ----------
+@bp.route("/speech/<key>.wav")
+def speech(key):
+    service = speech_service.get()
+    status = service.status(key)
+    if status == "ready":
+        response = send_file(service.path_for(key), mimetype="audio/wav", max_age=31536000)
+        response.cache_control.immutable = True
+        return response
+    if status == "pending":
+        return "", 202, {"Retry-After": "1"}
+    abort(404)
 
 
-@app.route("/chatbot")
+@bp.route("/chatbot")
+@conditional_page(page_version)
 def chatbot():
     return render_template("chatbot.html")
 
-@app.route("/chat", methods=["POST"])
+@bp.route("/chat", methods=["POST"])
 def chat():
-    msg = request.form.get("msg", "").lower()
-    response = "Sorry, I don’t have information about that plant yet."
-    speech_text = response
-
-    # Check PLANT_DB for plant info
-    for plant, details in PLANT_DB.items():
-        if plant.lower() in msg:
-            scientific, category, benefits, usage = details
-            response = f"""
-<b>{plant}</b><br>
-<b>Scientific Name:</b> {scientific}<br>
-<b>Category:</b> {category}<br>
-<b>Benefits:</b> {benefits}<br>
-<b>How to Use:</b> {usage}
-"""
-            speech_text = (
-                f"{plant}. "
-                f"Scientific name {scientific}. "
-                f"Category {category}. "
-                f"Benefits are {benefits}. "
-                f"How to use: {usage}."
-            )
-            break
-
-    # Add the speech text to the queue
-    speech_queue.put(speech_text)
-
-    return response
-
-
-
-
+    response, speech_text = chat_answers.get().answer(request.form.get("msg", ""))
+
+    # Render the reply to audio in the background; the page fetches it later
+    key = speech_service.get().request(speech_text)
+
+    return response, {"X-Speech-Url": url_for(".speech", key=key)}
+
+
+def sse(event, data):
+    return f"event: {event}\ndata: {json.dumps(data)}\n\n"
+
+
+@bp.route("/chat/stream")
+def chat_stream():
+    # Server-Sent Events: one "card" event per plant as soon as it is
+    # matched, each with its own clip URL, then an "audio" event as each clip
+    # finishes rendering, then "end". The generator only ever waits on the
+    # speech queue, so it holds no DB connection while the stream is open.
+    answers = chat_answers.get()
+    parts = answers.answer_parts(request.args.get("msg", "")) or [(None, answers.not_found, answers.not_found)]
+    wait_seconds = current_app.config["CHAT_STREAM_AUDIO_WAIT_SECONDS"]
+    service = speech_service.get()
+
+    def events():
+        keys = []
+        for index, (plant, card, speech_text) in enumerate(parts):
+            key = service.request(speech_text)
+            keys.append(key)
+            yield sse("card", {
+                "index": index,
+                "plant": plant,
+                "html": card,
+                "audio": url_for(".speech", key=key),
+            })
+
+        deadline = time.monotonic() + wait_seconds
+        for index, key in enumerate(keys):
+            status = service.wait(key, max(0.0, deadline - time.monotonic()))
+            yield sse("audio", {"index": index, "url": url_for(".speech", key=key), "status": status})
+
+        yield sse("end", {})
+
+    return Response(
+        stream_with_context(events()),
+        mimetype="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
 
 
 # ---------- RUN ----------
 if __name__ == "__main__":
+    app = create_app()
     with app.app_context():
         db.create_all()
+        search_engine.get(app).install(db.engine)
     app.run(debug=True)
@@ -0,0 +1,137 @@
+# assets.py
+#
+# Build step for static files: copies every file under static/ to
+# static/dist/ under a content-hashed name, rewrites /static/ references in
+# CSS to the hashed /assets/ URLs and writes .gz / .br variants for text assets.
+#
+#     python assets.py
+#
+# At runtime AssetManifest maps "style.css" -> "style.<hash>.css" and
+# serve_asset() picks the best pre-compressed variant per request.
+
+import gzip
+import hashlib
+import json
+import mimetypes
+import os
+import re
+import shutil
+
+from flask import abort, request, send_file, url_for
+from werkzeug.security import safe_join
+
+try:
+    import brotli
+except ImportError:  # optional: only gzip variants are built without it
+    brotli = None
+
+STATIC_DIR = "static"
+DIST_DIR = os.path.join(STATIC_DIR, "dist")
+MANIFEST_NAME = "manifest.json"
+
+COMPRESSIBLE = {".css", ".js", ".svg", ".json", ".txt", ".html"}
+CSS_URL_RE = re.compile(r"""url\((['"]?)/static/([^'")]+)\1\)""")
+
+ENCODINGS = [("br", ".br"), ("gzip", ".gz")]
+
+
+# ---------- BUILD ----------
+def hashed_name(path, data):
+    digest = hashlib.sha256(data).hexdigest()[:12]
+    root, ext = os.path.splitext(path)
+    return f"{root}.{digest}{ext}"
+
+
+def write_variants(target, data):
+    with open(target, "wb") as f:
+        f.write(data)
+    if os.path.splitext(target)[1] not in COMPRESSIBLE:
+        return
+    with open(target + ".gz", "wb") as f:
+        f.write(gzip.compress(data, compresslevel=9, mtime=0))
+    if brotli is not None:
+        with open(target + ".br", "wb") as f:
+            f.write(brotli.compress(data, quality=11))
+
+
+def build(static_dir=STATIC_DIR, dist_dir=DIST_DIR):
+    sources = []
+    for root, dirs, files in os.walk(static_dir):
+        dirs[:] = [d for d in dirs if os.path.join(root, d) != dist_dir]
+        for name in files:
+            path = os.path.join(root, name)
+            sources.append(os.path.relpath(path, static_dir).replace(os.sep, "/"))
+
+    if os.path.isdir(dist_dir):
+        shutil.rmtree(dist_dir)
+
+    manifest = {}
+    # CSS last, so the files it references already have hashed names
+    for rel in sorted(sources, key=lambda rel: (rel.endswith(".css"), rel)):
+        with open(os.path.join(static_dir, rel), "rb") as f:
+            data = f.read()
+
+        if rel.endswith(".css"):
+            text = CSS_URL_RE.sub(
+                lambda m: f'url({m.group(1)}/assets/{manifest.get(m.group(2), m.group(2))}{m.group(1)})',
+                data.decode("utf-8"),
+            )
+            data = text.encode("utf-8")
+
+        manifest[rel] = hashed_name(rel, data)
+        target = os.path.join(dist_dir, manifest[rel])
+        os.makedirs(os.path.dirname(target), exist_ok=True)
+        write_variants(target, data)
+
+    version = hashlib.sha256(json.dumps(manifest, sort_keys=True).encode()).hexdigest()[:12]
+    with open(os.path.join(dist_dir, MANIFEST_NAME), "w") as f:
+        json.dump({"version": version, "files": manifest}, f, indent=2, sort_keys=True)
+    return manifest
+
+
+# ---------- RUNTIME ----------
+class AssetManifest:
+
+    def __init__(self, dist_dir=DIST_DIR):
+        self.dist_dir = dist_dir
+        self.files = {}
+        self.version = None
+
+        path = os.path.join(dist_dir, MANIFEST_NAME)
+        if os.path.exists(path):
+            with open(path) as f:
+                manifest = json.load(f)
+            self.files = manifest["files"]
+            self.version = manifest["version"]
+
+    def url(self, filename):
+        hashed = self.files.get(filename)
+        if hashed is None:
+            # not built: fall back to the plain static file
+            return url_for("static", filename=filename)
+        return url_for("main.asset", filename=hashed)
+
+
+def serve_asset(dist_dir, filename):
+    path = safe_join(dist_dir, filename)
+    if path is None or not os.path.isfile(path) or filename.endswith((".gz", ".br")):
+        abort(404)
+
+    mimetype = mimetypes.guess_type(filename)[0] or "application/octet-stream"
+    encoding = None
+    for name, suffix in ENCODINGS:
+        if name in request.accept_encodings and os.path.isfile(path + suffix):
+            encoding, path = name, path + suffix
+            break
+
+    response = send_file(os.path.abspath(path), mimetype=mimetype, max_age=31536000)
+    response.cache_control.immutable = True
+    response.vary.add("Accept-Encoding")
+    if encoding:
+        response.content_encoding = encoding
+    return response
+
+
+if __name__ == "__main__":
+    files = build()
+    print(f"✅ {len(files)} assets written to {DIST_DIR}")
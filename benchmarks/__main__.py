@@ -0,0 +1,59 @@
+# Route-level benchmark against a seeded SQLite database.
+#
+#     python -m benchmarks --requests 500 --concurrency 8 --output bench.json
+#     python -m benchmarks --compare bench.json     # exit 1 on regression
+
+import argparse
+import json
+import platform
+import sys
+import time
+
+from benchmarks.harness import ROUTES, compare, run
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark the app's routes through the Flask test client.")
+    parser.add_argument("--routes", nargs="*", choices=sorted(ROUTES), help="routes to run (default: all)")
+    parser.add_argument("--requests", type=int, default=200, help="requests per route")
+    parser.add_argument("--concurrency", type=int, default=4)
+    parser.add_argument("--scale", type=int, default=1, help="multiply the seeded catalog N times")
+    parser.add_argument("--output", help="write results as JSON to this file")
+    parser.add_argument("--compare", metavar="BASELINE", help="flag regressions against a results file")
+    parser.add_argument("--threshold", type=float, default=0.2, help="allowed slowdown (0.2 = 20%%)")
+    args = parser.parse_args(argv)
+
+    results = run(args.routes, args.requests, args.concurrency, args.scale)
+
+    print(f"{'route':<16}{'req/s':>10}{'p50 ms':>10}{'p95 ms':>10}{'p99 ms':>10}{'errors':>8}")
+    for name, stats in results.items():
+        print(
+            f"{name:<16}{stats['throughput_rps']:>10.0f}{stats['p50_ms']:>10.2f}"
+            f"{stats['p95_ms']:>10.2f}{stats['p99_ms']:>10.2f}{stats['errors']:>8}"
+        )
+
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump({
+                "created": time.strftime("%Y-%m-%dT%H:%M:%S"),
+                "python": platform.python_version(),
+                "requests": args.requests,
+                "concurrency": args.concurrency,
+                "scale": args.scale,
+                "routes": results,
+            }, f, indent=2)
+
+    if args.compare:
+        with open(args.compare) as f:
+            baseline = json.load(f)["routes"]
+        regressions = compare(results, baseline, args.threshold)
+        for line in regressions:
+            print(f"REGRESSION {line}")
+        if regressions:
+            return 1
+        print("✅ no regressions against", args.compare)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
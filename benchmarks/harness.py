@@ -0,0 +1,152 @@
+# benchmarks/harness.py
+
+import csv
+import os
+import tempfile
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+BENCH_USER = ("bench", "bench-password")
+
+
+# ---------- APP BOOT ----------
+def boot_app(workdir, scale=1):
+    # A throwaway SQLite file and the null TTS engine, seeded with the CSVs
+    # (optionally multiplied).
+    os.chdir(REPO_ROOT)
+
+    import db_import
+    from app import create_app
+    from models import db, User
+    from werkzeug.security import generate_password_hash
+
+    app = create_app({
+        "TESTING": True,
+        "SQLALCHEMY_DATABASE_URI": "sqlite:///" + os.path.join(workdir, "bench.db"),
+        "SPEECH_ENGINE": "null",
+        "SPEECH_CACHE_DIR": os.path.join(workdir, "speech"),
+    })
+
+    sources = list(db_import.DEFAULT_SOURCES)
+    if scale > 1:
+        sources.append(write_scaled_csv(workdir, scale))
+
+    with app.app_context():
+        db_import.import_csv(db.engine, sources, report=lambda line: None)
+        db.session.add(User(username=BENCH_USER[0], password=generate_password_hash(BENCH_USER[1])))
+        db.session.commit()
+
+    return app
+
+
+def write_scaled_csv(workdir, scale):
+    # synthetic copies of the season CSV so search cost can be measured as
+    # the table grows
+    path = os.path.join(workdir, "scaled.csv")
+    with open(os.path.join(REPO_ROOT, "data", "medicinalseason.csv"), newline="", encoding="utf-8") as f:
+        rows = list(csv.DictReader(f))
+
+    with open(path, "w", newline="", encoding="utf-8") as f:
+        writer = csv.DictWriter(f, fieldnames=list(rows[0]))
+        writer.writeheader()
+        for copy in range(1, scale):
+            for row in rows:
+                writer.writerow({**row, "plant_name": f"{row['plant_name']} {copy}"})
+    return path
+
+
+def logged_in_client(app):
+    client = app.test_client()
+    client.post("/login", data={"username": BENCH_USER[0], "password": BENCH_USER[1]})
+    return client
+
+
+# ---------- SCENARIOS ----------
+# name -> (method, path, form data)
+ROUTES = {
+    "search": ("POST", "/search", {"disease": "fever"}),
+    "plant_detail": ("GET", "/plant/1", None),
+    "favorite": ("GET", "/favorite/1", None),
+    "favorites": ("GET", "/favorites", None),
+    "seasons": ("GET", "/seasons", None),
+    "seasons_filter": ("POST", "/seasons", {"season": "Winter"}),
+    "about": ("GET", "/about", None),
+    "about_search": ("POST", "/about", {"plant_name": "neem"}),
+    "about_compare": ("POST", "/about", {"compare": "1", "plants": ["Neem", "Tulsi", "Ginger"]}),
+    "chat": ("POST", "/chat", {"msg": "tell me about tulsi and peppermint"}),
+}
+
+
+def percentile(sorted_values, fraction):
+    if not sorted_values:
+        return 0.0
+    index = min(len(sorted_values) - 1, int(round(fraction * (len(sorted_values) - 1))))
+    return sorted_values[index]
+
+
+def run_route(app, name, requests, concurrency):
+    method, path, data = ROUTES[name]
+    local = threading.local()
+    errors = []
+
+    def one(_):
+        client = getattr(local, "client", None)
+        if client is None:
+            client = local.client = logged_in_client(app)
+
+        started = time.perf_counter()
+        response = client.open(path, method=method, data=data)
+        response.get_data()  # drain streamed bodies
+        response.close()
+        elapsed = time.perf_counter() - started
+
+        if response.status_code >= 400:
+            errors.append(response.status_code)
+        return elapsed
+
+    started = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=concurrency) as pool:
+        latencies = sorted(pool.map(one, range(requests)))
+    wall = time.perf_counter() - started
+
+    return {
+        "requests": requests,
+        "concurrency": concurrency,
+        "errors": len(errors),
+        "throughput_rps": requests / wall if wall else 0.0,
+        "p50_ms": percentile(latencies, 0.50) * 1000,
+        "p95_ms": percentile(latencies, 0.95) * 1000,
+        "p99_ms": percentile(latencies, 0.99) * 1000,
+    }
+
+
+def run(routes=None, requests=200, concurrency=4, scale=1, warmup=5):
+    with tempfile.TemporaryDirectory(prefix="plant-bench-") as workdir:
+        app = boot_app(workdir, scale=scale)
+
+        results = {}
+        for name in routes or ROUTES:
+            run_route(app, name, warmup, 1)
+            results[name] = run_route(app, name, requests, concurrency)
+        return results
+
+
+# ---------- BASELINE COMPARISON ----------
+def compare(results, baseline, threshold=0.2):
+    # a route regresses when p95 grows or throughput drops by more than
+    # `threshold` (0.2 = 20%) against the stored baseline
+    regressions = []
+    for name, current in results.items():
+        previous = baseline.get(name)
+        if not previous:
+            continue
+        if current["p95_ms"] > previous["p95_ms"] * (1 + threshold):
+            regressions.append(f"{name}: p95 {previous['p95_ms']:.2f} -> {current['p95_ms']:.2f} ms")
+        if current["throughput_rps"] < previous["throughput_rps"] * (1 - threshold):
+            regressions.append(
+                f"{name}: throughput {previous['throughput_rps']:.0f} -> {current['throughput_rps']:.0f} req/s"
+            )
+    return regressions
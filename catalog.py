@@ -0,0 +1,109 @@
+# catalog.py
+
+import os
+import threading
+
+from instrumentation import CATALOG_LOAD_SECONDS
+from snapshot import open_snapshot
+
+
+# In-process view of medicinalseason.csv. The file is parsed once and only
+# re-read when its (or the snapshot's) mtime changes; lookups hit prebuilt
+# dict indexes. When a compiled snapshot (snapshot.py) built from the CSV's
+# current contents exists, the catalog maps that instead and records/indexes
+# are views over shared pages.
+class SeasonCatalog:
+
+    def __init__(self, csv_path, snapshot_path=None):
+        self.csv_path = csv_path
+        self.snapshot_path = snapshot_path
+        self._lock = threading.Lock()
+        self._stamp = None
+
+        self.version = None
+        self.modified = None
+        self.records = []
+        self.seasons = []
+        self.plant_names = []
+        self.by_season = {}
+        self.by_name = {}
+
+    def _file_stamp(self):
+        stat = os.stat(self.csv_path)
+        stamp = (stat.st_mtime_ns, stat.st_size)
+        if self.snapshot_path:
+            try:
+                snap = os.stat(self.snapshot_path)
+            except FileNotFoundError:
+                return stamp
+            return stamp + (snap.st_mtime_ns, snap.st_size)
+        return stamp
+
+    def _load(self, stamp):
+        snapshot = None
+        if len(stamp) == 4:
+            # the snapshot is only used while it matches the CSV's contents
+            snapshot = open_snapshot(self.snapshot_path, self.csv_path)
+        if snapshot is not None:
+            self._load_snapshot(snapshot)
+        else:
+            self._load_csv()
+        self.version = "-".join("%x" % part for part in stamp)
+        self.modified = max(stamp[::2]) / 1e9
+        self._stamp = stamp
+
+    def _load_snapshot(self, snapshot):
+        table = snapshot.table("seasons")
+        self.records = table
+        self.by_season = snapshot.index("seasons.by_season", table)
+        self.by_name = snapshot.index("seasons.by_name", table, unique=True)
+        self.seasons = list(self.by_season)
+        self.plant_names = snapshot.strings("seasons.plant_names")
+
+    def _load_csv(self):
+        # pandas is only imported when there is no usable snapshot
+        import pandas as pd
+
+        df = pd.read_csv(self.csv_path)
+        df = df.astype(object).where(df.notna(), None)
+
+        records = df.to_dict(orient="records")
+        by_season = {}
+        by_name = {}
+
+        for record in records:
+            season = record.get("season")
+            if season is not None:
+                by_season.setdefault(season, []).append(record)
+
+            name = record.get("plant_name")
+            if name is not None:
+                # first row wins, matching the old `.iloc[0]` behaviour
+                by_name.setdefault(str(name).strip().lower(), record)
+
+        self.records = records
+        self.by_season = by_season
+        self.by_name = by_name
+        self.seasons = sorted(by_season)
+        self.plant_names = sorted({r["plant_name"] for r in records if r.get("plant_name") is not None})
+
+    def refresh(self):
+        stamp = self._file_stamp()
+        if stamp != self._stamp:
+            with self._lock:
+                if stamp != self._stamp:
+                    with CATALOG_LOAD_SECONDS.time(catalog="seasons"):
+                        self._load(stamp)
+        return self
+
+    # ---------- LOOKUPS ----------
+    def plants_for_season(self, season):
+        return self.refresh().by_season.get(season, [])
+
+    def lookup(self, plant_name):
+        if not plant_name:
+            return None
+        return self.refresh().by_name.get(plant_name.strip().lower())
+
+    def compare(self, *plant_names):
+        return [self.lookup(name) for name in plant_names]
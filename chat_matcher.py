@@ -0,0 +1,155 @@
+# chat_matcher.py
+
+import re
+from collections import deque
+from functools import lru_cache
+
+from snapshot import open_snapshot, CHAT_MATCHER_SOURCE, PLANT_DB_SOURCE
+
+
+NOT_FOUND = "Sorry, I don’t have information about that plant yet."
+
+WHITESPACE_RE = re.compile(r"\s+")
+
+
+def normalize_message(msg):
+    return WHITESPACE_RE.sub(" ", (msg or "").lower()).strip()
+
+
+# ---------- AHO-CORASICK AUTOMATON ----------
+class PlantMatcher:
+    # Finds every plant name in a message in a single pass. Overlapping hits
+    # are resolved leftmost-longest, so "peppermint" never answers as "mint".
+
+    def __init__(self, names):
+        self._goto = [{}]
+        self._fail = [0]
+        self._out = [[]]
+
+        for name in names:
+            self._add(name.lower(), name)
+        self._link()
+
+    def _add(self, pattern, name):
+        state = 0
+        for ch in pattern:
+            nxt = self._goto[state].get(ch)
+            if nxt is None:
+                nxt = len(self._goto)
+                self._goto[state][ch] = nxt
+                self._goto.append({})
+                self._fail.append(0)
+                self._out.append([])
+            state = nxt
+        self._out[state].append((len(pattern), name))
+
+    def _link(self):
+        todo = deque(self._goto[0].values())
+        while todo:
+            state = todo.popleft()
+            for ch, nxt in self._goto[state].items():
+                todo.append(nxt)
+                fail = self._fail[state]
+                while fail and ch not in self._goto[fail]:
+                    fail = self._fail[fail]
+                self._fail[nxt] = self._goto[fail].get(ch, 0)
+                if self._fail[nxt] == nxt:
+                    self._fail[nxt] = 0
+                self._out[nxt] = self._out[nxt] + self._out[self._fail[nxt]]
+
+    def _scan(self, text):
+        state = 0
+        for end, ch in enumerate(text, 1):
+            while state and ch not in self._goto[state]:
+                state = self._fail[state]
+            state = self._goto[state].get(ch, 0)
+            for length, name in self._out[state]:
+                yield end - length, end, name
+
+    def find_all(self, text):
+        hits = [
+            (start, end, name)
+            for start, end, name in self._scan(text)
+            if (start == 0 or not text[start - 1].isalnum())
+            and (end == len(text) or not text[end].isalnum())
+        ]
+        hits.sort(key=lambda hit: (hit[0], -(hit[1] - hit[0])))
+
+        names = []
+        covered = 0
+        for start, end, name in hits:
+            if start >= covered:
+                if name not in names:
+                    names.append(name)
+                covered = end
+        return names
+
+
+# ---------- PREBUILT RESPONSES ----------
+def _render_card(plant, details):
+    scientific, category, benefits, usage = details
+    return f"""
+<b>{plant}</b><br>
+<b>Scientific Name:</b> {scientific}<br>
+<b>Category:</b> {category}<br>
+<b>Benefits:</b> {benefits}<br>
+<b>How to Use:</b> {usage}
+"""
+
+
+def _render_speech(plant, details):
+    scientific, category, benefits, usage = details
+    return (
+        f"{plant}. "
+        f"Scientific name {scientific}. "
+        f"Category {category}. "
+        f"Benefits are {benefits}. "
+        f"How to use: {usage}."
+    )
+
+
+# ---------- ANSWERS ----------
+class ChatAnswers:
+    # Cards, speech text and the matcher for every plant in PLANT_DB. The
+    # compiled snapshot already holds each card and speech text; without one
+    # they are rendered here.
+
+    not_found = NOT_FOUND
+
+    def __init__(self, snapshot_path=None):
+        snapshot = open_snapshot(snapshot_path, PLANT_DB_SOURCE, CHAT_MATCHER_SOURCE) if snapshot_path else None
+        if snapshot is not None:
+            herbs = snapshot.index("herbs.by_name", snapshot.table("herbs"), unique=True)
+            self.cards = herbs.column("card")
+            self.speech = herbs.column("speech")
+        else:
+            from plant_db import PLANT_DB
+
+            self.cards = {plant: _render_card(plant, details) for plant, details in PLANT_DB.items()}
+            self.speech = {plant: _render_speech(plant, details) for plant, details in PLANT_DB.items()}
+
+        self.matcher = PlantMatcher(self.cards)
+        self._parts = lru_cache(maxsize=1024)(self._parts)
+        self._answer = lru_cache(maxsize=1024)(self._answer)
+
+    def _parts(self, normalized):
+        return tuple(
+            (plant, self.cards[plant], self.speech[plant]) for plant in self.matcher.find_all(normalized)
+        )
+
+    def _answer(self, normalized):
+        parts = self._parts(normalized)
+        if not parts:
+            return NOT_FOUND, NOT_FOUND
+
+        html = "<hr>".join(card for _, card, _ in parts)
+        speech = " ".join(text for _, _, text in parts)
+        return html, speech
+
+    def answer_parts(self, msg):
+        # (plant, card html, speech text) for each plant mentioned, in order
+        return self._parts(normalize_message(msg))
+
+    def answer(self, msg):
+        # returns (html, speech_text) for every plant mentioned in the message
+        return self._answer(normalize_message(msg))
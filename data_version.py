@@ -0,0 +1,51 @@
+# data_version.py
+
+import threading
+import time
+
+from models import db, DataVersion
+
+PLANTS = "plants"
+
+
+def plants_version():
+    # one primary-key read; db_import bumps it on every import or sync
+    return db.session.query(DataVersion.version).filter_by(name=PLANTS).scalar() or 0
+
+
+class VersionedIndex:
+    # Base for in-memory indexes over the season catalog and the plant
+    # table. build() runs again whenever the catalog version or the plants
+    # data version changes; with `recheck_seconds` the version is
+    # only re-read that often, for endpoints hit on every keystroke.
+
+    def __init__(self, season_catalog, recheck_seconds=0):
+        self.season_catalog = season_catalog
+        self.recheck_seconds = recheck_seconds
+        self._lock = threading.Lock()
+        self._stamp = None
+        self._checked = None
+        self._index = None
+
+    @property
+    def version(self):
+        # the (catalog version, plants version) the current index was built at
+        return self._stamp
+
+    def build(self, catalog):
+        raise NotImplementedError
+
+    def refresh(self):
+        now = time.monotonic()
+        if self._index is not None and self.recheck_seconds and now - self._checked < self.recheck_seconds:
+            return self._index
+
+        catalog = self.season_catalog.refresh()
+        stamp = (catalog.version, plants_version())
+        if stamp != self._stamp:
+            with self._lock:
+                if stamp != self._stamp:
+                    self._index = self.build(catalog)
+                    self._stamp = stamp
+        self._checked = now
+        return self._index
@@ -1,27 +1,329 @@
-import pandas as pd
-from flask import Flask
+import argparse
+import csv
+import hashlib
+import io
+import os
+import time
+from datetime import datetime, timezone
+from itertools import islice
+
+from sqlalchemy import column, create_engine, delete, event, inspect, select, table, text, update
+
 from config import SQLALCHEMY_DATABASE_URI
-from models import db, MedicinalPlant
+from data_version import PLANTS
+from models import db, dialect_insert, MedicinalPlant, Favorite, PlantFingerprint, DataVersion
+
+DEFAULT_SOURCES = [
+    os.path.join("data", "medicinalseason.csv"),
+    os.path.join("data", "Medicinal Plants and Their Uses - Medicinal Plants and Their Uses.csv"),
+]
+
+NATURAL_KEY = ("plant_name", "disease")
+COLUMNS = ("plant_name", "local_name", "disease", "how_to_use")
+
+plants = MedicinalPlant.__table__
+favorites = Favorite.__table__
+fingerprints = PlantFingerprint.__table__
+data_versions = DataVersion.__table__
+
+
+# ---------- READING ----------
+def clean(value):
+    if value is None:
+        return None
+    value = value.strip()
+    return value or None
+
+
+def read_rows(path):
+    with open(path, newline="", encoding="utf-8") as f:
+        for row in csv.DictReader(f):
+            record = {column: clean(row.get(column)) for column in COLUMNS}
+            # NULLs never collide in a unique index, so a missing disease is
+            # stored as '' to keep the natural key upsertable
+            record["disease"] = record["disease"] or ""
+            if record["plant_name"]:
+                yield record
+
+
+def chunked(rows, size):
+    rows = iter(rows)
+    while True:
+        chunk = list(islice(rows, size))
+        if not chunk:
+            return
+        # ON CONFLICT cannot touch the same row twice in one statement;
+        # the last occurrence of a natural key wins
+        yield list({tuple(r[k] for k in NATURAL_KEY): r for r in chunk}.values())
+
+
+# ---------- SCHEMA ----------
+def create_index(conn, table, name):
+    for index in table.indexes:
+        if index.name == name:
+            index.create(conn)
+
+
+def ensure_schema(conn):
+    db.metadata.create_all(conn)
+
+    # favorites first: dedupe_plants repoints them onto the kept rows and
+    # relies on the unique index to fold repeats
+    existing = {ix["name"] for ix in inspect(conn).get_indexes(favorites.name)}
+    if "uq_favorite_user_plant" not in existing:
+        conn.execute(text("""
+            DELETE FROM favorite WHERE id NOT IN (
+                SELECT MIN(id) FROM favorite GROUP BY user_id, plant_id
+            )
+        """))
+        create_index(conn, favorites, "uq_favorite_user_plant")
+
+    existing = {ix["name"] for ix in inspect(conn).get_indexes(plants.name)}
+    has_null_disease = conn.execute(
+        select(plants.c.id).where(plants.c.disease.is_(None)).limit(1)
+    ).first() is not None
+    if "uq_medicinal_plant_natural_key" not in existing or has_null_disease:
+        dedupe_plants(conn)
+    if "uq_medicinal_plant_natural_key" not in existing:
+        create_index(conn, plants, "uq_medicinal_plant_natural_key")
+
+
+def dedupe_plants(conn):
+    # Tables filled by the old importer hold duplicates, and rows with a NULL
+    # disease slip past the unique index. Fold each (plant_name, disease or
+    # '') group onto its lowest id, moving favorites across, then store the
+    # missing diseases as ''.
+    keep = "SELECT MIN(id) FROM medicinal_plant GROUP BY plant_name, COALESCE(disease, '')"
+    kept_id = """(
+        SELECT MIN(m2.id) FROM medicinal_plant m1
+        JOIN medicinal_plant m2
+          ON m1.plant_name = m2.plant_name AND COALESCE(m1.disease, '') = COALESCE(m2.disease, '')
+        WHERE m1.id = favorite.plant_id
+    )"""
+    conn.execute(text(f"""
+        INSERT INTO favorite (user_id, plant_id)
+        SELECT user_id, {kept_id} FROM favorite
+        WHERE plant_id NOT IN ({keep})
+        ON CONFLICT (user_id, plant_id) DO NOTHING
+    """))
+    conn.execute(text(f"DELETE FROM favorite WHERE plant_id NOT IN ({keep})"))
+    conn.execute(text(f"DELETE FROM plant_fingerprint WHERE plant_id NOT IN ({keep})"))
+    conn.execute(text(f"DELETE FROM medicinal_plant WHERE id NOT IN ({keep})"))
+    conn.execute(text("UPDATE medicinal_plant SET disease = '' WHERE disease IS NULL"))
+
+
+# ---------- WRITING ----------
+def upsert_statement(dialect_name, source=None):
+    stmt = dialect_insert(plants, dialect_name)
+    if source is not None:
+        stmt = stmt.from_select(COLUMNS, source)
+    return stmt.on_conflict_do_update(
+        index_elements=list(NATURAL_KEY),
+        set_={column: stmt.excluded[column] for column in COLUMNS if column not in NATURAL_KEY},
+    )
+
+
+def write_executemany(conn, chunk):
+    conn.execute(upsert_statement(conn.dialect.name), chunk)
+
+
+def write_copy(conn, chunk):
+    # COPY into a temp staging table, then a single set-based upsert
+    conn.execute(text("""
+        CREATE TEMP TABLE IF NOT EXISTS medicinal_plant_stage
+        (plant_name TEXT, local_name TEXT, disease TEXT, how_to_use TEXT)
+        ON COMMIT DELETE ROWS
+    """))
+
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    for row in chunk:
+        writer.writerow(["" if row[c] is None else row[c] for c in COLUMNS])
+    buffer.seek(0)
+
+    cursor = conn.connection.cursor()
+    cursor.copy_expert(
+        "COPY medicinal_plant_stage (plant_name, local_name, disease, how_to_use) "
+        "FROM STDIN WITH (FORMAT csv, FORCE_NOT_NULL (disease))",
+        buffer,
+    )
+
+    stage = table("medicinal_plant_stage", *[column(c) for c in COLUMNS])
+    conn.execute(upsert_statement("postgresql", select(*stage.c)))
+
+
+def bump_data_version(conn):
+    stmt = dialect_insert(data_versions, conn.dialect.name).values(
+        name=PLANTS, version=1, updated_at=datetime.now(timezone.utc)
+    )
+    conn.execute(stmt.on_conflict_do_update(
+        index_elements=["name"],
+        set_={"version": data_versions.c.version + 1, "updated_at": stmt.excluded.updated_at},
+    ))
+
+
+def tune_sqlite(engine):
+    # WAL + synchronous=NORMAL skips the fsync on every chunk commit
+    @event.listens_for(engine, "connect")
+    def set_pragmas(dbapi_connection, _):
+        cursor = dbapi_connection.cursor()
+        cursor.execute("PRAGMA journal_mode=WAL")
+        cursor.execute("PRAGMA synchronous=NORMAL")
+        cursor.close()
+
+
+def import_csv(engine, sources=None, chunk_size=5000, use_copy=None, report=print):
+    sources = sources or DEFAULT_SOURCES
+    if use_copy is None:
+        use_copy = engine.dialect.name == "postgresql"
+    write = write_copy if use_copy else write_executemany
+
+    with engine.begin() as conn:
+        ensure_schema(conn)
+
+    total = 0
+    started = time.perf_counter()
+
+    for path in sources:
+        for number, chunk in enumerate(chunked(read_rows(path), chunk_size), 1):
+            chunk_started = time.perf_counter()
+            with engine.begin() as conn:
+                write(conn, chunk)
+            elapsed = time.perf_counter() - chunk_started
+            total += len(chunk)
+            report(
+                f"{os.path.basename(path)} chunk {number}: {len(chunk)} rows "
+                f"in {elapsed * 1000:.1f} ms ({len(chunk) / max(elapsed, 1e-9):,.0f} rows/s)"
+            )
+
+    with engine.begin() as conn:
+        # the upserts changed rows behind the sync's back; drop every stored
+        # fingerprint so the next sync recomputes them from the table
+        conn.execute(delete(fingerprints))
+        bump_data_version(conn)
+
+    elapsed = time.perf_counter() - started
+    report(f"✅ {total} rows upserted in {elapsed:.2f} s ({total / max(elapsed, 1e-9):,.0f} rows/s)")
+    return total, elapsed
+
+
+# ---------- INCREMENTAL SYNC ----------
+def fingerprint(row):
+    data = "\x1f".join("" if row[c] is None else row[c] for c in COLUMNS)
+    return hashlib.blake2b(data.encode("utf-8"), digest_size=16).hexdigest()
+
+
+def read_source(sources):
+    # natural key -> row over all sources; the last occurrence wins, as in
+    # the bulk import
+    rows = {}
+    for path in sources:
+        for row in read_rows(path):
+            rows[tuple(row[k] for k in NATURAL_KEY)] = row
+    return rows
+
+
+def stored_fingerprints(conn):
+    # natural key -> (id, fingerprint); rows never synced before (bulk
+    # imported) get one computed from their current values
+    stored = {}
+    result = conn.execute(
+        select(plants.c.id, plants.c.plant_name, plants.c.disease, fingerprints.c.fingerprint)
+        .select_from(plants.outerjoin(fingerprints, fingerprints.c.plant_id == plants.c.id))
+    )
+    missing = []
+    for plant_id, plant_name, disease, print_ in result:
+        stored[(plant_name, disease)] = (plant_id, print_)
+        if print_ is None:
+            missing.append(plant_id)
+
+    if missing:
+        result = conn.execute(select(plants.c.id, *[plants.c[c] for c in COLUMNS]).where(plants.c.id.in_(missing)))
+        backfill = []
+        for plant_id, *values in result:
+            row = dict(zip(COLUMNS, values))
+            stored[(row["plant_name"], row["disease"])] = (plant_id, fingerprint(row))
+            backfill.append({"plant_id": plant_id, "fingerprint": fingerprint(row)})
+        conn.execute(fingerprints.insert(), backfill)
+    return stored
+
+
+def sync_csv(engine, sources=None, delete_missing=False, report=print):
+    # Diff the CSVs against the table by row fingerprint and apply only the
+    # inserts and updates, in one transaction. Any change bumps the data
+    # version. Rows missing from `sources` are kept unless delete_missing:
+    # the table may hold rows from other files, and deleting a plant also
+    # drops the favorites pointing at it.
+    sources = sources or DEFAULT_SOURCES
+    started = time.perf_counter()
+
+    with engine.begin() as conn:
+        ensure_schema(conn)
+
+    source = read_source(sources)
+    source_prints = {key: fingerprint(row) for key, row in source.items()}
+
+    with engine.begin() as conn:
+        stored = stored_fingerprints(conn)
+
+        inserts = [source[key] for key in source if key not in stored]
+        updates = [
+            (stored[key][0], source[key]) for key, print_ in source_prints.items()
+            if key in stored and stored[key][1] != print_
+        ]
+        deletes = [plant_id for key, (plant_id, _) in stored.items() if key not in source] if delete_missing else []
+
+        if deletes:
+            conn.execute(delete(favorites).where(favorites.c.plant_id.in_(deletes)))
+            conn.execute(delete(fingerprints).where(fingerprints.c.plant_id.in_(deletes)))
+            conn.execute(delete(plants).where(plants.c.id.in_(deletes)))
+
+        for plant_id, row in updates:
+            conn.execute(
+                update(plants).where(plants.c.id == plant_id)
+                .values({c: row[c] for c in COLUMNS if c not in NATURAL_KEY})
+            )
+            conn.execute(
+                update(fingerprints).where(fingerprints.c.plant_id == plant_id)
+                .values(fingerprint=fingerprint(row))
+            )
+
+        for row in inserts:
+            plant_id = conn.execute(plants.insert().values(row)).inserted_primary_key[0]
+            conn.execute(fingerprints.insert().values(plant_id=plant_id, fingerprint=fingerprint(row)))
 
-app = Flask(__name__)
-app.config["SQLALCHEMY_DATABASE_URI"] = SQLALCHEMY_DATABASE_URI
-app.config["SQLALCHEMY_TRACK_MODIFICATIONS"] = False
+        if inserts or updates or deletes:
+            bump_data_version(conn)
 
-db.init_app(app)
+    elapsed = time.perf_counter() - started
+    report(
+        f"✅ sync: {len(inserts)} inserted, {len(updates)} updated, {len(deletes)} deleted, "
+        f"{len(source) - len(inserts) - len(updates)} unchanged in {elapsed * 1000:.1f} ms"
+    )
+    return len(inserts), len(updates), len(deletes)
 
-df = pd.read_csv("data/medicinalseason.csv")
 
-with app.app_context():
-    for _, row in df.iterrows():
-        plant = MedicinalPlant(
-            plant_name=row["plant_name"],
-            local_name=row["local_name"],
-            disease=row["disease"],
-            how_to_use=row["how_to_use"]
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Bulk upsert the plant CSVs into the database.")
+    parser.add_argument("sources", nargs="*", help="CSV files (default: both files under data/)")
+    parser.add_argument("--database-url", default=SQLALCHEMY_DATABASE_URI)
+    parser.add_argument("--chunk-size", type=int, default=5000)
+    parser.add_argument("--no-copy", dest="use_copy", action="store_false", default=None,
+                        help="use executemany instead of COPY on Postgres")
+    parser.add_argument("--sync", action="store_true",
+                        help="apply only new and changed rows")
+    parser.add_argument("--delete-missing", action="store_true",
+                        help="with --sync, also delete rows (and their favorites) that are in none of the given CSVs")
+    args = parser.parse_args(argv)
 
-        )
-        db.session.add(plant)
+    engine = create_engine(args.database_url)
+    if engine.dialect.name == "sqlite":
+        tune_sqlite(engine)
+    if args.sync:
+        sync_csv(engine, args.sources, args.delete_missing)
+    else:
+        import_csv(engine, args.sources, args.chunk_size, args.use_copy)
 
-    db.session.commit()
 
-print("✅ CSV imported successfully")
+if __name__ == "__main__":
+    main()
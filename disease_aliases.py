@@ -1,5 +1,8 @@
 # disease_aliases.py
 
+import re
+from functools import lru_cache
+
 DISEASE_ALIASES = {
 
     # Diabetes
@@ -49,12 +52,133 @@ DISEASE_ALIASES = {
     "toothache": ["toothache", "tooth sensitivity", "bad breath", "bleeding gums"],
     "asthma": ["asthma", "respiratory issues"],
 }
+# ---------- COMPILED NORMALIZER ----------
+TOKEN_RE = re.compile(r"[a-z0-9']+")
+
+
+def tokenize(text):
+    return TOKEN_RE.findall(text.lower())
+
+
+DISEASE_SPLIT_RE = re.compile(r"\s*(?:/|,|;|&|\band\b)\s*")
+
+
+def split_diseases(text):
+    # "Cough/Cold" -> ["cough", "cold"], each part tokenized
+    parts = (" ".join(tokenize(part)) for part in DISEASE_SPLIT_RE.split((text or "").lower()))
+    return [part for part in parts if part]
+
+
+# alias phrase -> canonical disease, built once
+ALIAS_TO_DISEASE = {}
+for standard_disease, aliases in DISEASE_ALIASES.items():
+    for alias in [standard_disease, *aliases]:
+        ALIAS_TO_DISEASE.setdefault(" ".join(tokenize(alias)), standard_disease)
+
+MAX_ALIAS_WORDS = max(len(alias.split()) for alias in ALIAS_TO_DISEASE)
+
+
+def edit_distance(a, b):
+    previous = list(range(len(b) + 1))
+    for i, ca in enumerate(a, 1):
+        current = [i]
+        for j, cb in enumerate(b, 1):
+            current.append(min(
+                previous[j] + 1,
+                current[j - 1] + 1,
+                previous[j - 1] + (ca != cb),
+            ))
+        previous = current
+    return previous[-1]
+
+
+def typo_tolerance(phrase):
+    if len(phrase) < 5:
+        return 0
+    return 1 if len(phrase) < 9 else 2
+
+
+def deletes(phrase, distance):
+    variants = {phrase}
+    frontier = {phrase}
+    for _ in range(distance):
+        frontier = {word[:i] + word[i + 1:] for word in frontier for i in range(len(word))}
+        variants |= frontier
+    return variants
+
+
+class SymSpellIndex:
+    # Symmetric-delete index: aliases and queries are both expanded into
+    # their deletion variants, so typo candidates come from dict hits and
+    # only those few are checked with a real edit distance.
+
+    def __init__(self, phrases):
+        self._variants = {}
+        for phrase in phrases:
+            for variant in deletes(phrase, typo_tolerance(phrase)):
+                self._variants.setdefault(variant, set()).add(phrase)
+
+    def search(self, phrase, tolerance):
+        candidates = set()
+        for variant in deletes(phrase, tolerance):
+            candidates |= self._variants.get(variant, set())
+
+        found = []
+        for candidate in candidates:
+            distance = edit_distance(phrase, candidate)
+            if distance <= min(tolerance, typo_tolerance(candidate)):
+                found.append((candidate, distance))
+        return found
+
+
+ALIAS_INDEX = SymSpellIndex(ALIAS_TO_DISEASE)
+
+
+@lru_cache(maxsize=4096)
+def disease_candidates(user_input: str):
+    # Ranked (canonical disease, score) pairs found anywhere in free text.
+    # Exact alias phrases win over typo matches, longer phrases over shorter.
+    tokens = tokenize(user_input)
+    scores = {}
+    covered = set()
+
+    # exact phrases, longest first at each position
+    i = 0
+    while i < len(tokens):
+        for size in range(min(MAX_ALIAS_WORDS, len(tokens) - i), 0, -1):
+            phrase = " ".join(tokens[i:i + size])
+            disease = ALIAS_TO_DISEASE.get(phrase)
+            if disease:
+                scores[disease] = scores.get(disease, 0.0) + 1.0 + 0.1 * size
+                covered.update(range(i, i + size))
+                i += size
+                break
+        else:
+            i += 1
+
+    # typo-tolerant matches for n-grams not already explained
+    for i in range(len(tokens)):
+        for size in range(1, min(MAX_ALIAS_WORDS, len(tokens) - i) + 1):
+            if covered.intersection(range(i, i + size)):
+                break
+            phrase = " ".join(tokens[i:i + size])
+            tolerance = typo_tolerance(phrase)
+            if not tolerance:
+                continue
+            for alias, distance in ALIAS_INDEX.search(phrase, tolerance):
+                disease = ALIAS_TO_DISEASE[alias]
+                score = 0.9 * (1.0 + 0.1 * size) * (1.0 - distance / len(alias))
+                scores[disease] = max(scores.get(disease, 0.0), score)
+
+    return tuple(sorted(scores.items(), key=lambda item: -item[1]))
+
+
 def normalize_disease(user_input: str):
     user_input = user_input.lower().strip()
 
-    for standard_disease, aliases in DISEASE_ALIASES.items():
-        if user_input in aliases:
-            return standard_disease
+    candidates = disease_candidates(user_input)
+    if candidates:
+        return candidates[0][0]
 
     # If no alias found, return input as-is
-    return user_input
\ No newline at end of file
+    return user_input
@@ -0,0 +1,111 @@
+# export.py
+#
+# Machine-readable access to the plant data: batch lookup by id / name in
+# one IN query, and CSV / NDJSON exports streamed from generators so the
+# whole catalog goes out in one response with constant server memory.
+
+import csv
+import io
+import json
+
+from flask import Response, stream_with_context
+from sqlalchemy import func, or_
+
+from favorites import clean_plant_ids
+from models import db, MedicinalPlant
+
+PLANT_FIELDS = ("id", "plant_name", "local_name", "disease", "how_to_use")
+SEASON_FIELDS = PLANT_FIELDS + ("seasons",)
+
+FORMATS = {
+    "csv": "text/csv",
+    "ndjson": "application/x-ndjson",
+}
+
+
+def plant_record(plant):
+    return {field: getattr(plant, field) for field in PLANT_FIELDS}
+
+
+# ---------- BATCH LOOKUP ----------
+def lookup_plants(ids=(), names=()):
+    # every row whose id is in `ids` or whose name matches one of `names`
+    # (case-insensitive), plus the ids and names nothing matched
+    ids = clean_plant_ids(ids)
+    names = {name.strip().lower(): name for name in names if name and name.strip()}
+    if not ids and not names:
+        return [], [], []
+
+    conditions = []
+    if ids:
+        conditions.append(MedicinalPlant.id.in_(ids))
+    if names:
+        conditions.append(func.lower(MedicinalPlant.plant_name).in_(list(names)))
+    plants = db.session.scalars(
+        db.select(MedicinalPlant).where(or_(*conditions)).order_by(MedicinalPlant.id)
+    ).all()
+
+    found_ids = {plant.id for plant in plants}
+    found_names = {plant.plant_name.strip().lower() for plant in plants}
+    return (
+        [plant_record(plant) for plant in plants],
+        [plant_id for plant_id in ids if plant_id not in found_ids],
+        [name for key, name in names.items() if key not in found_names],
+    )
+
+
+# ---------- STREAMING EXPORT ----------
+def iter_plants(stmt, batch=500):
+    # ORM rows pulled `batch` at a time from a server-side cursor
+    for plant in db.session.scalars(stmt.execution_options(yield_per=batch)):
+        yield plant_record(plant)
+
+
+def iter_search(engine, query, batch=500):
+    # every search hit in rank order, one engine page of `batch` at a time
+    after = None
+    while True:
+        plants, after = engine.search(query, batch, after=after)
+        for plant in plants:
+            yield plant_record(plant)
+        if not after:
+            return
+
+
+def csv_chunks(fields, records, batch=500):
+    buffer = io.StringIO()
+    writer = csv.DictWriter(buffer, fields, extrasaction="ignore")
+    writer.writeheader()
+    for i, record in enumerate(records, 1):
+        if isinstance(record.get("seasons"), list):
+            record = {**record, "seasons": ";".join(record["seasons"])}
+        writer.writerow(record)
+        if i % batch == 0:
+            yield buffer.getvalue()
+            buffer.seek(0)
+            buffer.truncate()
+    yield buffer.getvalue()
+
+
+def ndjson_chunks(records, batch=500):
+    lines = []
+    for record in records:
+        lines.append(json.dumps(record, ensure_ascii=False) + "\n")
+        if len(lines) == batch:
+            yield "".join(lines)
+            lines = []
+    yield "".join(lines)
+
+
+def export_response(fmt, fields, records, filename, batch=500):
+    # `records` is consumed lazily while the body is sent; the request
+    # context stays pushed so DB-backed generators keep their session
+    if fmt == "csv":
+        chunks = csv_chunks(fields, records, batch)
+    else:
+        chunks = ndjson_chunks(records, batch)
+    return Response(
+        stream_with_context(chunks),
+        mimetype=FORMATS[fmt],
+        headers={"Content-Disposition": f'attachment; filename="{filename}.{fmt}"'},
+    )
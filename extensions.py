@@ -0,0 +1,157 @@
+# extensions.py
+#
+# Heavy subsystems (season catalog, related-plants, typeahead and facet
+# indexes, search engine, chat matcher, TTS, asset manifest, fragment cache,
+# password hashing pool) are registered per app but only imported and built the first time a
+# request needs them, so a worker that never serves /chat never loads the
+# chat matcher or the speech service.
+
+import importlib
+import logging
+import os
+import threading
+import time
+
+from flask import current_app
+
+startup_log = logging.getLogger("medicinal_plant.startup")
+
+
+class LazyExtension:
+    # `module` is imported and `build(module, app)` called on first get();
+    # both costs are recorded for the startup report
+
+    def __init__(self, name, module, build):
+        self.name = name
+        self.module = module
+        self.build = build
+
+    def init_app(self, app):
+        app.extensions[self.name] = {
+            "value": None,
+            "lock": threading.Lock(),
+            "import_seconds": None,
+            "init_seconds": None,
+        }
+
+    def get(self, app=None):
+        app = app or current_app._get_current_object()
+        state = app.extensions[self.name]
+        if state["value"] is None:
+            with state["lock"]:
+                if state["value"] is None:
+                    started = time.perf_counter()
+                    module = importlib.import_module(self.module)
+                    imported = time.perf_counter()
+                    value = self.build(module, app)
+                    state["import_seconds"] = imported - started
+                    state["init_seconds"] = time.perf_counter() - imported
+                    state["value"] = value
+                    startup_log.info(
+                        "%s ready: import %.1f ms, init %.1f ms",
+                        self.name, state["import_seconds"] * 1000, state["init_seconds"] * 1000,
+                    )
+        return state["value"]
+
+    def peek(self, app):
+        # the built object, or None if nothing has needed it yet
+        return app.extensions[self.name]["value"]
+
+
+season_catalog = LazyExtension(
+    "season_catalog", "catalog",
+    lambda m, app: m.SeasonCatalog(app.config["SEASON_CSV"], app.config["CATALOG_SNAPSHOT"]),
+)
+related_plants = LazyExtension(
+    "related_plants", "similarity",
+    lambda m, app: m.RelatedPlants(
+        season_catalog.get(app), k=app.config["RELATED_PLANTS"], metric=app.config["SIMILARITY_METRIC"]
+    ),
+)
+suggestions = LazyExtension(
+    "suggestions", "suggest",
+    lambda m, app: m.Suggestions(
+        season_catalog.get(app), limit=app.config["SUGGEST_LIMIT"],
+        recheck_seconds=app.config["INDEX_RECHECK_SECONDS"],
+    ),
+)
+facets = LazyExtension(
+    "facets", "facets",
+    lambda m, app: m.Facets(season_catalog.get(app), recheck_seconds=app.config["INDEX_RECHECK_SECONDS"]),
+)
+search_engine = LazyExtension(
+    "search_engine", "plant_search",
+    lambda m, app: m.create_search_engine(app.config["SEARCH_BACKEND"]),
+)
+chat_answers = LazyExtension(
+    "chat_answers", "chat_matcher",
+    lambda m, app: m.ChatAnswers(app.config["CATALOG_SNAPSHOT"]),
+)
+speech_service = LazyExtension(
+    "speech_service", "speech",
+    lambda m, app: m.SpeechService(
+        # /speech/<key>.wav resolves against root_path, so clips must too
+        os.path.join(app.root_path, app.config["SPEECH_CACHE_DIR"]),
+        engine=app.config["SPEECH_ENGINE"],
+        voice_index=app.config["SPEECH_VOICE_INDEX"],
+        max_bytes=app.config["SPEECH_CACHE_MAX_BYTES"],
+        queue_size=app.config["SPEECH_QUEUE_SIZE"],
+    ),
+)
+password_hasher = LazyExtension(
+    "password_hasher", "passwords",
+    lambda m, app: m.PasswordHasher(
+        app.config["PASSWORD_HASH_METHOD"],
+        workers=app.config["PASSWORD_HASH_WORKERS"],
+        max_pending=app.config["PASSWORD_HASH_MAX_PENDING"],
+        timeout=app.config["PASSWORD_HASH_TIMEOUT_SECONDS"],
+        retry_after=app.config["PASSWORD_HASH_RETRY_AFTER"],
+    ),
+)
+asset_manifest = LazyExtension(
+    "asset_manifest", "assets",
+    lambda m, app: m.AssetManifest(),
+)
+fragment_cache = LazyExtension(
+    "fragment_cache", "fragments",
+    lambda m, app: m.FragmentCache(
+        app.jinja_env, app.config["FRAGMENT_CACHE_SIZE"], recheck_seconds=app.config["INDEX_RECHECK_SECONDS"]
+    ),
+)
+page_stamp = LazyExtension(
+    "page_stamp", "http_cache",
+    lambda m, app: m.template_stamp(os.path.join(app.root_path, app.template_folder)),
+)
+
+EXTENSIONS = (
+    season_catalog, related_plants, suggestions, facets, search_engine, chat_answers, speech_service, password_hasher,
+    asset_manifest, fragment_cache, page_stamp,
+)
+
+
+def init_extensions(app):
+    for extension in EXTENSIONS:
+        extension.init_app(app)
+
+
+# ---------- STARTUP REPORT ----------
+def startup_report(app, timings=(), warm=False):
+    # `timings` are (name, seconds) pairs measured by the caller (imports,
+    # create_app); with warm=True every extension is built first
+    if warm:
+        with app.app_context():
+            for extension in EXTENSIONS:
+                extension.get(app)
+
+    lines = [f"{'subsystem':<20}{'import ms':>12}{'init ms':>12}"]
+    for name, seconds in timings:
+        lines.append(f"{name:<20}{seconds * 1000:>12.1f}{'':>12}")
+    for extension in EXTENSIONS:
+        state = app.extensions[extension.name]
+        if state["value"] is None:
+            lines.append(f"{extension.name:<20}{'(lazy)':>12}{'(lazy)':>12}")
+        else:
+            lines.append(
+                f"{extension.name:<20}{state['import_seconds'] * 1000:>12.1f}{state['init_seconds'] * 1000:>12.1f}"
+            )
+    return "\n".join(lines)
@@ -0,0 +1,157 @@
+# facets.py
+
+from data_version import VersionedIndex
+from disease_aliases import normalize_disease, split_diseases, tokenize
+from models import db, MedicinalPlant
+
+FACETS = ("season", "disease", "plant")
+# plant counts are one per plant and rarely useful in the UI
+COUNTED_FACETS = ("season", "disease")
+
+
+def canonical_disease(text):
+    return " ".join(tokenize(normalize_disease(text)))
+
+
+def iter_bits(mask):
+    while mask:
+        low = mask & -mask
+        yield low.bit_length() - 1
+        mask ^= low
+
+
+# ---------- INDEX ----------
+class FacetIndex:
+    # One bitset (a Python int, bit i = row i) per season, canonical disease
+    # and plant over the merged catalog rows. Values of one facet are OR-ed,
+    # facets are AND-ed, and each facet count is a popcount of the result
+    # AND-ed with that value's bitset.
+
+    def __init__(self, rows):
+        self.rows = rows
+        self.all = (1 << len(rows)) - 1
+        self.bits = {facet: {} for facet in FACETS}
+        self.labels = {facet: {} for facet in FACETS}
+
+        for i, row in enumerate(rows):
+            bit = 1 << i
+            for facet, value, label in self._facet_values(row):
+                self.bits[facet][value] = self.bits[facet].get(value, 0) | bit
+                self.labels[facet].setdefault(value, label)
+
+    def _facet_values(self, row):
+        for season in row["seasons"]:
+            yield "season", season.lower(), season
+        for part in split_diseases(row.get("disease")):
+            disease = canonical_disease(part)
+            yield "disease", disease, disease.title()
+        name = row["plant_name"]
+        yield "plant", name.lower(), name
+
+    def key(self, facet, value):
+        if facet == "disease":
+            return canonical_disease(value)
+        return value.strip().lower()
+
+    def mask(self, filters):
+        # filters: {facet: [values]}
+        mask = self.all
+        for facet, values in filters.items():
+            values = [value for value in values if value and value.strip()]
+            if not values:
+                continue
+            matched = 0
+            for value in values:
+                matched |= self.bits[facet].get(self.key(facet, value), 0)
+            mask &= matched
+        return mask
+
+    def iter_rows(self, filters):
+        # every matching row in catalog order, for exports
+        for i in iter_bits(self.mask(filters)):
+            yield self.rows[i]
+
+    def counts(self, mask, facets=COUNTED_FACETS):
+        # {facet: [(value key, label, count), ...]} for values present in mask
+        counts = {}
+        for facet in facets:
+            values = self.bits[facet]
+            found = [
+                (value, self.labels[facet][value], (mask & bits).bit_count())
+                for value, bits in values.items()
+            ]
+            counts[facet] = sorted(
+                (item for item in found if item[2]), key=lambda item: (-item[2], item[1])
+            )
+        return counts
+
+    def query(self, filters, limit=24, after=None, facets=COUNTED_FACETS):
+        mask = self.mask(filters)
+        total = mask.bit_count()
+
+        page = mask
+        if after is not None:
+            page &= ~((1 << (after + 1)) - 1)
+        results = []
+        next_after = None
+        for i in iter_bits(page):
+            if len(results) == limit:
+                next_after = results[-1][0]
+                break
+            results.append((i, self.rows[i]))
+
+        return {
+            "total": total,
+            "results": [row for _, row in results],
+            "next_after": next_after,
+            "facets": self.counts(mask, facets),
+        }
+
+
+# ---------- VERSIONED HOLDER ----------
+class Facets(VersionedIndex):
+    # Rows are the season CSV merged with the plant table on (plant, disease).
+    # A table row takes the seasons its plant has in the CSV, so "cough in
+    # Winter" also finds remedies that only exist in the database.
+
+    def build(self, catalog):
+        rows = {}
+        seasons_by_plant = {}
+        for record in catalog.records:
+            name = (record.get("plant_name") or "").strip()
+            if not name:
+                continue
+            season = record.get("season")
+            if season:
+                seasons_by_plant.setdefault(name.lower(), set()).add(season)
+            key = (name.lower(), (record.get("disease") or "").strip().lower())
+            row = rows.setdefault(key, {
+                "id": None,
+                "plant_name": name,
+                "local_name": record.get("local_name"),
+                "disease": record.get("disease"),
+                "how_to_use": record.get("how_to_use"),
+                "seasons": set(),
+            })
+            if season:
+                row["seasons"].add(season)
+
+        plants = db.session.query(
+            MedicinalPlant.id, MedicinalPlant.plant_name, MedicinalPlant.local_name,
+            MedicinalPlant.disease, MedicinalPlant.how_to_use,
+        ).order_by(MedicinalPlant.id)
+        for plant_id, name, local_name, disease, how_to_use in plants:
+            name = name.strip()
+            key = (name.lower(), (disease or "").strip().lower())
+            row = rows.setdefault(key, {
+                "plant_name": name,
+                "local_name": local_name,
+                "disease": disease,
+                "how_to_use": how_to_use,
+                "seasons": set(),
+            })
+            row["id"] = plant_id
+
+        for row in rows.values():
+            row["seasons"] = sorted(row["seasons"] or seasons_by_plant.get(row["plant_name"].lower(), ()))
+        return FacetIndex(list(rows.values()))
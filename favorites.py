@@ -0,0 +1,70 @@
+# favorites.py
+
+from sqlalchemy import literal
+
+from models import db, dialect_insert, Favorite, MedicinalPlant
+
+favorites_table = Favorite.__table__
+plants_table = MedicinalPlant.__table__
+
+
+def plant_id(value):
+    # ints or digit strings only; int() would also take True, 1.9 or " 3 "
+    if isinstance(value, int) and not isinstance(value, bool):
+        return value
+    if isinstance(value, str) and value.isdigit():
+        return int(value)
+    raise ValueError(f"not a plant id: {value!r}")
+
+
+def clean_plant_ids(plant_ids):
+    # a string would otherwise be read digit by digit ("12" -> plants 1, 2)
+    if isinstance(plant_ids, (str, bytes)):
+        raise TypeError("plant ids must be a list")
+    return sorted({plant_id(value) for value in plant_ids})
+
+
+def add_favorites(user_id, plant_ids):
+    # single INSERT ... SELECT ... ON CONFLICT DO NOTHING, safe under
+    # concurrent clicks; ids with no plant behind them are skipped rather
+    # than tripping the foreign key
+    plant_ids = clean_plant_ids(plant_ids)
+    if not plant_ids:
+        return 0
+
+    existing = db.select(literal(user_id), plants_table.c.id).where(plants_table.c.id.in_(plant_ids))
+    stmt = dialect_insert(favorites_table, db.engine.dialect.name).from_select(
+        ["user_id", "plant_id"], existing
+    ).on_conflict_do_nothing(index_elements=["user_id", "plant_id"])
+    result = db.session.execute(stmt)
+    db.session.commit()
+    return result.rowcount
+
+
+def remove_favorites(user_id, plant_ids):
+    plant_ids = clean_plant_ids(plant_ids)
+    if not plant_ids:
+        return 0
+
+    result = db.session.execute(
+        favorites_table.delete().where(
+            favorites_table.c.user_id == user_id,
+            favorites_table.c.plant_id.in_(plant_ids),
+        )
+    )
+    db.session.commit()
+    return result.rowcount
+
+
+def favorited_ids(user_id, plant_ids):
+    # which of plant_ids the user has saved, in one indexed query
+    plant_ids = clean_plant_ids(plant_ids)
+    if not user_id or not plant_ids:
+        return set()
+
+    return set(db.session.scalars(
+        db.select(Favorite.plant_id).where(
+            Favorite.user_id == user_id,
+            Favorite.plant_id.in_(plant_ids),
+        )
+    ))
@@ -0,0 +1,60 @@
+# fragments.py
+
+import threading
+import time
+from collections import OrderedDict
+
+from markupsafe import Markup
+
+from data_version import plants_version
+
+
+class FragmentCache:
+    # Bounded LRU of rendered per-plant markup keyed by (template, plant key,
+    # data version). Pages render each card once per data version and paste
+    # the cached html afterwards; entries for old versions are never hit
+    # again and fall off the end.
+
+    def __init__(self, env, max_entries=4096, recheck_seconds=5):
+        self.env = env
+        self.max_entries = max_entries
+        self.recheck_seconds = recheck_seconds
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        self._version = None
+        self._checked = None
+        self.hits = 0
+        self.misses = 0
+
+    def plants_version(self):
+        # the plants data version, re-read at most every `recheck_seconds` so
+        # a page pays no extra query; call it before loading the rows, so a
+        # card is never cached under a newer version than its data
+        now = time.monotonic()
+        if self._version is None or now - self._checked >= self.recheck_seconds:
+            self._version = plants_version()
+            self._checked = now
+        return self._version
+
+    def render(self, template, key, version, **context):
+        cache_key = (template, key, version)
+        with self._lock:
+            html = self._entries.get(cache_key)
+            if html is not None:
+                self._entries.move_to_end(cache_key)
+                self.hits += 1
+                return html
+
+        # rendered outside the lock; two threads missing the same key just
+        # both render it
+        html = Markup(self.env.get_template(template).render(**context))
+        with self._lock:
+            self.misses += 1
+            self._entries[cache_key] = html
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+        return html
+
+    def __len__(self):
+        return len(self._entries)
+
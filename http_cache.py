@@ -0,0 +1,60 @@
+# http_cache.py
+
+import hashlib
+import os
+from datetime import datetime, timezone
+from functools import wraps
+
+from flask import make_response, request, session
+
+
+def template_stamp(template_dir="templates"):
+    # changes whenever a template is edited and the app restarted
+    mtimes = [
+        os.stat(os.path.join(root, name)).st_mtime
+        for root, dirs, files in sorted(os.walk(template_dir))
+        for name in sorted(files)
+    ]
+    return hashlib.sha256(repr(mtimes).encode()).hexdigest()[:12], max(mtimes)
+
+
+def conditional_page(version):
+    # ETag / Last-Modified for GET pages whose output only depends on the
+    # data version and on who is logged in (the navbar). `version` returns
+    # (version string, last modified unix time). A matching If-None-Match
+    # answers 304 without rendering the template. If-Modified-Since is only
+    # trusted when the client sent no ETag and nobody is logged in, since the
+    # timestamp cannot see a login or logout.
+
+    def decorator(view):
+        @wraps(view)
+        def wrapper(*args, **kwargs):
+            if request.method != "GET":
+                return view(*args, **kwargs)
+
+            data_version, modified = version()
+            etag = hashlib.sha256(
+                f"{data_version}|{session.get('user')}".encode("utf-8")
+            ).hexdigest()[:20]
+            last_modified = datetime.fromtimestamp(int(modified), tz=timezone.utc)
+
+            not_modified = False
+            if request.if_none_match:
+                not_modified = request.if_none_match.contains(etag)
+            elif "user" not in session:
+                since = request.if_modified_since
+                not_modified = since is not None and since >= last_modified
+
+            if not_modified:
+                response = make_response("", 304)
+            else:
+                response = make_response(view(*args, **kwargs))
+
+            response.set_etag(etag)
+            response.last_modified = last_modified
+            response.cache_control.private = True
+            response.cache_control.no_cache = True
+            response.vary.add("Cookie")
+            return response
+        return wrapper
+    return decorator
@@ -0,0 +1,277 @@
+# instrumentation.py
+#
+# Request, SQL, template, catalog and speech-queue metrics, exported in the
+# Prometheus text format at /metrics. No client library needed: the few
+# metric types used here are implemented below.
+
+import logging
+import threading
+import time
+from contextlib import contextmanager
+
+from flask import Response, g, has_request_context, request, template_rendered, before_render_template
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+DEFAULT_BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+slow_log = logging.getLogger("medicinal_plant.slow_requests")
+
+
+# ---------- METRIC TYPES ----------
+def _escape(value):
+    return str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _label_text(names, values):
+    if not names:
+        return ""
+    pairs = ",".join(f'{name}="{_escape(value)}"' for name, value in zip(names, values))
+    return "{" + pairs + "}"
+
+
+class Counter:
+    kind = "counter"
+
+    def __init__(self, name, help, labels=()):
+        self.name = name
+        self.help = help
+        self.labels = tuple(labels)
+        self._values = {}
+        self._lock = threading.Lock()
+
+    def inc(self, amount=1, **labels):
+        key = tuple(labels.get(name, "") for name in self.labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0) + amount
+
+    def samples(self):
+        with self._lock:
+            items = list(self._values.items())
+        for key, value in items:
+            yield self.name, _label_text(self.labels, key), value
+
+
+class Gauge:
+    # value comes from a callback at scrape time
+
+    kind = "gauge"
+
+    def __init__(self, name, help, callback):
+        self.name = name
+        self.help = help
+        self.callback = callback
+
+    def samples(self):
+        yield self.name, "", self.callback()
+
+
+class Histogram:
+    kind = "histogram"
+
+    def __init__(self, name, help, labels=(), buckets=DEFAULT_BUCKETS):
+        self.name = name
+        self.help = help
+        self.labels = tuple(labels)
+        self.buckets = tuple(buckets)
+        self._series = {}  # label values -> [bucket counts..., count, sum]
+        self._lock = threading.Lock()
+
+    def observe(self, value, **labels):
+        key = tuple(labels.get(name, "") for name in self.labels)
+        with self._lock:
+            series = self._series.get(key)
+            if series is None:
+                series = self._series[key] = [0] * (len(self.buckets) + 1) + [0.0]
+            for i, bound in enumerate(self.buckets):
+                if value <= bound:
+                    series[i] += 1
+            series[-2] += 1
+            series[-1] += value
+
+    @contextmanager
+    def time(self, **labels):
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(time.perf_counter() - started, **labels)
+
+    def samples(self):
+        with self._lock:
+            items = [(key, list(series)) for key, series in self._series.items()]
+        for key, series in items:
+            for bound, count in zip(self.buckets, series):
+                yield (
+                    f"{self.name}_bucket",
+                    _label_text(self.labels + ("le",), key + (repr(bound),)),
+                    count,
+                )
+            yield f"{self.name}_bucket", _label_text(self.labels + ("le",), key + ("+Inf",)), series[-2]
+            yield f"{self.name}_count", _label_text(self.labels, key), series[-2]
+            yield f"{self.name}_sum", _label_text(self.labels, key), series[-1]
+
+
+class Registry:
+
+    def __init__(self):
+        self._metrics = {}
+
+    def register(self, metric):
+        self._metrics[metric.name] = metric
+        return metric
+
+    def expose(self):
+        lines = []
+        for metric in self._metrics.values():
+            lines.append(f"# HELP {metric.name} {metric.help}")
+            lines.append(f"# TYPE {metric.name} {metric.kind}")
+            for name, labels, value in metric.samples():
+                lines.append(f"{name}{labels} {value}")
+        return "\n".join(lines) + "\n"
+
+
+registry = Registry()
+
+REQUEST_SECONDS = registry.register(Histogram(
+    "http_request_duration_seconds", "Time spent serving a request.",
+    labels=("method", "endpoint", "status"),
+))
+REQUEST_QUERIES = registry.register(Histogram(
+    "http_request_sql_queries", "SQL statements executed per request.",
+    labels=("endpoint",), buckets=(0, 1, 2, 3, 5, 10, 25, 50, 100),
+))
+SQL_SECONDS = registry.register(Histogram(
+    "sql_query_duration_seconds", "Time spent in a single SQL statement.",
+    labels=("endpoint",),
+))
+TEMPLATE_SECONDS = registry.register(Histogram(
+    "template_render_duration_seconds", "Time spent rendering a template.",
+    labels=("template",),
+))
+CATALOG_LOAD_SECONDS = registry.register(Histogram(
+    "catalog_load_duration_seconds", "Time spent (re)loading an in-memory catalog.",
+    labels=("catalog",),
+))
+SEARCH_SECONDS = registry.register(Histogram(
+    "plant_search_duration_seconds", "Time spent in the plant search engine.",
+    labels=("backend",),
+))
+PASSWORD_HASH_SECONDS = registry.register(Histogram(
+    "password_hash_duration_seconds", "Time spent hashing or checking a password.",
+    labels=("operation",), buckets=(0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5),
+))
+PASSWORD_HASH_REJECTED = registry.register(Counter(
+    "password_hash_rejected_total", "Logins and registrations turned away because hashing was saturated.",
+    labels=("operation",),
+))
+SLOW_REQUESTS = registry.register(Counter(
+    "http_slow_requests_total", "Requests slower than SLOW_REQUEST_SECONDS.",
+    labels=("endpoint",),
+))
+
+
+# ---------- SQL HOOKS ----------
+@event.listens_for(Engine, "before_cursor_execute")
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    conn.info.setdefault("query_started", []).append(time.perf_counter())
+
+
+@event.listens_for(Engine, "after_cursor_execute")
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    started = conn.info["query_started"].pop()
+    elapsed = time.perf_counter() - started
+
+    endpoint = ""
+    if has_request_context():
+        endpoint = request.endpoint or ""
+        queries = g.setdefault("sql_queries", [])
+        queries.append((elapsed, statement))
+    SQL_SECONDS.observe(elapsed, endpoint=endpoint)
+
+
+# ---------- FLASK HOOKS ----------
+def init_instrumentation(app, speech_service=None, password_hasher=None):
+    # `speech_service` and `password_hasher` return the app's SpeechService
+    # and PasswordHasher, or None until a request has built them
+
+    @app.before_request
+    def start_timer():
+        g.request_started = time.perf_counter()
+        g.sql_queries = []
+
+    @app.after_request
+    def record_request(response):
+        started = g.get("request_started")
+        if started is None:
+            return response
+        endpoint = request.endpoint or "unknown"
+        method = request.method
+        path = request.path
+        queries = g.get("sql_queries", [])
+        slow_after = app.config.get("SLOW_REQUEST_SECONDS")
+        if response.mimetype == "text/event-stream":
+            slow_after = None  # event streams stay open by design
+
+        # streamed bodies finish after this hook; observe when they close
+        def observe():
+            elapsed = time.perf_counter() - started
+            REQUEST_SECONDS.observe(elapsed, method=method, endpoint=endpoint, status=response.status_code)
+            REQUEST_QUERIES.observe(len(queries), endpoint=endpoint)
+            if slow_after is not None and elapsed >= slow_after:
+                SLOW_REQUESTS.inc(endpoint=endpoint)
+                slowest = sorted(queries, reverse=True)[:5]
+                slow_log.warning(
+                    "slow request %s %s took %.3fs with %d queries%s",
+                    method, path,
+                    elapsed, len(queries),
+                    "".join(f"\n  {t * 1000:.1f} ms  {sql}" for t, sql in slowest),
+                )
+
+        response.call_on_close(observe)
+        return response
+
+    def template_started(sender, template, context, **extra):
+        g.template_started = time.perf_counter()
+
+    def template_finished(sender, template, context, **extra):
+        started = g.pop("template_started", None)
+        if started is not None:
+            TEMPLATE_SECONDS.observe(time.perf_counter() - started, template=template.name)
+
+    before_render_template.connect(template_started, app, weak=False)
+    template_rendered.connect(template_finished, app, weak=False)
+
+    if speech_service is not None:
+        def speech_gauge(read):
+            def callback():
+                service = speech_service()
+                return read(service) if service is not None else 0
+            return callback
+
+        registry.register(Gauge(
+            "speech_queue_depth", "Replies waiting to be rendered to audio.",
+            speech_gauge(lambda service: service.queue_depth()),
+        ))
+        registry.register(Gauge(
+            "speech_worker_lag_seconds", "Age of the oldest reply waiting for the speech worker.",
+            speech_gauge(lambda service: service.oldest_pending_age()),
+        ))
+        registry.register(Gauge(
+            "speech_dropped_replies", "Replies dropped because the speech queue was full.",
+            speech_gauge(lambda service: service.dropped),
+        ))
+        registry.register(Gauge(
+            "speech_failed_renders", "Replies the speech engine failed to render (see the log).",
+            speech_gauge(lambda service: service.failed),
+        ))
+
+    if password_hasher is not None:
+        registry.register(Gauge(
+            "password_hash_queue_depth", "Password hashes queued or running on the hashing pool.",
+            lambda: password_hasher().pending() if password_hasher() is not None else 0,
+        ))
+
+    @app.route("/metrics")
+    def metrics():
+        return Response(registry.expose(), mimetype="text/plain; version=0.0.4")
@@ -2,6 +2,18 @@ from flask_sqlalchemy import SQLAlchemy
 
 db = SQLAlchemy()
 
+
+# INSERT construct with ON CONFLICT support for the databases we run on
+def dialect_insert(table, dialect_name):
+    if dialect_name == "postgresql":
+        from sqlalchemy.dialects.postgresql import insert
+    elif dialect_name == "sqlite":
+        from sqlalchemy.dialects.sqlite import insert
+    else:
+        raise ValueError(f"Upserts are not supported on {dialect_name}")
+    return insert(table)
+
+
 class MedicinalPlant(db.Model):
     __tablename__ = "medicinal_plant"
 
@@ -11,6 +23,12 @@ class MedicinalPlant(db.Model):
     disease = db.Column(db.Text)
     how_to_use = db.Column(db.Text)
 
+    # natural key used by db_import.py to upsert instead of duplicating rows;
+    # the importer stores a missing disease as '' since NULLs never collide
+    __table_args__ = (
+        db.Index("uq_medicinal_plant_natural_key", "plant_name", "disease", unique=True),
+    )
+
 
 class User(db.Model):
     id = db.Column(db.Integer, primary_key=True)
@@ -22,4 +40,27 @@ class Favorite(db.Model):
     id = db.Column(db.Integer, primary_key=True)
     user_id = db.Column(db.Integer, db.ForeignKey("user.id"))
     plant_id = db.Column(db.Integer, db.ForeignKey("medicinal_plant.id"))
-    
\ No newline at end of file
+
+    # one row per (user, plant); also serves the per-user favorites lookup
+    __table_args__ = (
+        db.Index("uq_favorite_user_plant", "user_id", "plant_id", unique=True),
+    )
+
+
+class PlantFingerprint(db.Model):
+    # hash of the source row last synced into medicinal_plant, so
+    # `db_import.py --sync` only touches rows whose CSV line changed
+    __tablename__ = "plant_fingerprint"
+
+    plant_id = db.Column(db.Integer, db.ForeignKey("medicinal_plant.id"), primary_key=True)
+    fingerprint = db.Column(db.String(32), nullable=False)
+
+
+class DataVersion(db.Model):
+    # bumped by every import or sync that changes medicinal_plant; running
+    # workers poll this one row to know when to rebuild their indexes
+    __tablename__ = "data_version"
+
+    name = db.Column(db.String(50), primary_key=True)
+    version = db.Column(db.Integer, nullable=False, default=0)
+    updated_at = db.Column(db.DateTime)
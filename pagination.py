@@ -0,0 +1,70 @@
+# pagination.py
+
+
+def page_size(requested, default, maximum):
+    try:
+        size = int(requested)
+    except (TypeError, ValueError):
+        return default
+    return max(1, min(size, maximum))
+
+
+def parse_after(value):
+    try:
+        return int(value)
+    except (TypeError, ValueError):
+        return None
+
+
+class KeysetPage:
+    # One page of `stmt` ordered by `key` (an integer column) and starting
+    # after the last key seen. Rows are pulled lazily with yield_per, so a
+    # streamed template renders them without building the whole list.
+    #
+    # The statement runs on first use through the scoped `session`, so a
+    # streamed response queries with the session that its own (re-pushed)
+    # app context will clean up. `next_after` is known once iteration
+    # finishes; templates read it after their loop.
+
+    def __init__(self, session, stmt, key, after=None, size=24, batch=100):
+        if after is not None:
+            stmt = stmt.where(key > after)
+        self._stmt = stmt.order_by(key).limit(size + 1).execution_options(yield_per=batch)
+        self._session = session
+        self._rows = None
+        self._head = []
+        self._key = key.key
+        self.size = size
+        self.next_after = None
+
+    def _next_row(self):
+        if self._rows is None:
+            self._rows = iter(self._session.scalars(self._stmt))
+        return next(self._rows, None)
+
+    def __bool__(self):
+        if not self._head:
+            row = self._next_row()
+            if row is not None:
+                self._head.append(row)
+        return bool(self._head)
+
+    def __iter__(self):
+        seen = 0
+        last = None
+        head, self._head = self._head, []
+        for row in head:
+            seen += 1
+            last = row
+            yield row
+
+        while True:
+            row = self._next_row()
+            if row is None:
+                return
+            if seen == self.size:
+                self.next_after = getattr(last, self._key)
+                return
+            seen += 1
+            last = row
+            yield row
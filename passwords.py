@@ -0,0 +1,125 @@
+# passwords.py
+
+import multiprocessing
+import threading
+from concurrent.futures import ProcessPoolExecutor, TimeoutError
+from concurrent.futures.process import BrokenProcessPool
+
+from werkzeug.security import check_password_hash, generate_password_hash
+
+
+class HasherBusy(Exception):
+    # the hashing queue is full (or a hash timed out); answer 503 + Retry-After
+
+    def __init__(self, retry_after):
+        super().__init__(f"password hashing is saturated, retry in {retry_after}s")
+        self.retry_after = retry_after
+
+
+def full_method(method):
+    # "scrypt" -> "scrypt:32768:8:1", the prefix werkzeug writes into the
+    # hash; raises ValueError for a method werkzeug does not know
+    return generate_password_hash("", method).split("$", 1)[0]
+
+
+class PasswordHasher:
+    # Runs werkzeug's deliberately slow hashing on a small process pool, so
+    # a burst of logins uses at most `workers` cores and never holds the
+    # GIL that /search and /chat share. At most `max_pending` hashes may be
+    # queued or running; past that callers get HasherBusy straight away
+    # instead of waiting. workers=0 hashes on the calling thread (tests) but
+    # keeps the same admission limit.
+    #
+    # `method` is any werkzeug method string ("scrypt", "pbkdf2:sha256",
+    # "scrypt:32768:8:1"); it is expanded to werkzeug's full form once, and
+    # stored hashes with any other prefix are reported by needs_rehash() and
+    # upgraded on the next login. A pool whose worker died is replaced.
+
+    def __init__(self, method="scrypt:32768:8:1", workers=2, max_pending=16, timeout=10, retry_after=2):
+        self.method = full_method(method)
+        self.workers = workers
+        self.max_pending = max_pending
+        self.timeout = timeout
+        self.retry_after = retry_after
+        self._lock = threading.Lock()
+        self._pool = None
+        self._pending = 0
+        self.rejected = 0
+
+    def _get_pool(self):
+        if self._pool is None:
+            with self._lock:
+                if self._pool is None:
+                    # spawn, not fork: the web process has threads (speech
+                    # worker, request threads) that must not be forked
+                    self._pool = ProcessPoolExecutor(
+                        self.workers, mp_context=multiprocessing.get_context("spawn")
+                    )
+        return self._pool
+
+    def _admit(self):
+        with self._lock:
+            if self._pending >= self.max_pending:
+                self.rejected += 1
+                raise HasherBusy(self.retry_after)
+            self._pending += 1
+
+    def _release(self, future=None):
+        with self._lock:
+            self._pending -= 1
+
+    def _run(self, fn, *args):
+        self._admit()
+        if not self.workers:
+            try:
+                return fn(*args)
+            finally:
+                self._release()
+
+        pool = self._get_pool()
+        try:
+            future = pool.submit(fn, *args)
+        except BrokenProcessPool:
+            self._release()
+            self._replace_pool(pool)
+            raise HasherBusy(self.retry_after) from None
+        except BaseException:
+            self._release()
+            raise
+        # the slot is freed when the hash actually finishes, so callers that
+        # time out cannot pile more work onto a saturated pool
+        future.add_done_callback(self._release)
+        try:
+            return future.result(self.timeout)
+        except TimeoutError:
+            with self._lock:
+                self.rejected += 1
+            raise HasherBusy(self.retry_after) from None
+        except BrokenProcessPool:
+            # a worker was killed (OOM, signal); the executor never recovers
+            self._replace_pool(pool)
+            raise HasherBusy(self.retry_after) from None
+
+    def _replace_pool(self, pool):
+        with self._lock:
+            self.rejected += 1
+            if self._pool is pool:
+                self._pool = None
+        pool.shutdown(wait=False, cancel_futures=True)
+
+    def hash(self, password):
+        return self._run(generate_password_hash, password, self.method)
+
+    def check(self, stored, password):
+        return self._run(check_password_hash, stored, password)
+
+    def needs_rehash(self, stored):
+        return stored.split("$", 1)[0] != self.method
+
+    def pending(self):
+        # hashes queued or running right now
+        return self._pending
+
+    def shutdown(self):
+        if self._pool is not None:
+            self._pool.shutdown(wait=False, cancel_futures=True)
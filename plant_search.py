@@ -0,0 +1,233 @@
+# plant_search.py
+
+import re
+import threading
+from bisect import bisect_right
+
+from sqlalchemy import DDL, and_, event, func, literal, or_
+
+from data_version import plants_version
+from models import db, MedicinalPlant
+
+
+# Field weights used by both engines when ranking a match.
+FIELD_WEIGHTS = {
+    "disease": 3.0,
+    "plant_name": 2.0,
+    "local_name": 1.0,
+}
+
+TOKEN_RE = re.compile(r"[a-z0-9']+")
+
+
+def tokenize(text):
+    return TOKEN_RE.findall((text or "").lower())
+
+
+# Ranked results page on (score desc, id asc); the cursor is "score:id".
+def encode_cursor(score, plant_id):
+    return f"{float(score)!r}:{plant_id}"
+
+
+def decode_cursor(cursor):
+    try:
+        score, plant_id = (cursor or "").split(":")
+        return float(score), int(plant_id)
+    except ValueError:
+        return None
+
+
+def trigrams(token):
+    padded = f"  {token} "
+    return {padded[i:i + 3] for i in range(len(padded) - 2)}
+
+
+# ---------- POSTGRES (pg_trgm) ----------
+TRGM_INDEXES = [
+    db.Index(
+        f"ix_medicinal_plant_{field}_trgm",
+        getattr(MedicinalPlant, field),
+        postgresql_using="gin",
+        postgresql_ops={field: "gin_trgm_ops"},
+    ).ddl_if(dialect="postgresql")
+    for field in FIELD_WEIGHTS
+]
+
+event.listen(
+    MedicinalPlant.__table__,
+    "before_create",
+    DDL("CREATE EXTENSION IF NOT EXISTS pg_trgm").execute_if(dialect="postgresql"),
+)
+
+
+class PostgresSearchEngine:
+    # A GIN trigram index lets ILIKE '%x%' and the word-similarity operator
+    # use an index scan instead of reading the whole table.
+
+    name = "postgres"
+
+    def install(self, bind):
+        with bind.begin() as conn:
+            conn.execute(DDL("CREATE EXTENSION IF NOT EXISTS pg_trgm"))
+            for index in TRGM_INDEXES:
+                index.create(conn, checkfirst=True)
+
+    def search(self, query, limit, after=None):
+        query = (query or "").strip().lower()
+        if not query:
+            return [], None
+
+        pattern = f"%{query}%"
+        q = literal(query)
+        columns = {field: getattr(MedicinalPlant, field) for field in FIELD_WEIGHTS}
+
+        rank = func.greatest(*[
+            func.word_similarity(q, func.coalesce(column, "")) * FIELD_WEIGHTS[field]
+            for field, column in columns.items()
+        ])
+        match = or_(*[
+            or_(column.ilike(pattern), q.op("<%")(column))
+            for column in columns.values()
+        ])
+
+        rows = db.session.query(MedicinalPlant, rank.label("rank")).filter(match)
+
+        cursor = decode_cursor(after)
+        if cursor:
+            score, plant_id = cursor
+            rows = rows.filter(or_(
+                rank < score,
+                and_(rank == score, MedicinalPlant.id > plant_id),
+            ))
+
+        rows = rows.order_by(rank.desc(), MedicinalPlant.id).limit(limit + 1).all()
+
+        next_cursor = None
+        if len(rows) > limit:
+            plant, score = rows[limit - 1]
+            next_cursor = encode_cursor(score, plant.id)
+        return [plant for plant, _ in rows[:limit]], next_cursor
+
+
+# ---------- IN-PROCESS FALLBACK ----------
+class MemorySearchEngine:
+    # Token + trigram inverted index over the plant table, rebuilt whenever
+    # the plants data version changes. Meant for SQLite, tests and small
+    # deployments; ranking mirrors the Postgres engine.
+
+    name = "memory"
+    min_similarity = 0.3
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._stamp = None
+        self._postings = {}   # token -> {plant_id: weight}
+        self._grams = {}      # trigram -> {token}
+        self._fields = {}     # plant_id -> {field: lowercase text}
+
+    def install(self, bind):
+        pass
+
+    def _build(self, stamp):
+        postings = {}
+        grams = {}
+        fields = {}
+
+        rows = db.session.query(
+            MedicinalPlant.id, *[getattr(MedicinalPlant, f) for f in FIELD_WEIGHTS]
+        )
+        for row in rows:
+            plant_id = row[0]
+            fields[plant_id] = {}
+            for field, text in zip(FIELD_WEIGHTS, row[1:]):
+                fields[plant_id][field] = (text or "").lower()
+                for token in tokenize(text):
+                    weights = postings.setdefault(token, {})
+                    weights[plant_id] = max(weights.get(plant_id, 0.0), FIELD_WEIGHTS[field])
+
+        for token in postings:
+            for gram in trigrams(token):
+                grams.setdefault(gram, set()).add(token)
+
+        self._postings = postings
+        self._grams = grams
+        self._fields = fields
+        self._stamp = stamp
+
+    def refresh(self):
+        stamp = plants_version()
+        if stamp != self._stamp:
+            with self._lock:
+                if stamp != self._stamp:
+                    self._build(stamp)
+        return self
+
+    def _similar_tokens(self, token):
+        wanted = trigrams(token)
+        counts = {}
+        for gram in wanted:
+            for candidate in self._grams.get(gram, ()):
+                counts[candidate] = counts.get(candidate, 0) + 1
+
+        for candidate, shared in counts.items():
+            if candidate.startswith(token):
+                yield candidate, 1.0
+                continue
+            similarity = shared / len(wanted | trigrams(candidate))
+            if similarity >= self.min_similarity:
+                yield candidate, similarity
+
+    def search(self, query, limit, after=None):
+        query = (query or "").strip().lower()
+        if not query:
+            return [], None
+        self.refresh()
+
+        scores = {}
+        for token in tokenize(query):
+            best = {}
+            for candidate, similarity in self._similar_tokens(token):
+                for plant_id, weight in self._postings[candidate].items():
+                    best[plant_id] = max(best.get(plant_id, 0.0), similarity * weight)
+            for plant_id, score in best.items():
+                scores[plant_id] = scores.get(plant_id, 0.0) + score
+
+        # whole-phrase substring hits (the old ILIKE semantics) rank first
+        for plant_id in scores:
+            for field, text in self._fields[plant_id].items():
+                if query in text:
+                    scores[plant_id] += FIELD_WEIGHTS[field] * 2
+                    break
+
+        ranked = sorted((-score, plant_id) for plant_id, score in scores.items())
+
+        cursor = decode_cursor(after)
+        if cursor:
+            start = bisect_right(ranked, (-cursor[0], cursor[1]))
+            ranked = ranked[start:]
+
+        next_cursor = None
+        if len(ranked) > limit:
+            score, plant_id = ranked[limit - 1]
+            next_cursor = encode_cursor(-score, plant_id)
+
+        ranked = [plant_id for _, plant_id in ranked[:limit]]
+        if not ranked:
+            return [], None
+
+        plants = {p.id: p for p in MedicinalPlant.query.filter(MedicinalPlant.id.in_(ranked))}
+        return [plants[plant_id] for plant_id in ranked if plant_id in plants], next_cursor
+
+
+# ---------- ENGINE SELECTION ----------
+def create_search_engine(backend="auto"):
+    # a new engine per call; extensions.py keeps one per app, so
+    # an in-process index never answers for another app's database
+    if backend == "auto":
+        backend = "postgres" if db.engine.dialect.name == "postgresql" else "memory"
+
+    if backend == "postgres":
+        return PostgresSearchEngine()
+    if backend == "memory":
+        return MemorySearchEngine()
+    raise ValueError(f"Unknown search backend: {backend}")
@@ -0,0 +1,143 @@
+# similarity.py
+
+import numpy as np
+
+from data_version import VersionedIndex
+from disease_aliases import ALIAS_TO_DISEASE, split_diseases
+from models import db, MedicinalPlant
+
+
+def disease_terms(text):
+    # "Cough/Cold" -> {"cough", "cold"}; aliases fold onto their disease
+    return {ALIAS_TO_DISEASE.get(part, part) for part in split_diseases(text)}
+
+
+# ---------- INDEX ----------
+class SimilarityIndex:
+    # Sparse plant x disease incidence (CSR arrays plus the transposed
+    # disease -> plants postings) and the top-k neighbours of every plant,
+    # scored by Jaccard or cosine over shared diseases. Only plants that share
+    # at least one disease are ever scored, so the build cost follows the
+    # number of co-occurrences rather than plants squared.
+
+    def __init__(self, pairs, k=8, metric="jaccard", plant_ids=None):
+        names = {}      # lowercase name -> display name (first seen wins)
+        diseases = {}   # disease -> column
+        profiles = {}   # lowercase name -> {column}
+
+        for plant_name, disease in pairs:
+            if not plant_name:
+                continue
+            key = plant_name.strip().lower()
+            names.setdefault(key, plant_name.strip())
+            profile = profiles.setdefault(key, set())
+            for term in disease_terms(disease):
+                profile.add(diseases.setdefault(term, len(diseases)))
+
+        self.keys = list(names)
+        self.names = [names[key] for key in self.keys]
+        self.row_of = {key: row for row, key in enumerate(self.keys)}
+        self.diseases = sorted(diseases, key=diseases.get)
+        self.plant_ids = plant_ids or {}
+
+        indptr = np.zeros(len(self.keys) + 1, dtype=np.int64)
+        for row, key in enumerate(self.keys):
+            indptr[row + 1] = indptr[row] + len(profiles[key])
+        indices = np.fromiter(
+            (col for key in self.keys for col in sorted(profiles[key])),
+            dtype=np.int32, count=int(indptr[-1]),
+        )
+        self.indptr, self.indices = indptr, indices
+
+        # transpose: disease column -> plant rows
+        rows = np.repeat(np.arange(len(self.keys), dtype=np.int32), np.diff(indptr))
+        order = np.argsort(indices, kind="stable")
+        self.postings = np.split(rows[order], np.cumsum(np.bincount(indices, minlength=len(self.diseases)))[:-1])
+
+        self.neighbours, self.scores = self._top_k(k, metric)
+
+    def _top_k(self, k, metric):
+        n = len(self.keys)
+        sizes = np.diff(self.indptr).astype(np.float64)
+        neighbours = np.full((n, k), -1, dtype=np.int32)
+        scores = np.zeros((n, k), dtype=np.float32)
+
+        for row in range(n):
+            cols = self.indices[self.indptr[row]:self.indptr[row + 1]]
+            if not len(cols):
+                continue
+            candidates, shared = np.unique(
+                np.concatenate([self.postings[col] for col in cols]), return_counts=True
+            )
+            keep = candidates != row
+            candidates, shared = candidates[keep], shared[keep]
+            if not len(candidates):
+                continue
+
+            if metric == "cosine":
+                sim = shared / np.sqrt(sizes[row] * sizes[candidates])
+            else:
+                sim = shared / (sizes[row] + sizes[candidates] - shared)
+
+            take = min(k, len(candidates))
+            top = np.argpartition(-sim, take - 1)[:take]
+            # best score first, ties broken by row order (first appearance in
+            # the data) for stable output
+            top = top[np.lexsort((candidates[top], -sim[top]))]
+            neighbours[row, :take] = candidates[top]
+            scores[row, :take] = sim[top]
+
+        return neighbours, scores
+
+    def profile(self, plant_name):
+        row = self.row_of.get((plant_name or "").strip().lower())
+        if row is None:
+            return []
+        return [self.diseases[col] for col in self.indices[self.indptr[row]:self.indptr[row + 1]]]
+
+    def related(self, plant_name, limit=None):
+        row = self.row_of.get((plant_name or "").strip().lower())
+        if row is None:
+            return []
+
+        mine = set(self.indices[self.indptr[row]:self.indptr[row + 1]])
+        related = []
+        for other, score in zip(self.neighbours[row][:limit], self.scores[row][:limit]):
+            if other < 0:
+                break
+            theirs = self.indices[self.indptr[other]:self.indptr[other + 1]]
+            related.append({
+                "plant_name": self.names[other],
+                "id": self.plant_ids.get(self.keys[other]),
+                "score": float(score),
+                "shared": sorted(self.diseases[col] for col in theirs if col in mine),
+            })
+        return related
+
+    def common_diseases(self, *plant_names):
+        profiles = [set(self.profile(name)) for name in plant_names]
+        if not profiles:
+            return []
+        return sorted(set.intersection(*profiles))
+
+
+# ---------- VERSIONED HOLDER ----------
+class RelatedPlants(VersionedIndex):
+
+    def __init__(self, season_catalog, k=8, metric="jaccard"):
+        super().__init__(season_catalog)
+        self.k = k
+        self.metric = metric
+
+    def build(self, catalog):
+        rows = db.session.query(
+            MedicinalPlant.id, MedicinalPlant.plant_name, MedicinalPlant.disease
+        ).order_by(MedicinalPlant.id).all()
+
+        plant_ids = {}
+        for plant_id, plant_name, _ in rows:
+            plant_ids.setdefault(plant_name.strip().lower(), plant_id)
+
+        pairs = [(r.get("plant_name"), r.get("disease")) for r in catalog.records]
+        pairs.extend((plant_name, disease) for _, plant_name, disease in rows)
+        return SimilarityIndex(pairs, self.k, self.metric, plant_ids)
@@ -0,0 +1,366 @@
+# snapshot.py
+#
+# Compiles the plant data (the season CSV and PLANT_DB) into one
+# binary file that every worker mmaps read-only, so the OS shares the pages
+# and startup is a file open instead of a CSV parse.
+#
+#     python snapshot.py                  # writes data/catalog.snap
+#
+# Layout (little-endian, sections 8-byte aligned):
+#   header      magic, format version, sha256 of the inputs, build time,
+#               section count
+#   sources     "sources" list of "<file name>:<sha256>" per input; a reader
+#               only trusts the snapshot while its inputs still hash the same
+#   directory   (name, offset, length) per section
+#   strings     "strings.off" u32[n + 1] + "strings.dat" utf-8 blob; every
+#               value is stored once and referenced by its id
+#   tables      "<table>.cols" u32 column-name ids and "<table>.rows"
+#               u32[rows * cols] value ids (NULL_ID for missing)
+#   indexes     "<index>.keys" u32 key ids sorted by key, "<index>.start"
+#               u32[keys + 1] into "<index>.post", the u32 row ids
+#   lists       "<list>" u32 string ids
+
+import argparse
+import csv
+import hashlib
+import logging
+import mmap
+import os
+import struct
+import sys
+import time
+from array import array
+from collections.abc import Mapping, Sequence
+
+MAGIC = b"PLANTCAT"
+FORMAT_VERSION = 2
+NULL_ID = 0xFFFFFFFF
+
+HEADER = struct.Struct("<8sI32sdI")
+SECTION = struct.Struct("<24sQQ")
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+SEASON_CSV = os.path.join(HERE, "data", "medicinalseason.csv")
+PLANT_DB_SOURCE = os.path.join(HERE, "plant_db.py")
+# the herb cards and speech text are rendered by chat_matcher at build time
+CHAT_MATCHER_SOURCE = os.path.join(HERE, "chat_matcher.py")
+DEFAULT_OUTPUT = os.path.join(HERE, "data", "catalog.snap")
+
+HERB_COLUMNS = ("name", "scientific_name", "category", "benefits", "how_to_use", "card", "speech")
+
+log = logging.getLogger(__name__)
+
+
+# ---------- READER ----------
+class Record(Mapping):
+    # one row, decoded column by column on access; works in templates both
+    # as `plant.plant_name` and `plant.items()`
+
+    __slots__ = ("_table", "_row")
+
+    def __init__(self, table, row):
+        self._table = table
+        self._row = row
+
+    def __getitem__(self, column):
+        return self._table.value(self._row, self._table.column_index[column])
+
+    def __getattr__(self, column):
+        try:
+            return self[column]
+        except KeyError:
+            raise AttributeError(column) from None
+
+    def __iter__(self):
+        return iter(self._table.columns)
+
+    def __len__(self):
+        return len(self._table.columns)
+
+    def __repr__(self):
+        return f"Record({dict(self)!r})"
+
+
+class Table(Sequence):
+
+    def __init__(self, snapshot, name):
+        self.snapshot = snapshot
+        self.columns = [snapshot.string(sid) for sid in snapshot.u32(f"{name}.cols")]
+        self.column_index = {column: i for i, column in enumerate(self.columns)}
+        self._cells = snapshot.u32(f"{name}.rows")
+
+    def value(self, row, column):
+        return self.snapshot.string(self._cells[row * len(self.columns) + column])
+
+    def __getitem__(self, row):
+        if isinstance(row, slice):
+            return [Record(self, i) for i in range(*row.indices(len(self)))]
+        if row < 0:
+            row += len(self)
+        if not 0 <= row < len(self):
+            raise IndexError(row)
+        return Record(self, row)
+
+    def __len__(self):
+        return len(self._cells) // len(self.columns)
+
+
+class Index(Mapping):
+    # key -> [Record, ...] by binary search over the sorted key ids; a
+    # unique index returns the first record instead of a list
+
+    def __init__(self, snapshot, name, table, unique=False):
+        self.snapshot = snapshot
+        self.table = table
+        self.unique = unique
+        self._keys = snapshot.u32(f"{name}.keys")
+        self._start = snapshot.u32(f"{name}.start")
+        self._post = snapshot.u32(f"{name}.post")
+
+    def _key(self, i):
+        return self.snapshot.string(self._keys[i])
+
+    def _find(self, key):
+        lo, hi = 0, len(self._keys)
+        while lo < hi:
+            mid = (lo + hi) // 2
+            if self._key(mid) < key:
+                lo = mid + 1
+            else:
+                hi = mid
+        if lo < len(self._keys) and self._key(lo) == key:
+            return lo
+        return None
+
+    def __getitem__(self, key):
+        i = self._find(key) if isinstance(key, str) else None
+        if i is None:
+            raise KeyError(key)
+        rows = self._post[self._start[i]:self._start[i + 1]]
+        if self.unique:
+            return Record(self.table, rows[0])
+        return [Record(self.table, row) for row in rows]
+
+    def __iter__(self):
+        return (self._key(i) for i in range(len(self._keys)))
+
+    def __len__(self):
+        return len(self._keys)
+
+    def column(self, column):
+        return ColumnView(self, column)
+
+
+class ColumnView(Mapping):
+    # key -> one column of a unique index, e.g. plant name -> card html
+
+    def __init__(self, index, column):
+        self.index = index
+        self.column = column
+
+    def __getitem__(self, key):
+        return self.index[key][self.column]
+
+    def __iter__(self):
+        return iter(self.index)
+
+    def __len__(self):
+        return len(self.index)
+
+
+class Snapshot:
+
+    def __init__(self, path):
+        self.path = path
+        with open(path, "rb") as f:
+            self._mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        view = memoryview(self._mmap)
+
+        magic, version, digest, built_at, count = HEADER.unpack_from(view, 0)
+        if magic != MAGIC or version != FORMAT_VERSION:
+            raise ValueError(f"{path} is not a version {FORMAT_VERSION} plant catalog snapshot")
+        if sys.byteorder != "little":
+            raise ValueError("catalog snapshots are little-endian only")
+
+        self.digest = digest.hex()
+        self.built_at = built_at
+        self._sections = {}
+        for i in range(count):
+            name, offset, length = SECTION.unpack_from(view, HEADER.size + i * SECTION.size)
+            self._sections[name.rstrip(b"\0").decode("ascii")] = view[offset:offset + length]
+
+        self._string_offsets = self.u32("strings.off")
+        self._string_data = self._sections["strings.dat"]
+        self.sources = dict(entry.rpartition(":")[::2] for entry in self.strings("sources"))
+
+    def u32(self, section):
+        return self._sections[section].cast("I")
+
+    def string(self, sid):
+        if sid == NULL_ID:
+            return None
+        return str(self._string_data[self._string_offsets[sid]:self._string_offsets[sid + 1]], "utf-8")
+
+    def strings(self, section):
+        return [self.string(sid) for sid in self.u32(section)]
+
+    def table(self, name):
+        return Table(self, name)
+
+    def index(self, name, table, unique=False):
+        return Index(self, name, table, unique)
+
+
+def file_digest(path):
+    with open(path, "rb") as f:
+        return hashlib.sha256(f.read()).hexdigest()
+
+
+def open_snapshot(path, *sources):
+    # None when the snapshot is missing, unreadable or was built from other
+    # contents of any of `sources`; callers then fall back to reading the
+    # sources directly
+    try:
+        snapshot = Snapshot(path)
+        for source in sources:
+            if snapshot.sources.get(os.path.basename(source)) != file_digest(source):
+                log.warning("%s was built from a different %s; run `python snapshot.py`", path, source)
+                return None
+        return snapshot
+    except FileNotFoundError:
+        return None
+    except (OSError, ValueError, KeyError, struct.error) as exc:
+        log.warning("ignoring catalog snapshot %s: %s", path, exc)
+        return None
+
+
+# ---------- BUILDER ----------
+class Builder:
+
+    def __init__(self):
+        self._ids = {}
+        self._strings = []
+        self.sections = {}
+
+    def sid(self, value):
+        if value is None:
+            return NULL_ID
+        sid = self._ids.get(value)
+        if sid is None:
+            sid = self._ids[value] = len(self._strings)
+            self._strings.append(value)
+        return sid
+
+    def add_list(self, name, values):
+        self.sections[name] = array("I", (self.sid(value) for value in values))
+
+    def add_table(self, name, columns, rows):
+        self.sections[f"{name}.cols"] = array("I", (self.sid(column) for column in columns))
+        self.sections[f"{name}.rows"] = array("I", (self.sid(row.get(column)) for row in rows for column in columns))
+
+    def add_index(self, name, rows, key):
+        postings = {}
+        for i, row in enumerate(rows):
+            value = key(row)
+            if value is not None:
+                postings.setdefault(value, []).append(i)
+
+        keys, start, post = array("I"), array("I", [0]), array("I")
+        for value in sorted(postings):
+            keys.append(self.sid(value))
+            post.extend(postings[value])
+            start.append(len(post))
+        self.sections[f"{name}.keys"] = keys
+        self.sections[f"{name}.start"] = start
+        self.sections[f"{name}.post"] = post
+
+    def write(self, path, digest):
+        offsets, data = array("I", [0]), bytearray()
+        for value in self._strings:
+            data += value.encode("utf-8")
+            offsets.append(len(data))
+        sections = {"strings.off": offsets.tobytes(), "strings.dat": bytes(data)}
+        sections.update((name, values.tobytes()) for name, values in self.sections.items())
+
+        position = HEADER.size + SECTION.size * len(sections)
+        directory, blobs = [], []
+        for name, blob in sections.items():
+            position += -position % 8
+            directory.append(SECTION.pack(name.encode("ascii"), position, len(blob)))
+            blobs.append((position, blob))
+            position += len(blob)
+
+        # write beside the target and rename, so running workers keep their
+        # mapping of the old file and pick the new one up on refresh
+        tmp_path = f"{path}.{os.getpid()}.tmp"
+        with open(tmp_path, "wb") as f:
+            f.write(HEADER.pack(MAGIC, FORMAT_VERSION, digest, time.time(), len(sections)))
+            f.write(b"".join(directory))
+            for offset, blob in blobs:
+                f.write(b"\0" * (offset - f.tell()))
+                f.write(blob)
+        os.replace(tmp_path, path)
+
+
+def read_csv(path):
+    with open(path, newline="", encoding="utf-8") as f:
+        reader = csv.DictReader(f)
+        rows = [{k: (v.strip() or None) if v is not None else None for k, v in row.items()} for row in reader]
+        return reader.fieldnames, rows
+
+
+def name_key(row):
+    name = row.get("plant_name")
+    return name.lower() if name else None
+
+
+def build(output=DEFAULT_OUTPUT, season_csv=SEASON_CSV):
+    from chat_matcher import _render_card, _render_speech
+    from plant_db import PLANT_DB
+
+    builder = Builder()
+
+    digest = hashlib.sha256()
+    sources = []
+    for path in (season_csv, PLANT_DB_SOURCE, CHAT_MATCHER_SOURCE):
+        with open(path, "rb") as f:
+            data = f.read()
+        digest.update(data)
+        sources.append(f"{os.path.basename(path)}:{hashlib.sha256(data).hexdigest()}")
+    builder.add_list("sources", sources)
+
+    season_columns, seasons = read_csv(season_csv)
+    builder.add_table("seasons", season_columns, seasons)
+    builder.add_index("seasons.by_season", seasons, lambda row: row.get("season"))
+    builder.add_index("seasons.by_name", seasons, name_key)
+    builder.add_list("seasons.plant_names", sorted({row["plant_name"] for row in seasons if row.get("plant_name")}))
+
+    herbs = [
+        dict(zip(HERB_COLUMNS, (name, *details, _render_card(name, details), _render_speech(name, details))))
+        for name, details in PLANT_DB.items()
+    ]
+    builder.add_table("herbs", HERB_COLUMNS, herbs)
+    builder.add_index("herbs.by_name", herbs, lambda row: row["name"])
+
+    builder.write(output, digest.digest())
+    return output
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Compile the season CSV and PLANT_DB into a binary snapshot.")
+    parser.add_argument("--output", default=DEFAULT_OUTPUT)
+    parser.add_argument("--season-csv", default=SEASON_CSV)
+    args = parser.parse_args(argv)
+
+    started = time.perf_counter()
+    path = build(args.output, args.season_csv)
+    snapshot = Snapshot(path)
+    print(
+        f"✅ {path}: {os.path.getsize(path):,} bytes, "
+        f"{len(snapshot.table('seasons'))} season rows, "
+        f"{len(snapshot.table('herbs'))} herbs in {time.perf_counter() - started:.2f} s"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,220 @@
+# speech.py
+
+import hashlib
+import logging
+import os
+import threading
+import time
+import wave
+from collections import OrderedDict
+
+log = logging.getLogger(__name__)
+
+
+# ---------- ENGINES ----------
+class NullSpeechEngine:
+    # Writes a short silent clip. Used for tests, benchmarks and headless
+    # hosts without a TTS driver.
+
+    name = "null"
+
+    def render(self, text, path):
+        with wave.open(path, "wb") as clip:
+            clip.setnchannels(1)
+            clip.setsampwidth(2)
+            clip.setframerate(8000)
+            clip.writeframes(b"\x00\x00" * 800)
+
+
+class Pyttsx3SpeechEngine:
+    # pyttsx3 is imported and initialised on first render, inside the
+    # worker thread that owns it, so importing the app never touches it.
+
+    name = "pyttsx3"
+
+    def __init__(self, voice_index=0, rate=None):
+        self.voice_index = voice_index
+        self.rate = rate
+        self._engine = None
+
+    def _get_engine(self):
+        if self._engine is None:
+            import pyttsx3
+
+            engine = pyttsx3.init()
+            voices = engine.getProperty("voices")
+            if voices:
+                engine.setProperty("voice", voices[self.voice_index % len(voices)].id)
+            if self.rate:
+                engine.setProperty("rate", self.rate)
+            self._engine = engine
+        return self._engine
+
+    def render(self, text, path):
+        engine = self._get_engine()
+        engine.save_to_file(text, path)
+        engine.runAndWait()
+
+
+ENGINES = {
+    "null": NullSpeechEngine,
+    "pyttsx3": Pyttsx3SpeechEngine,
+}
+
+
+# ---------- SERVICE ----------
+class SpeechService:
+    # Renders replies to audio files named by a hash of text + voice
+    # settings. Clips live in a size-bounded on-disk LRU; pending renders sit
+    # in a bounded queue where duplicates coalesce and the oldest request is
+    # dropped when the queue is full.
+
+    extension = ".wav"
+
+    def __init__(self, cache_dir, engine="pyttsx3", voice_index=0, rate=None,
+                 max_bytes=200 * 1024 * 1024, queue_size=32):
+        self.cache_dir = cache_dir
+        self.max_bytes = max_bytes
+        self.queue_size = queue_size
+
+        if engine == "pyttsx3":
+            self.engine = Pyttsx3SpeechEngine(voice_index=voice_index, rate=rate)
+        else:
+            self.engine = ENGINES[engine]()
+        self._settings = f"{self.engine.name}:{voice_index}:{rate}"
+
+        self._cond = threading.Condition()
+        self._pending = OrderedDict()   # key -> (text, enqueued at)
+        self._clips = None              # key -> size, oldest first
+        self._rendering = None          # key the worker is rendering now
+        self._cache_bytes = 0
+        self._worker = None
+
+        self.dropped = 0
+        self.rendered = 0
+        self.failed = 0
+
+    def key_for(self, text):
+        digest = hashlib.sha256(f"{self._settings}\n{text}".encode("utf-8"))
+        return digest.hexdigest()[:32]
+
+    def path_for(self, key):
+        return os.path.join(self.cache_dir, key + self.extension)
+
+    def _scan_cache(self):
+        # called with self._cond held
+        if self._clips is not None:
+            return
+        os.makedirs(self.cache_dir, exist_ok=True)
+        entries = []
+        for entry in os.scandir(self.cache_dir):
+            if entry.name.endswith(self.extension):
+                stat = entry.stat()
+                entries.append((stat.st_mtime, entry.name[:-len(self.extension)], stat.st_size))
+        entries.sort()
+        self._clips = OrderedDict((key, size) for _, key, size in entries)
+        self._cache_bytes = sum(self._clips.values())
+
+    def _ensure_worker(self):
+        if self._worker is None or not self._worker.is_alive():
+            self._worker = threading.Thread(target=self._run, name="speech-worker", daemon=True)
+            self._worker.start()
+
+    # ---------- PUBLIC API ----------
+    def request(self, text):
+        key = self.key_for(text)
+        with self._cond:
+            self._scan_cache()
+            if key in self._clips:
+                self._clips.move_to_end(key)
+                return key
+            if key in self._pending or key == self._rendering:
+                return key
+
+            if len(self._pending) >= self.queue_size:
+                self._pending.popitem(last=False)
+                self.dropped += 1
+            self._pending[key] = (text, time.monotonic())
+            self._ensure_worker()
+            # wait() callers share the condition, so wake everyone
+            self._cond.notify_all()
+        return key
+
+    def status(self, key):
+        with self._cond:
+            self._scan_cache()
+            if key in self._clips:
+                self._clips.move_to_end(key)
+                return "ready"
+            if key in self._pending or key == self._rendering:
+                return "pending"
+        return "missing"
+
+    def wait(self, key, timeout):
+        # block until the clip is rendered, dropped or the timeout passes;
+        # returns the final status
+        deadline = time.monotonic() + timeout
+        with self._cond:
+            self._scan_cache()
+            while key in self._pending or key == self._rendering:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    return "pending"
+                self._cond.wait(remaining)
+            return "ready" if key in self._clips else "missing"
+
+    def queue_depth(self):
+        with self._cond:
+            return len(self._pending)
+
+    def oldest_pending_age(self):
+        with self._cond:
+            if not self._pending:
+                return 0.0
+            _, enqueued = next(iter(self._pending.values()))
+        return time.monotonic() - enqueued
+
+    # ---------- WORKER ----------
+    def _run(self):
+        while True:
+            with self._cond:
+                while not self._pending:
+                    self._cond.wait()
+                key, (text, _) = self._pending.popitem(last=False)
+                self._rendering = key
+
+            path = self.path_for(key)
+            tmp_path = f"{path}.{threading.get_ident()}.tmp"
+            try:
+                self.engine.render(text, tmp_path)
+                os.replace(tmp_path, path)
+            except Exception:
+                # e.g. no working pyttsx3 driver on a headless host; the
+                # clip then 404s, so say why here
+                log.exception("%s engine failed to render speech clip %s", self.engine.name, key)
+                if os.path.exists(tmp_path):
+                    os.remove(tmp_path)
+                with self._cond:
+                    self.failed += 1
+                    self._rendering = None
+                    self._cond.notify_all()
+                continue
+
+            with self._cond:
+                size = os.path.getsize(path)
+                self._clips[key] = size
+                self._cache_bytes += size
+                self.rendered += 1
+                self._rendering = None
+                self._evict()
+                self._cond.notify_all()
+
+    def _evict(self):
+        # called with self._cond held
+        while self._cache_bytes > self.max_bytes and len(self._clips) > 1:
+            key, size = self._clips.popitem(last=False)
+            self._cache_bytes -= size
+            try:
+                os.remove(self.path_for(key))
+            except FileNotFoundError:
+                pass
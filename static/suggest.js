@@ -0,0 +1,38 @@
+// Typeahead for inputs marked data-suggest="plant" or "disease": each
+// keystroke asks /suggest for the best matches and fills a <datalist>.
+
+document.querySelectorAll("input[data-suggest]").forEach((input, n) => {
+    const list = document.createElement("datalist");
+    list.id = "suggest-" + n;
+    input.setAttribute("list", list.id);
+    input.after(list);
+
+    let timer = null;
+    let pending = null;
+
+    input.addEventListener("input", () => {
+        clearTimeout(timer);
+        timer = setTimeout(() => {
+            const q = input.value.trim();
+            if(!q) return;
+
+            // only the latest keystroke's answer matters
+            if(pending) pending.abort();
+            pending = new AbortController();
+
+            fetch(`/suggest?kind=${input.dataset.suggest}&q=${encodeURIComponent(q)}`, {signal: pending.signal})
+            .then(r => r.json())
+            .then(data => {
+                list.replaceChildren(...data.suggestions.map(s => {
+                    const option = document.createElement("option");
+                    // fill in what the server resolves (a local name or
+                    // alias inserts its plant / disease), show what matched
+                    option.value = s.value;
+                    if(s.value !== s.text) option.label = s.text;
+                    return option;
+                }));
+            })
+            .catch(() => {});
+        }, 60);
+    });
+});
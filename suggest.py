@@ -0,0 +1,128 @@
+# suggest.py
+
+from bisect import bisect_left
+
+from sqlalchemy import func
+
+from data_version import VersionedIndex
+from disease_aliases import DISEASE_ALIASES, tokenize
+from models import db, Favorite, MedicinalPlant
+
+# how much each source adds to a term's popularity
+ROW_WEIGHT = 1
+FAVORITE_WEIGHT = 3
+LOCAL_NAME_WEIGHT = 0.5
+ALIAS_WEIGHT = 0.5
+
+
+# ---------- INDEX ----------
+class SuggestIndex:
+    # Sorted array of (lowercase key, term id) over every word start of every
+    # term, so "gou" finds "Bitter Gourd". A prefix query is a bisect plus a
+    # scan of the matching slice; prefixes up to `cached_prefix` characters
+    # have their best terms precomputed because those slices are the long ones.
+
+    def __init__(self, terms, limit=10, cached_prefix=2):
+        # terms: {(kind, lowercase text): (weight, text, value)}
+        ordered = sorted(terms.items(), key=lambda item: (-item[1][0], item[0][1]))
+        self.terms = [
+            {"text": text, "kind": kind, "value": value}
+            for (kind, _), (_, text, value) in ordered
+        ]
+        self.limit = limit
+
+        # rank = term id, pushed behind every whole-term match when the key
+        # starts at an inner word
+        inner = len(self.terms)
+        entries = set()
+        for term_id, term in enumerate(self.terms):
+            words = tokenize(term["text"])
+            for start in range(len(words)):
+                entries.add((" ".join(words[start:]), term_id + (inner if start else 0)))
+        entries = sorted(entries)
+        self.keys = [key for key, _ in entries]
+        self.ranks = [rank for _, rank in entries]
+
+        # terms are ordered by weight, so the smallest ranks are the best
+        self.cached_prefix = cached_prefix
+        top = {}
+        for key, rank in entries:
+            kind = self.terms[rank % inner]["kind"]
+            for length in range(1, min(cached_prefix, len(key)) + 1):
+                top.setdefault((None, key[:length]), set()).add(rank)
+                top.setdefault((kind, key[:length]), set()).add(rank)
+        self._top = {cache_key: self._best(ranks, limit) for cache_key, ranks in top.items()}
+
+    def _best(self, ranks, limit):
+        found = []
+        for rank in sorted(ranks):
+            term_id = rank % len(self.terms)
+            if term_id not in found:
+                found.append(term_id)
+                if len(found) == limit:
+                    break
+        return found
+
+    def suggest(self, query, kind=None, limit=None):
+        prefix = " ".join(tokenize(query))
+        if not prefix:
+            return []
+        # clamp to 1..self.limit (a negative limit would slice from the end)
+        limit = self.limit if limit is None else max(1, min(limit, self.limit))
+
+        if len(prefix) <= self.cached_prefix:
+            found = self._top.get((kind, prefix), [])[:limit]
+        else:
+            lo = bisect_left(self.keys, prefix)
+            hi = bisect_left(self.keys, prefix + "\uffff", lo)
+            found = self._best(
+                (rank for rank in self.ranks[lo:hi]
+                 if kind is None or self.terms[rank % len(self.terms)]["kind"] == kind),
+                limit,
+            )
+
+        return [self.terms[term_id] for term_id in found]
+
+
+# ---------- VERSIONED HOLDER ----------
+def add_term(terms, kind, text, weight, value=None):
+    text = (text or "").strip()
+    if not text:
+        return
+    key = (kind, text.lower())
+    previous, display, previous_value = terms.get(key, (0, text, None))
+    terms[key] = (previous + weight, display, previous_value or value or text)
+
+
+class Suggestions(VersionedIndex):
+    # Weights: one per data row mentioning a term (half for local names),
+    # FAVORITE_WEIGHT per saved favorite and ALIAS_WEIGHT for synonyms.
+    # Typeahead calls refresh() on every keystroke, so the data version is
+    # only re-read every `recheck_seconds`.
+
+    def __init__(self, season_catalog, limit=10, recheck_seconds=5):
+        super().__init__(season_catalog, recheck_seconds)
+        self.limit = limit
+
+    def build(self, catalog):
+        terms = {}
+
+        rows = [
+            (r.get("plant_name"), r.get("local_name"), r.get("disease"), 0) for r in catalog.records
+        ]
+        rows.extend(db.session.query(
+            MedicinalPlant.plant_name, MedicinalPlant.local_name, MedicinalPlant.disease,
+            func.count(Favorite.id),
+        ).outerjoin(Favorite, Favorite.plant_id == MedicinalPlant.id).group_by(MedicinalPlant.id))
+
+        for plant_name, local_name, disease, favorites in rows:
+            weight = ROW_WEIGHT + FAVORITE_WEIGHT * favorites
+            add_term(terms, "plant", plant_name, weight)
+            add_term(terms, "plant", local_name, weight * LOCAL_NAME_WEIGHT, value=plant_name)
+            add_term(terms, "disease", disease, weight)
+
+        for disease, aliases in DISEASE_ALIASES.items():
+            for alias in aliases:
+                add_term(terms, "disease", alias, ALIAS_WEIGHT, value=disease)
+
+        return SuggestIndex(terms, self.limit)
@@ -0,0 +1,55 @@
+import os
+
+import pytest
+
+import db_import
+from app import create_app
+from models import db
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+SEASON_CSV = os.path.join(ROOT, "data", "medicinalseason.csv")
+SOURCES = [os.path.join(ROOT, source) for source in db_import.DEFAULT_SOURCES]
+
+USER = ("tester", "tester-password")
+
+
+@pytest.fixture
+def app(tmp_path):
+    # empty schema on a throwaway SQLite file; nothing is written under the repo
+    app = create_app({
+        "TESTING": True,
+        "SQLALCHEMY_DATABASE_URI": f"sqlite:///{tmp_path / 'plants.db'}",
+        "SEASON_CSV": SEASON_CSV,
+        "CATALOG_SNAPSHOT": str(tmp_path / "catalog.snap"),
+        "SPEECH_ENGINE": "null",
+        "SPEECH_CACHE_DIR": str(tmp_path / "speech"),
+        "PASSWORD_HASH_METHOD": "pbkdf2:sha256:1000",
+        "PASSWORD_HASH_WORKERS": 0,
+        "TEMPLATE_BYTECODE_CACHE_DIR": None,
+    })
+    with app.app_context():
+        db.create_all()
+    yield app
+    with app.app_context():
+        db.engine.dispose()
+
+
+@pytest.fixture
+def seeded_app(app):
+    # the app with both CSVs under data/ imported
+    with app.app_context():
+        db_import.import_csv(db.engine, SOURCES, report=lambda line: None)
+    return app
+
+
+@pytest.fixture
+def client(seeded_app):
+    return seeded_app.test_client()
+
+
+@pytest.fixture
+def user_client(client):
+    # a client logged in as a freshly registered user
+    client.post("/register", data={"username": USER[0], "password": USER[1]})
+    client.post("/login", data={"username": USER[0], "password": USER[1]})
+    return client
@@ -0,0 +1,35 @@
+import pytest
+
+from chat_matcher import NOT_FOUND, ChatAnswers, PlantMatcher
+
+
+@pytest.fixture
+def matcher():
+    return PlantMatcher(["Mint", "Peppermint", "Neem", "Tulsi", "Aloe Vera", "Aloe"])
+
+
+def test_longest_name_wins_over_a_name_inside_it(matcher):
+    assert matcher.find_all("is peppermint good for digestion") == ["Peppermint"]
+    assert matcher.find_all("aloe vera gel") == ["Aloe Vera"]
+
+
+def test_names_only_match_whole_words(matcher):
+    assert matcher.find_all("mintage and neemish") == []
+    assert matcher.find_all("spearmint") == []
+    assert matcher.find_all("mint, neem.") == ["Mint", "Neem"]
+
+
+def test_every_plant_in_message_order(matcher):
+    assert matcher.find_all("tulsi or peppermint or mint or tulsi again") == ["Tulsi", "Peppermint", "Mint"]
+
+
+def test_answers_join_cards_in_message_order(tmp_path):
+    answers = ChatAnswers(str(tmp_path / "missing.snap"))
+
+    parts = answers.answer_parts("Tell me about  NEEM and Peppermint")
+    html, speech = answers.answer("Tell me about  NEEM and Peppermint")
+
+    assert [plant for plant, _, _ in parts] == ["Neem", "Peppermint"]
+    assert html == "<hr>".join(card for _, card, _ in parts)
+    assert speech.index("Neem.") < speech.index("Peppermint.")
+    assert answers.answer("hello there") == (NOT_FOUND, NOT_FOUND)
@@ -0,0 +1,37 @@
+import json
+
+
+def events(response):
+    # [(event, data)] from a text/event-stream body
+    parsed = []
+    for block in response.get_data(as_text=True).strip().split("\n\n"):
+        lines = dict(line.split(": ", 1) for line in block.splitlines())
+        parsed.append((lines["event"], json.loads(lines["data"])))
+    return parsed
+
+
+def test_stream_sends_cards_then_audio_then_end(client):
+    response = client.get("/chat/stream?msg=neem and peppermint please")
+
+    assert response.mimetype == "text/event-stream"
+    assert response.headers["Cache-Control"] == "no-cache"
+    sent = events(response)
+    kinds = [event for event, _ in sent]
+    assert kinds == ["card", "card", "audio", "audio", "end"]
+
+    cards = [data for event, data in sent if event == "card"]
+    audio = [data for event, data in sent if event == "audio"]
+    assert [card["plant"] for card in cards] == ["Neem", "Peppermint"]
+    assert [card["index"] for card in cards] == [0, 1]
+    assert "<b>Neem</b>" in cards[0]["html"]
+    assert [clip["url"] for clip in audio] == [card["audio"] for card in cards]
+    assert [clip["status"] for clip in audio] == ["ready", "ready"]
+    assert client.get(audio[0]["url"]).status_code == 200
+
+
+def test_stream_without_a_match_sends_the_not_found_card(client):
+    sent = events(client.get("/chat/stream?msg=hello"))
+
+    assert [event for event, _ in sent] == ["card", "audio", "end"]
+    assert sent[0][1]["plant"] is None
+    assert "don’t have information" in sent[0][1]["html"]
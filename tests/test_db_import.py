@@ -0,0 +1,96 @@
+import csv
+
+import pytest
+from sqlalchemy import create_engine, select, text
+
+import db_import
+
+
+def write_csv(path, rows):
+    with open(path, "w", newline="", encoding="utf-8") as f:
+        writer = csv.DictWriter(f, db_import.COLUMNS)
+        writer.writeheader()
+        writer.writerows(rows)
+    return str(path)
+
+
+def plant_rows(engine):
+    with engine.connect() as conn:
+        return conn.execute(
+            select(*[db_import.plants.c[c] for c in db_import.COLUMNS]).order_by(db_import.plants.c.id)
+        ).mappings().all()
+
+
+@pytest.fixture
+def engine(tmp_path):
+    return create_engine(f"sqlite:///{tmp_path / 'plants.db'}")
+
+
+NEEM = {"plant_name": "Neem", "local_name": "Azadirachta indica", "disease": "Diabetes", "how_to_use": "Leaf juice"}
+
+
+def test_sync_after_bulk_import_restores_source(engine, tmp_path):
+    original = write_csv(tmp_path / "original.csv", [NEEM])
+    edited = write_csv(tmp_path / "edited.csv", [{**NEEM, "how_to_use": "EDITED"}])
+
+    db_import.sync_csv(engine, [original], report=lambda line: None)
+    db_import.import_csv(engine, [edited], report=lambda line: None)
+    inserted, updated, deleted = db_import.sync_csv(engine, [original], report=lambda line: None)
+
+    assert (inserted, updated, deleted) == (0, 1, 0)
+    assert [row["how_to_use"] for row in plant_rows(engine)] == ["Leaf juice"]
+
+
+def test_sync_applies_only_changes(engine, tmp_path):
+    tulsi = {"plant_name": "Tulsi", "local_name": "Holy Basil", "disease": "Cold", "how_to_use": "Tea"}
+    first = write_csv(tmp_path / "first.csv", [NEEM, tulsi])
+    second = write_csv(tmp_path / "second.csv", [{**NEEM, "how_to_use": "Paste"}])
+
+    assert db_import.sync_csv(engine, [first], report=lambda line: None) == (2, 0, 0)
+    assert db_import.sync_csv(engine, [first], report=lambda line: None) == (0, 0, 0)
+    assert db_import.sync_csv(engine, [second], delete_missing=True, report=lambda line: None) == (0, 1, 1)
+    assert [row["how_to_use"] for row in plant_rows(engine)] == ["Paste"]
+
+
+def test_sync_keeps_rows_missing_from_the_sources_by_default(engine, tmp_path):
+    tulsi = {"plant_name": "Tulsi", "local_name": "Holy Basil", "disease": "Cold", "how_to_use": "Tea"}
+    neem_only = write_csv(tmp_path / "neem.csv", [NEEM])
+    tulsi_only = write_csv(tmp_path / "tulsi.csv", [tulsi])
+
+    db_import.sync_csv(engine, [neem_only], report=lambda line: None)
+    with engine.begin() as conn:
+        conn.execute(text("INSERT INTO user (id, username, password) VALUES (1, 'u', 'x')"))
+        conn.execute(db_import.favorites.insert().values(user_id=1, plant_id=1))
+
+    assert db_import.sync_csv(engine, [tulsi_only], report=lambda line: None) == (1, 0, 0)
+    assert [row["plant_name"] for row in plant_rows(engine)] == ["Neem", "Tulsi"]
+
+    assert db_import.sync_csv(engine, [tulsi_only], delete_missing=True, report=lambda line: None) == (0, 0, 1)
+    with engine.connect() as conn:
+        assert conn.execute(select(db_import.favorites.c.plant_id)).all() == []
+    assert [row["plant_name"] for row in plant_rows(engine)] == ["Tulsi"]
+
+
+def test_rows_without_disease_import_once(engine, tmp_path):
+    source = write_csv(tmp_path / "no_disease.csv", [{**NEEM, "disease": ""}])
+
+    for _ in range(3):
+        db_import.import_csv(engine, [source], report=lambda line: None)
+
+    assert [row["disease"] for row in plant_rows(engine)] == [""]
+
+
+def test_null_disease_duplicates_are_folded(engine):
+    with engine.begin() as conn:
+        db_import.ensure_schema(conn)
+        for _ in range(2):
+            conn.execute(db_import.plants.insert().values({**NEEM, "disease": None}))
+        conn.execute(text("INSERT INTO user (id, username, password) VALUES (1, 'u', 'x')"))
+        conn.execute(db_import.favorites.insert(), [{"user_id": 1, "plant_id": 1}, {"user_id": 1, "plant_id": 2}])
+
+    with engine.begin() as conn:
+        db_import.ensure_schema(conn)
+        favorites = conn.execute(select(db_import.favorites.c.plant_id)).scalars().all()
+
+    assert [row["disease"] for row in plant_rows(engine)] == [""]
+    assert favorites == [1]
@@ -0,0 +1,28 @@
+import pytest
+
+from disease_aliases import disease_candidates, normalize_disease
+
+
+@pytest.mark.parametrize("text, disease", [
+    ("i have high bp", "hypertension"),
+    ("High Blood Pressure", "hypertension"),
+    ("sugar problm", "diabetes"),
+    ("diabetis", "diabetes"),
+])
+def test_free_text_normalizes_to_the_canonical_disease(text, disease):
+    assert normalize_disease(text) == disease
+
+
+def test_unknown_input_is_returned_unchanged():
+    assert normalize_disease("  Zqxv Syndrome ") == "zqxv syndrome"
+    assert disease_candidates("zqxv syndrome") == ()
+
+
+def test_candidates_are_ranked():
+    candidates = disease_candidates("high bp and sugar problm")
+    diseases = [disease for disease, _ in candidates]
+    scores = [score for _, score in candidates]
+
+    # the exact alias beats the typo match
+    assert diseases[:2] == ["hypertension", "diabetes"]
+    assert scores == sorted(scores, reverse=True)
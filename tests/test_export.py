@@ -0,0 +1,128 @@
+import csv
+import io
+import json
+
+import pytest
+
+from export import PLANT_FIELDS, SEASON_FIELDS
+from extensions import facets
+from models import db, MedicinalPlant
+
+
+@pytest.fixture
+def user(user_client):
+    user_client.application.config["EXPORT_BATCH_SIZE"] = 7  # several chunks per export
+    return user_client
+
+
+def plant_records(app, *where):
+    with app.app_context():
+        plants = db.session.scalars(
+            db.select(MedicinalPlant).where(*where).order_by(MedicinalPlant.id)
+        ).all()
+        return [{field: getattr(plant, field) for field in PLANT_FIELDS} for plant in plants]
+
+
+def read_csv(response):
+    return list(csv.DictReader(io.StringIO(response.get_data(as_text=True))))
+
+
+def read_ndjson(response):
+    return [json.loads(line) for line in response.get_data(as_text=True).splitlines()]
+
+
+def as_csv(records, fields):
+    # what a CSV reader gives back: strings, seasons joined with ";"
+    rows = []
+    for record in records:
+        row = {field: record.get(field) for field in fields}
+        if isinstance(row.get("seasons"), list):
+            row["seasons"] = ";".join(row["seasons"])
+        rows.append({field: "" if value is None else str(value) for field, value in row.items()})
+    return rows
+
+
+# ---------- LOOKUP ----------
+def test_lookup_mixes_ids_and_names(user):
+    neem, tulsi = plant_records(user.application, MedicinalPlant.plant_name.in_(["Neem", "Tulsi"]))[:2]
+
+    response = user.post("/api/plants/lookup", json={
+        "ids": [neem["id"], str(neem["id"]), 999999],
+        "names": ["tulsi", "Not A Plant"],
+    })
+
+    assert response.status_code == 200
+    body = response.get_json()
+    found = {(plant["id"], plant["plant_name"]) for plant in body["plants"]}
+    assert (neem["id"], "Neem") in found
+    assert (tulsi["id"], "Tulsi") in found
+    assert body["missing_ids"] == [999999]
+    assert body["missing_names"] == ["Not A Plant"]
+
+
+def test_lookup_by_query_string(user):
+    neem = plant_records(user.application, MedicinalPlant.plant_name == "Neem")[0]
+
+    body = user.get(f"/api/plants/lookup?id={neem['id']}&name=Nothing").get_json()
+
+    assert [plant["id"] for plant in body["plants"]] == [neem["id"]]
+    assert body["missing_names"] == ["Nothing"]
+
+
+@pytest.mark.parametrize("payload", [
+    [1, 2],
+    {"ids": [1.5]},
+    {"ids": "12"},
+    {"names": [3]},
+])
+def test_lookup_rejects_malformed_bodies(user, payload):
+    response = user.post("/api/plants/lookup", json=payload)
+
+    assert response.status_code == 400
+    assert "error" in response.get_json()
+
+
+# ---------- EXPORTS ----------
+def test_plants_export_streams_every_row(user):
+    expected = plant_records(user.application)
+
+    response = user.get("/export/plants.csv")
+    assert response.mimetype == "text/csv"
+    assert response.headers["Content-Type"] == "text/csv; charset=utf-8"
+    assert 'filename="plants.csv"' in response.headers["Content-Disposition"]
+    assert read_csv(response) == as_csv(expected, PLANT_FIELDS)
+
+    response = user.get("/export/plants.ndjson")
+    assert response.mimetype == "application/x-ndjson"
+    assert read_ndjson(response) == expected
+
+
+def test_plants_export_filters_by_disease(user):
+    rows = read_ndjson(user.get("/export/plants.ndjson?disease=diabetes"))
+
+    assert rows
+    assert any(row["plant_name"] == "Neem" for row in rows)
+    assert len({row["id"] for row in rows}) == len(rows)
+
+
+def test_seasons_export_matches_the_facet_filter(user):
+    with user.application.app_context():
+        expected = list(facets.get().refresh().iter_rows({"season": ["Winter"]}))
+
+    assert expected
+    assert read_csv(user.get("/export/seasons.csv?season=Winter")) == as_csv(expected, SEASON_FIELDS)
+    assert read_ndjson(user.get("/export/seasons.ndjson?season=Winter")) == [
+        {**row, "seasons": list(row["seasons"])} for row in expected
+    ]
+
+
+def test_favorites_export_streams_the_users_favorites(user):
+    wanted = plant_records(user.application, MedicinalPlant.plant_name.in_(["Neem", "Tulsi"]))
+    user.post("/favorites/batch", json={"add": [plant["id"] for plant in wanted]})
+
+    assert read_ndjson(user.get("/export/favorites.ndjson")) == wanted
+    assert read_csv(user.get("/export/favorites.csv")) == as_csv(wanted, PLANT_FIELDS)
+
+
+def test_unknown_export_format_is_404(user):
+    assert user.get("/export/plants.xml").status_code == 404
@@ -0,0 +1,39 @@
+import json
+import subprocess
+import sys
+
+from conftest import ROOT
+from extensions import EXTENSIONS, facets, season_catalog, startup_report, suggestions
+
+
+def built(app):
+    return {extension.name for extension in EXTENSIONS if extension.peek(app) is not None}
+
+
+def test_create_app_builds_nothing(app):
+    assert built(app) == set()
+    assert "(lazy)" in startup_report(app)
+
+
+def test_extensions_are_built_on_first_use(client):
+    client.get("/suggest?q=ne")
+
+    assert built(client.application) == {"season_catalog", "suggestions"}
+    with client.application.app_context():
+        assert suggestions.get().season_catalog is season_catalog.get()
+        assert facets.peek(client.application) is None
+
+
+def test_create_app_imports_no_heavy_module(tmp_path):
+    # a fresh interpreter, since this one has imported everything already
+    script = (
+        "import json, sys\n"
+        "from app import create_app\n"
+        f"create_app({{'SQLALCHEMY_DATABASE_URI': 'sqlite:///{tmp_path / 'cold.db'}',"
+        " 'TEMPLATE_BYTECODE_CACHE_DIR': None})\n"
+        "print(json.dumps(sorted(m for m in ('pandas', 'numpy', 'pyttsx3', 'catalog', 'similarity',"
+        " 'chat_matcher', 'plant_db', 'speech') if m in sys.modules)))\n"
+    )
+    result = subprocess.run([sys.executable, "-c", script], cwd=ROOT, capture_output=True, text=True, check=True)
+
+    assert json.loads(result.stdout.splitlines()[-1]) == []
@@ -0,0 +1,97 @@
+import re
+
+import pytest
+
+from facets import FacetIndex
+
+
+def row(name, disease, *seasons):
+    return {"plant_name": name, "disease": disease, "seasons": list(seasons)}
+
+
+@pytest.fixture
+def index():
+    return FacetIndex([
+        row("Neem", "Diabetes", "Summer"),
+        row("Tulsi", "Cold", "Winter"),
+        row("Ginger", "Cough", "Winter"),
+        row("Jamun", "Diabetes", "Summer", "Monsoon"),
+        row("Mulethi", "Cough", "Winter", "Monsoon"),
+    ])
+
+
+def names(result):
+    return [r["plant_name"] for r in result["results"]]
+
+
+def test_values_of_one_facet_are_ored(index):
+    assert names(index.query({"disease": ["cold", "cough"]})) == ["Tulsi", "Ginger", "Mulethi"]
+
+
+def test_facets_are_anded(index):
+    assert names(index.query({"season": ["Winter"], "disease": ["Cough"]})) == ["Ginger", "Mulethi"]
+    assert names(index.query({"season": ["Monsoon", "Summer"], "disease": ["diabetes"]})) == ["Neem", "Jamun"]
+    assert names(index.query({"season": ["Summer"], "disease": ["Cold"]})) == []
+
+
+def test_empty_filters_match_everything(index):
+    assert index.query({"season": [""], "disease": []})["total"] == 5
+
+
+def test_counts_cover_the_whole_match(index):
+    result = index.query({"season": ["Winter"]}, limit=1)
+
+    assert result["total"] == 3
+    assert result["facets"]["disease"] == [("cough", "Cough", 2), ("cold", "Cold", 1)]
+    assert result["facets"]["season"] == [("winter", "Winter", 3), ("monsoon", "Monsoon", 1)]
+
+
+def test_after_pages_through_the_match(index):
+    first = index.query({"season": ["Winter", "Monsoon"]}, limit=2)
+    second = index.query({"season": ["Winter", "Monsoon"]}, limit=2, after=first["next_after"])
+
+    assert names(first) == ["Tulsi", "Ginger"]
+    assert first["next_after"] == 2
+    assert names(second) == ["Jamun", "Mulethi"]
+    assert second["next_after"] is None
+
+
+# ---------- ROUTES ----------
+def test_facets_route_pages_without_duplicates(client):
+    seen = []
+    after = None
+    while True:
+        query = "/facets?season=Winter&limit=5" + (f"&after={after}" if after is not None else "")
+        body = client.get(query).get_json()
+        seen.extend((r["plant_name"], r["disease"]) for r in body["results"])
+        after = body["next_after"]
+        if after is None:
+            break
+
+    assert len(seen) == body["total"] == len(set(seen))
+    assert body["facets"]["season"][0] == {"value": "Winter", "count": body["total"]}
+
+
+@pytest.mark.parametrize("after", ["-2", "100000"])
+def test_facets_route_rejects_out_of_range_after(client, after):
+    assert client.get(f"/facets?after={after}").status_code == 400
+
+
+def test_seasons_page_is_paged(client):
+    total = client.get("/facets?season=Winter").get_json()["total"]
+    seen = []
+    form = {"season": "Winter", "disease": ""}
+    while True:
+        html = client.post("/seasons?limit=10", data=form).get_data(as_text=True)
+        seen.extend(re.findall(r'<div class="plant-card">', html))
+        more = re.search(r'name="after" value="(\d+)"', html)
+        if not more:
+            break
+        form = {**form, "after": more.group(1)}
+
+    assert total > 10
+    assert len(seen) == total
+
+
+def test_seasons_page_rejects_out_of_range_after(client):
+    assert client.post("/seasons", data={"season": "Winter", "after": "100000"}).status_code == 400
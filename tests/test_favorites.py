@@ -0,0 +1,67 @@
+import pytest
+
+from favorites import add_favorites, clean_plant_ids, favorited_ids, remove_favorites
+from models import db, Favorite, User
+
+
+@pytest.fixture
+def user_id(seeded_app):
+    with seeded_app.app_context():
+        user = User(username="fan", password="x")
+        db.session.add(user)
+        db.session.commit()
+        user_id = user.id
+    with seeded_app.app_context():
+        yield user_id
+
+
+def saved(user_id):
+    return sorted(db.session.scalars(db.select(Favorite.plant_id).where(Favorite.user_id == user_id)))
+
+
+def test_add_is_idempotent(user_id):
+    assert add_favorites(user_id, [1, 2, "3"]) == 3
+    assert add_favorites(user_id, [2, 3, 3]) == 0
+    assert saved(user_id) == [1, 2, 3]
+
+
+def test_unknown_plant_ids_are_skipped(user_id):
+    assert add_favorites(user_id, [1, 999999]) == 1
+    assert saved(user_id) == [1]
+
+
+def test_remove_and_favorited_ids(user_id):
+    add_favorites(user_id, [1, 2, 3])
+
+    assert remove_favorites(user_id, [2, 999999]) == 1
+    assert favorited_ids(user_id, [1, 2, 3, 4]) == {1, 3}
+    assert favorited_ids(None, [1]) == set()
+    assert favorited_ids(user_id, []) == set()
+
+
+@pytest.mark.parametrize("value", ["12", [1.5], [True], [" 3 "], [None]])
+def test_malformed_ids_are_rejected(value):
+    with pytest.raises((TypeError, ValueError)):
+        clean_plant_ids(value)
+
+
+# ---------- ROUTES ----------
+def test_batch_route(user_client):
+    assert user_client.post("/favorites/batch", json={"add": [1, 2, 2, 999999]}).get_json() == {
+        "added": 2, "removed": 0,
+    }
+    assert user_client.post("/favorites/batch", json={"add": [1], "remove": ["2"]}).get_json() == {
+        "added": 0, "removed": 1,
+    }
+
+
+@pytest.mark.parametrize("payload", [{"add": "12"}, {"remove": 3}, [1, 2], {"add": [1.5]}])
+def test_batch_route_rejects_malformed_bodies(user_client, payload):
+    response = user_client.post("/favorites/batch", json=payload)
+
+    assert response.status_code == 400
+    assert "error" in response.get_json()
+
+
+def test_batch_route_requires_login(client):
+    assert client.post("/favorites/batch", json={"add": [1]}).status_code == 302
@@ -0,0 +1,55 @@
+import pytest
+from jinja2 import DictLoader, Environment
+
+from db_import import bump_data_version
+from fragments import FragmentCache
+from models import db
+
+
+@pytest.fixture
+def cache():
+    env = Environment(loader=DictLoader({"card.html": "<b>{{ name }}</b>"}), autoescape=True)
+    return FragmentCache(env, max_entries=3)
+
+
+def test_hits_reuse_the_rendered_markup(cache):
+    first = cache.render("card.html", 1, 7, name="Neem")
+    again = cache.render("card.html", 1, 7, name="ignored on a hit")
+
+    assert first == again == "<b>Neem</b>"
+    assert (cache.hits, cache.misses) == (1, 1)
+
+
+def test_a_new_data_version_misses(cache):
+    cache.render("card.html", 1, 7, name="Neem")
+    updated = cache.render("card.html", 1, 8, name="Neem <new>")
+
+    assert updated == "<b>Neem &lt;new&gt;</b>"
+    assert (cache.hits, cache.misses) == (0, 2)
+
+
+def test_least_recently_used_entries_fall_off(cache):
+    for version in (1, 2, 3):
+        cache.render("card.html", "neem", version, name=f"v{version}")
+    cache.render("card.html", "neem", 1, name="hit")       # 1 is now the newest
+    cache.render("card.html", "neem", 4, name="v4")        # evicts version 2
+
+    assert len(cache) == 3
+    assert cache.render("card.html", "neem", 1, name="x") == "<b>v1</b>"
+    assert cache.render("card.html", "neem", 2, name="re-rendered") == "<b>re-rendered</b>"
+    assert len(cache) == 3
+
+
+def test_plants_version_is_polled(seeded_app):
+    with seeded_app.app_context():
+        polled = FragmentCache(seeded_app.jinja_env, recheck_seconds=60)
+        eager = FragmentCache(seeded_app.jinja_env, recheck_seconds=0)
+        before = polled.plants_version()
+        assert eager.plants_version() == before
+
+        with db.engine.begin() as conn:
+            bump_data_version(conn)
+
+        # a cached read is not re-queried inside the recheck window
+        assert polled.plants_version() == before
+        assert eager.plants_version() == before + 1
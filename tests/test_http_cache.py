@@ -0,0 +1,38 @@
+def test_matching_etag_answers_304(client):
+    first = client.get("/")
+    etag = first.headers["ETag"]
+
+    cached = client.get("/", headers={"If-None-Match": etag})
+    assert cached.status_code == 304
+    assert cached.data == b""
+    assert cached.headers["ETag"] == etag
+
+    assert client.get("/", headers={"If-None-Match": '"other"'}).status_code == 200
+
+
+def test_etag_changes_with_the_logged_in_user(client):
+    anonymous = client.get("/seasons").headers["ETag"]
+    client.post("/register", data={"username": "etag", "password": "pw"})
+    client.post("/login", data={"username": "etag", "password": "pw"})
+
+    response = client.get("/seasons", headers={"If-None-Match": anonymous})
+    assert response.status_code == 200
+    assert response.headers["ETag"] != anonymous
+
+
+def test_if_modified_since_only_for_anonymous_clients(client):
+    last_modified = client.get("/about").headers["Last-Modified"]
+
+    assert client.get("/about", headers={"If-Modified-Since": last_modified}).status_code == 304
+
+    client.post("/register", data={"username": "ims", "password": "pw"})
+    client.post("/login", data={"username": "ims", "password": "pw"})
+    assert client.get("/about", headers={"If-Modified-Since": last_modified}).status_code == 200
+
+
+def test_post_is_never_conditional(client):
+    etag = client.get("/seasons").headers["ETag"]
+
+    response = client.post("/seasons", data={"season": "Winter"}, headers={"If-None-Match": etag})
+    assert response.status_code == 200
+    assert "ETag" not in response.headers
@@ -0,0 +1,35 @@
+import re
+
+
+def sample(text, name, **labels):
+    # value of the first sample of `name` whose labels include `labels`
+    for line in text.splitlines():
+        match = re.match(rf"{name}(\{{.*\}})? (\S+)$", line)
+        if match and all(f'{k}="{v}"' in (match.group(1) or "") for k, v in labels.items()):
+            return float(match.group(2))
+    return None
+
+
+def test_metrics_expose_request_sql_and_queue_series(client):
+    # request metrics are recorded when the response is closed, as a WSGI
+    # server does after sending the body
+    client.get("/facets?season=Winter").close()
+    client.post("/chat", data={"msg": "neem"}).close()
+
+    text = client.get("/metrics").get_data(as_text=True)
+
+    assert "# TYPE http_request_duration_seconds histogram" in text
+    assert sample(text, "http_request_duration_seconds_count", endpoint="main.facet_query", status="200") >= 1
+    assert sample(text, "http_request_sql_queries_count", endpoint="main.facet_query") >= 1
+    assert sample(text, "sql_query_duration_seconds_count", endpoint="main.facet_query") >= 1
+    for gauge in ("speech_queue_depth", "speech_worker_lag_seconds", "speech_dropped_replies",
+                  "speech_failed_renders", "password_hash_queue_depth"):
+        assert f"# TYPE {gauge} gauge" in text
+        assert sample(text, gauge) is not None
+
+
+def test_gauges_read_zero_before_their_service_is_built(seeded_app):
+    text = seeded_app.test_client().get("/metrics").get_data(as_text=True)
+
+    assert sample(text, "speech_queue_depth") == 0
+    assert sample(text, "password_hash_queue_depth") == 0
@@ -0,0 +1,71 @@
+import re
+
+import pytest
+
+from extensions import search_engine
+from models import db, MedicinalPlant
+from pagination import KeysetPage, page_size, parse_after
+
+
+def test_page_size_is_clamped():
+    assert page_size(None, 24, 100) == 24
+    assert page_size("abc", 24, 100) == 24
+    assert page_size("0", 24, 100) == 1
+    assert page_size("500", 24, 100) == 100
+    assert parse_after("12") == 12
+    assert parse_after("x") is None
+
+
+def test_keyset_page_sets_next_after_once_iterated(seeded_app):
+    with seeded_app.app_context():
+        ids = db.session.scalars(db.select(MedicinalPlant.id).order_by(MedicinalPlant.id)).all()
+        stmt = db.select(MedicinalPlant)
+
+        page = KeysetPage(db.session, stmt, MedicinalPlant.id, size=10)
+        assert page
+        assert page.next_after is None
+        assert [plant.id for plant in page] == ids[:10]
+        assert page.next_after == ids[9]
+
+        last = KeysetPage(db.session, stmt, MedicinalPlant.id, after=ids[-3], size=10)
+        assert [plant.id for plant in last] == ids[-2:]
+        assert last.next_after is None
+
+        assert not KeysetPage(db.session, stmt, MedicinalPlant.id, after=ids[-1])
+
+
+def follow(client, url, more_label):
+    # every card title across the pages linked by "More ..." buttons
+    names = []
+    while url:
+        html = client.get(url).get_data(as_text=True)
+        names.extend(re.findall(r"<h3>(.*?)</h3>", html))
+        more = re.search(rf'<a href="([^"]+)" class="details-btn">{more_label}</a>', html)
+        url = more.group(1).replace("&amp;", "&") if more else None
+    return names
+
+
+@pytest.fixture(params=[True, False], ids=["streamed", "buffered"])
+def paged_client(request, user_client):
+    user_client.application.config["STREAM_RESULTS"] = request.param
+    return user_client
+
+
+def test_favorites_pages(paged_client):
+    app = paged_client.application
+    with app.app_context():
+        plants = db.session.scalars(db.select(MedicinalPlant).order_by(MedicinalPlant.id).limit(30)).all()
+        expected = [plant.plant_name for plant in plants]
+    paged_client.post("/favorites/batch", json={"add": [plant.id for plant in plants]})
+
+    assert follow(paged_client, "/favorites?limit=7", "More remedies") == expected
+
+
+def test_search_pages(paged_client):
+    app = paged_client.application
+    with app.app_context():
+        plants, _ = search_engine.get().search("cough", 1000)
+        expected = [plant.plant_name for plant in plants]
+
+    assert len(expected) > 5
+    assert follow(paged_client, "/search?disease=cough&limit=5", "More results") == expected
@@ -0,0 +1,99 @@
+import os
+import threading
+
+import pytest
+from werkzeug.security import generate_password_hash
+
+from extensions import password_hasher
+from models import db, User
+from passwords import HasherBusy, PasswordHasher, full_method
+
+
+def test_admission_limit_rejects_past_max_pending():
+    hasher = PasswordHasher("pbkdf2:sha256:1000", workers=0, max_pending=1, retry_after=7)
+    release = threading.Event()
+    started = threading.Event()
+
+    def slow():
+        started.set()
+        release.wait(5)
+
+    worker = threading.Thread(target=hasher._run, args=(slow,))
+    worker.start()
+    try:
+        assert started.wait(5)
+        with pytest.raises(HasherBusy) as busy:
+            hasher.hash("secret")
+        assert busy.value.retry_after == 7
+        assert hasher.rejected == 1
+        assert hasher.pending() == 1
+    finally:
+        release.set()
+        worker.join()
+
+    assert hasher.pending() == 0
+    assert hasher.check(hasher.hash("secret"), "secret")
+
+
+def test_needs_rehash_compares_the_full_method():
+    hasher = PasswordHasher("scrypt", workers=0)
+
+    assert hasher.method == full_method("scrypt:32768:8:1") == "scrypt:32768:8:1"
+    assert not hasher.needs_rehash(generate_password_hash("pw", "scrypt"))
+    assert not hasher.needs_rehash(generate_password_hash("pw", "scrypt:32768:8:1"))
+    assert hasher.needs_rehash(generate_password_hash("pw", "scrypt:16384:8:1"))
+    assert hasher.needs_rehash(generate_password_hash("pw", "pbkdf2:sha256"))
+    with pytest.raises(ValueError):
+        PasswordHasher("md5", workers=0)
+
+
+def test_broken_pool_is_replaced():
+    hasher = PasswordHasher("pbkdf2:sha256:1000", workers=1, timeout=30)
+    try:
+        with pytest.raises(HasherBusy):
+            hasher._run(os._exit, 1)  # kills the worker process
+        assert hasher.pending() == 0
+        assert hasher.check(hasher.hash("secret"), "secret")
+    finally:
+        hasher.shutdown()
+
+
+# ---------- ROUTES ----------
+def test_saturated_hasher_answers_503_with_retry_after(client):
+    client.application.config["PASSWORD_HASH_MAX_PENDING"] = 0
+
+    response = client.post("/register", data={"username": "late", "password": "pw"})
+
+    assert response.status_code == 503
+    assert response.headers["Retry-After"] == "2"
+    assert "password_hash_rejected_total{operation=\"register\"}" in client.get("/metrics").get_data(as_text=True)
+
+
+def test_login_rehashes_an_outdated_hash(client):
+    app = client.application
+    with app.app_context():
+        db.session.add(User(username="old", password=generate_password_hash("pw", "pbkdf2:sha256:500")))
+        db.session.commit()
+
+    response = client.post("/login", data={"username": "old", "password": "pw"})
+
+    with app.app_context():
+        stored = db.session.scalar(db.select(User.password).filter_by(username="old"))
+        hasher = password_hasher.get()
+    assert response.status_code == 302
+    assert stored.startswith(hasher.method + "$")
+    assert not hasher.needs_rehash(stored)
+    assert hasher.check(stored, "pw")
+
+
+def test_wrong_password_keeps_the_stored_hash(client):
+    app = client.application
+    old_hash = generate_password_hash("pw", "pbkdf2:sha256:500")
+    with app.app_context():
+        db.session.add(User(username="old", password=old_hash))
+        db.session.commit()
+
+    assert client.post("/login", data={"username": "old", "password": "wrong"}).status_code == 200
+
+    with app.app_context():
+        assert db.session.scalar(db.select(User.password).filter_by(username="old")) == old_hash
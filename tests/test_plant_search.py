@@ -0,0 +1,79 @@
+import pytest
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.orm import Query
+
+from models import db, MedicinalPlant
+from plant_search import MemorySearchEngine, PostgresSearchEngine, decode_cursor
+
+
+def add_plants(app, rows):
+    with app.app_context():
+        db.session.add_all(MedicinalPlant(**row) for row in rows)
+        db.session.commit()
+
+
+@pytest.fixture
+def fever_app(app):
+    # "Feverfew" matches "fever" as a whole phrase; "Fevor Grass" only
+    # through its trigrams (a typo)
+    add_plants(app, [
+        {"plant_name": "Fevor Grass", "local_name": "", "disease": "Cough", "how_to_use": ""},
+        {"plant_name": "Feverfew", "local_name": "", "disease": "Migraine", "how_to_use": ""},
+        {"plant_name": "Neem", "local_name": "", "disease": "Skin", "how_to_use": ""},
+    ] + [
+        {"plant_name": f"Herb {i}", "local_name": "", "disease": f"Fever {i}", "how_to_use": ""}
+        for i in range(25)
+    ])
+    return app
+
+
+def test_whole_phrase_hit_ranks_above_typo_hit(fever_app):
+    with fever_app.app_context():
+        plants, _ = MemorySearchEngine().search("fever", 100)
+    names = [plant.plant_name for plant in plants]
+
+    assert "Neem" not in names
+    assert names.index("Feverfew") < names.index("Fevor Grass")
+    # disease hits carry the highest field weight
+    assert names[0].startswith("Herb ")
+
+
+def test_limit_caps_the_page(fever_app):
+    with fever_app.app_context():
+        plants, after = MemorySearchEngine().search("fever", 5)
+
+    assert len(plants) == 5
+    assert decode_cursor(after) is not None
+
+
+def test_cursor_pages_cover_every_hit_once(fever_app):
+    engine = MemorySearchEngine()
+    with fever_app.app_context():
+        everything = [plant.id for plant in engine.search("fever", 100)[0]]
+        paged, after = [], None
+        while True:
+            plants, after = engine.search("fever", 4, after=after)
+            paged.extend(plant.id for plant in plants)
+            if not after:
+                break
+
+    assert len(everything) == 27
+    assert paged == everything
+
+
+def test_postgres_search_compiles_for_postgresql(app, monkeypatch):
+    captured = []
+    monkeypatch.setattr(Query, "all", lambda self: captured.append(self) or [])
+
+    with app.app_context():
+        plants, after = PostgresSearchEngine().search("Fever", 10, after="2.5:7")
+    sql = str(captured[0].statement.compile(dialect=postgresql.dialect()))
+
+    assert (plants, after) == ([], None)
+    assert "word_similarity" in sql
+    assert "ILIKE" in sql
+    assert "<%" in sql
+    assert "greatest" in sql
+    # the "score:id" cursor becomes a keyset predicate on (rank, id)
+    assert "medicinal_plant.id > " in sql
+    assert "DESC, medicinal_plant.id \n LIMIT" in sql
@@ -0,0 +1,58 @@
+import pytest
+
+from similarity import SimilarityIndex
+
+PAIRS = [
+    ("Neem", "Diabetes/Skin"),
+    ("Jamun", "Diabetes"),
+    ("Karela", "sugar"),
+    ("Tulsi", "Cold, Cough"),
+    ("Ginger", "Cough"),
+    ("Ginger", "Cold & Nausea"),
+    ("Mulethi", "Cough"),
+    ("Aloe", ""),
+]
+
+
+@pytest.fixture
+def index():
+    return SimilarityIndex(PAIRS, k=3, plant_ids={"neem": 1, "tulsi": 4})
+
+
+def related(index, name, **kwargs):
+    return [(plant["plant_name"], round(plant["score"], 3)) for plant in index.related(name, **kwargs)]
+
+
+def test_jaccard_neighbours_best_first(index):
+    assert related(index, "tulsi") == [("Ginger", 0.667), ("Mulethi", 0.5)]
+    assert related(index, "Ginger") == [("Tulsi", 0.667), ("Mulethi", 0.333)]
+    # aliases fold onto their disease: "sugar" is diabetes
+    assert related(index, "Karela") == [("Jamun", 1.0), ("Neem", 0.5)]
+
+
+def test_related_reports_shared_diseases_and_ids(index):
+    first = index.related("Ginger", limit=1)[0]
+
+    assert first["plant_name"] == "Tulsi"
+    assert first["id"] == 4
+    assert first["shared"] == ["cold", "cough"]
+    assert index.related("Jamun")[1]["id"] == 1
+
+
+def test_cosine_metric():
+    index = SimilarityIndex(PAIRS, k=3, metric="cosine")
+
+    assert related(index, "Tulsi") == [("Ginger", 0.816), ("Mulethi", 0.707)]
+
+
+def test_plants_without_a_shared_disease(index):
+    assert index.related("Aloe") == []
+    assert index.related("Unknown") == []
+
+
+def test_common_diseases(index):
+    assert index.common_diseases("Tulsi", "Ginger") == ["cold", "cough"]
+    assert index.common_diseases("Tulsi", "Ginger", "Mulethi") == ["cough"]
+    assert index.common_diseases("Neem", "Tulsi") == []
+    assert index.common_diseases("Neem", "Unknown") == []
+    assert index.common_diseases() == []
@@ -0,0 +1,75 @@
+import os
+import shutil
+
+import pytest
+
+import snapshot
+from catalog import SeasonCatalog
+from chat_matcher import ChatAnswers
+
+
+@pytest.fixture
+def season_csv(tmp_path):
+    return shutil.copy(snapshot.SEASON_CSV, tmp_path / "medicinalseason.csv")
+
+
+@pytest.fixture
+def snap(tmp_path, season_csv):
+    return snapshot.build(str(tmp_path / "catalog.snap"), str(season_csv))
+
+
+def as_plain(records):
+    return [dict(record) for record in records]
+
+
+def test_snapshot_catalog_matches_the_csv_catalog(season_csv, snap):
+    compiled = SeasonCatalog(str(season_csv), snap).refresh()
+    parsed = SeasonCatalog(str(season_csv)).refresh()
+
+    assert isinstance(compiled.records, snapshot.Table)
+    assert as_plain(compiled.records) == as_plain(parsed.records)
+    assert compiled.seasons == parsed.seasons
+    assert list(compiled.plant_names) == parsed.plant_names
+    for season in parsed.seasons:
+        assert as_plain(compiled.plants_for_season(season)) == as_plain(parsed.plants_for_season(season))
+    for name in parsed.plant_names:
+        assert dict(compiled.lookup(name)) == dict(parsed.lookup(name))
+    assert compiled.lookup("no such plant") is None
+
+
+def test_snapshot_records_a_digest_per_source(season_csv, snap):
+    sources = snapshot.Snapshot(snap).sources
+
+    assert sources == {
+        "medicinalseason.csv": snapshot.file_digest(season_csv),
+        "plant_db.py": snapshot.file_digest(snapshot.PLANT_DB_SOURCE),
+        "chat_matcher.py": snapshot.file_digest(snapshot.CHAT_MATCHER_SOURCE),
+    }
+
+
+def test_snapshot_chat_cards_match_the_rendered_ones(tmp_path, snap):
+    compiled = ChatAnswers(snap)
+    rendered = ChatAnswers(str(tmp_path / "missing.snap"))
+
+    assert dict(compiled.cards) == rendered.cards
+    assert dict(compiled.speech) == rendered.speech
+
+
+def test_stale_source_digest_is_rejected(season_csv, snap):
+    with open(season_csv, "a", encoding="utf-8") as f:
+        f.write("\r\nTest Herb,Test Disease,Test use,Herba probata,Monsoon")
+
+    assert snapshot.open_snapshot(snap, str(season_csv)) is None
+    # the catalog falls back to parsing the edited CSV
+    catalog = SeasonCatalog(str(season_csv), snap).refresh()
+    assert isinstance(catalog.records, list)
+    assert catalog.lookup("Test Herb")["disease"] == "Test Disease"
+
+
+def test_unreadable_snapshot_is_ignored(tmp_path, season_csv):
+    bad = tmp_path / "bad.snap"
+    bad.write_bytes(b"not a snapshot")
+
+    assert snapshot.open_snapshot(str(bad), str(season_csv)) is None
+    assert snapshot.open_snapshot(str(tmp_path / "missing.snap"), str(season_csv)) is None
+    assert os.path.exists(season_csv)
@@ -0,0 +1,108 @@
+import os
+import threading
+
+import pytest
+
+from app import create_app
+from extensions import speech_service
+from speech import NullSpeechEngine, SpeechService
+
+
+class GatedEngine(NullSpeechEngine):
+    # holds the worker inside render() until the test opens the gate
+
+    def __init__(self):
+        self.gate = threading.Event()
+        self.started = threading.Event()
+
+    def render(self, text, path):
+        self.started.set()
+        self.gate.wait(5)
+        super().render(text, path)
+
+
+def clip_size(tmp_path):
+    path = str(tmp_path / "probe.wav")
+    NullSpeechEngine().render("", path)
+    return os.path.getsize(path)
+
+
+@pytest.fixture
+def gated(tmp_path):
+    service = SpeechService(str(tmp_path / "clips"), engine="null", queue_size=2)
+    service.engine = GatedEngine()
+    # the first reply occupies the worker, so later ones stay queued
+    busy = service.request("busy")
+    assert service.engine.started.wait(5)
+    yield service, busy
+    service.engine.gate.set()
+
+
+def test_full_queue_drops_the_oldest_request(gated):
+    service, _ = gated
+    first = service.request("first")
+    second = service.request("second")
+    third = service.request("third")
+
+    assert service.queue_depth() == 2
+    assert service.dropped == 1
+    assert service.status(first) == "missing"
+    assert service.status(second) == service.status(third) == "pending"
+
+
+def test_duplicate_requests_coalesce(gated):
+    service, busy = gated
+    key = service.request("same reply")
+
+    assert service.request("same reply") == key
+    assert service.request("busy") == busy
+    assert service.queue_depth() == 1
+    assert service.dropped == 0
+
+
+def test_status_and_wait_with_null_engine(tmp_path):
+    service = SpeechService(str(tmp_path / "clips"), engine="null")
+    key = service.request("Neem is used for skin problems")
+
+    assert service.status(key) in ("pending", "ready")
+    assert service.wait(key, 5) == "ready"
+    assert service.status(key) == "ready"
+    assert os.path.exists(service.path_for(key))
+    assert service.status(service.key_for("never requested")) == "missing"
+    assert service.wait(service.key_for("never requested"), 0) == "missing"
+
+
+def test_cache_evicts_least_recently_used_clips_by_bytes(tmp_path):
+    service = SpeechService(str(tmp_path / "clips"), engine="null", max_bytes=2 * clip_size(tmp_path))
+    a = service.request("a")
+    service.wait(a, 5)
+    b = service.request("b")
+    service.wait(b, 5)
+
+    assert service.status(a) == "ready"  # a is now the most recently used
+    c = service.request("c")
+    service.wait(c, 5)
+
+    assert service.status(b) == "missing"
+    assert not os.path.exists(service.path_for(b))
+    assert service.status(a) == service.status(c) == "ready"
+
+
+def test_relative_cache_dir_resolves_against_the_app_root(app):
+    relative = create_app({**app.config, "SPEECH_CACHE_DIR": "speech_cache"})
+    with relative.app_context():
+        cache_dir = speech_service.get(relative).cache_dir
+
+    assert cache_dir == os.path.join(relative.root_path, "speech_cache")
+
+
+def test_chat_reply_clip_is_served(client):
+    response = client.post("/chat", data={"msg": "tell me about neem"})
+    url = response.headers["X-Speech-Url"]
+    key = url.rsplit("/", 1)[1][:-len(".wav")]
+    with client.application.app_context():
+        assert speech_service.get().wait(key, 5) == "ready"
+
+    clip = client.get(url)
+    assert clip.status_code == 200
+    assert clip.mimetype == "audio/wav"
@@ -0,0 +1,63 @@
+import pytest
+
+from suggest import SuggestIndex, add_term
+
+
+@pytest.fixture
+def index():
+    terms = {}
+    add_term(terms, "plant", "Bitter Gourd", 3)
+    add_term(terms, "plant", "Gotu Kola", 1)
+    add_term(terms, "plant", "Momordica charantia", 0.5, value="Bitter Gourd")
+    add_term(terms, "disease", "Gout", 2)
+    add_term(terms, "disease", "Diabetes", 4)
+    add_term(terms, "disease", "sugar problem", 0.5, value="diabetes")
+    for i in range(12):
+        add_term(terms, "plant", f"Gourd {i}", 0.1)
+    return SuggestIndex(terms, limit=10)
+
+
+def texts(found):
+    return [term["text"] for term in found]
+
+
+def test_inner_word_matches_follow_whole_term_matches():
+    terms = {}
+    add_term(terms, "plant", "Bitter Gourd", 3)
+    add_term(terms, "disease", "Gout", 1)
+    add_term(terms, "plant", "Neem", 5)
+    index = SuggestIndex(terms)
+
+    # "Gout" starts with the prefix; the heavier "Bitter Gourd" only at its
+    # second word, so it comes after every whole-term match
+    assert texts(index.suggest("gou")) == ["Gout", "Bitter Gourd"]
+    assert texts(index.suggest("gourd")) == ["Bitter Gourd"]
+
+
+def test_kind_filter(index):
+    assert texts(index.suggest("gou", kind="disease")) == ["Gout"]
+    assert "Gout" not in texts(index.suggest("gou", kind="plant"))
+    assert texts(index.suggest("go", kind="disease")) == ["Gout"]
+
+
+def test_local_names_and_aliases_return_the_canonical_value(index):
+    local = index.suggest("momordica")[0]
+    alias = index.suggest("sugar")[0]
+
+    assert (local["text"], local["kind"], local["value"]) == ("Momordica charantia", "plant", "Bitter Gourd")
+    assert (alias["text"], alias["kind"], alias["value"]) == ("sugar problem", "disease", "diabetes")
+
+
+@pytest.mark.parametrize("limit, expected", [(None, 10), (3, 3), (50, 10), (0, 1), (-1, 1)])
+def test_limit_is_clamped(index, limit, expected):
+    assert len(index.suggest("gourd", limit=limit)) == expected
+    assert len(index.suggest("g", limit=limit)) == expected
+
+
+def test_suggest_route(client):
+    body = client.get("/suggest?q=gou&limit=-1").get_json()
+    assert len(body["suggestions"]) == 1
+
+    body = client.get("/suggest?q=gourd&kind=plant").get_json()
+    assert "Bitter Gourd" in texts(body["suggestions"])
+    assert client.get("/suggest?q=gou&kind=tree").status_code == 400